@@ -34,6 +34,157 @@ def fast_pow(a, n):
         return a * fast_pow(a, n - 1)
 
 
+def power(x, n, mul, identity):
+    """
+    Итеративное быстрое возведение в степень над произвольным моноидом
+    mul - ассоциативная операция, identity - ее нейтральный элемент
+    Сложность: O(log n) умножений
+    Глубина рекурсии: 0 (без рекурсии)
+    """
+    if n < 0:
+        raise ValueError("Степень должна быть неотрицательной")
+    result = identity
+    while n:
+        if n & 1:  # Текущий бит степени равен 1
+            result = mul(result, x)
+        n >>= 1
+        if n:  # Последнее возведение в квадрат не нужно
+            x = mul(x, x)
+    return result
+
+
+def power_batch(bases, n, mul, identity):
+    """
+    Возведение многих оснований в одну и ту же степень n
+    Биты степени разбираются один раз, операции применяются ко всем основаниям
+    Сложность: O(k log n) умножений для k оснований
+    """
+    if n < 0:
+        raise ValueError("Степень должна быть неотрицательной")
+    bases = list(bases)
+    results = [identity] * len(bases)
+    while n:
+        if n & 1:
+            results = [mul(r, b) for r, b in zip(results, bases)]
+        n >>= 1
+        if n:
+            bases = [mul(b, b) for b in bases]
+    return results
+
+
+def mod_pow(a, n, mod):
+    """
+    Возведение в степень по модулю (встроенный pow с тремя аргументами)
+    Сложность: O(log n)
+    """
+    return pow(a, n, mod)
+
+
+def mod_pow_batch(bases, n, mod):
+    """Возведение многих оснований в степень n по модулю mod"""
+    return [pow(a, n, mod) for a in bases]
+
+
+def mat_identity(k):
+    """Единичная матрица k x k"""
+    return [[1 if i == j else 0 for j in range(k)] for i in range(k)]
+
+
+def mat_mul(a, b, mod=None):
+    """
+    Умножение целочисленных матриц (список строк)
+    Сложность: O(k^3) для матриц k x k
+    """
+    columns = list(zip(*b))
+    if mod is None:
+        return [[sum(x * y for x, y in zip(row, col)) for col in columns]
+                for row in a]
+    return [[sum(x * y for x, y in zip(row, col)) % mod for col in columns]
+            for row in a]
+
+
+def mat_mul_2x2(a, b, mod=None):
+    """Умножение матриц 2 x 2, развернутое вручную"""
+    (a00, a01), (a10, a11) = a
+    (b00, b01), (b10, b11) = b
+    c = [[a00 * b00 + a01 * b10, a00 * b01 + a01 * b11],
+         [a10 * b00 + a11 * b10, a10 * b01 + a11 * b11]]
+    if mod is not None:
+        c = [[c[0][0] % mod, c[0][1] % mod], [c[1][0] % mod, c[1][1] % mod]]
+    return c
+
+
+def mat_pow(m, n, mod=None):
+    """
+    Возведение квадратной матрицы в степень n (например, для линейных рекуррент)
+    Сложность: O(k^3 log n)
+    """
+    k = len(m)
+    if k == 2:
+        mul = lambda a, b: mat_mul_2x2(a, b, mod)
+    else:
+        mul = lambda a, b: mat_mul(a, b, mod)
+    return power(m, n, mul, mat_identity(k))
+
+
+def fibonacci_matrix(n, mod=None):
+    """
+    n-е число Фибоначчи через степень матрицы [[1, 1], [1, 0]]
+    Сложность: O(log n)
+    """
+    return mat_pow([[1, 1], [1, 0]], n, mod)[0][1]
+
+
+def benchmark_pow():
+    """Сравнение рекурсивного fast_pow, итеративного power и встроенного pow"""
+    import operator
+    import time
+    
+    print("\nСРАВНЕНИЕ ВОЗВЕДЕНИЯ В СТЕПЕНЬ")
+    print("=" * 50)
+    
+    def measure(func, repeats):
+        start = time.perf_counter()
+        for _ in range(repeats):
+            func()
+        return (time.perf_counter() - start) / repeats
+    
+    repeats = 2000
+    for n in [10, 100, 1000, 10000]:
+        t_rec = measure(lambda: fast_pow(3, n), repeats)
+        t_iter = measure(lambda: power(3, n, operator.mul, 1), repeats)
+        t_builtin = measure(lambda: pow(3, n), repeats)
+        print(f"3^{n}: fast_pow={t_rec * 1e6:.2f} мкс, "
+              f"power={t_iter * 1e6:.2f} мкс, pow={t_builtin * 1e6:.2f} мкс")
+    
+    mod = 10 ** 9 + 7
+    n = 10 ** 18
+    mod_mul = lambda a, b: a * b % mod
+    t_iter = measure(lambda: power(3, n, mod_mul, 1), repeats)
+    t_builtin = measure(lambda: mod_pow(3, n, mod), repeats)
+    print(f"\n3^{n} mod {mod}: power={t_iter * 1e6:.2f} мкс, "
+          f"pow={t_builtin * 1e6:.2f} мкс")
+    
+    bases = list(range(2, 1002))
+    start = time.perf_counter()
+    single = [power(b, n, mod_mul, 1) for b in bases]
+    t_single = time.perf_counter() - start
+    start = time.perf_counter()
+    batch = power_batch(bases, n, mod_mul, 1)
+    t_batch = time.perf_counter() - start
+    start = time.perf_counter()
+    builtin = mod_pow_batch(bases, n, mod)
+    t_builtin = time.perf_counter() - start
+    assert single == batch == builtin
+    print(f"1000 оснований: по одному={t_single:.4f} сек, "
+          f"power_batch={t_batch:.4f} сек, pow={t_builtin:.4f} сек")
+    
+    start = time.perf_counter()
+    fib = fibonacci_matrix(10 ** 5)
+    t_fib = time.perf_counter() - start
+    print(f"\nF(100000) через матрицы: {fib.bit_length()} бит, {t_fib:.4f} сек")
+
+
 def demo_functions():
     """Демонстрация работы рекурсивных функций"""
     print("РЕКУРСИВНЫЕ ФУНКЦИИ")
@@ -42,6 +193,8 @@ def demo_functions():
     print(f"Факториал 5: {factorial(5)}")  # 120
     print(f"Число Фибоначчи F(6): {fibonacci(6)}")  # 8
     print(f"2^10 = {fast_pow(2, 10)}")  # 1024
+    print(f"2^10 (итеративно) = {power(2, 10, lambda a, b: a * b, 1)}")  # 1024
+    print(f"F(50) через матрицы: {fibonacci_matrix(50)}")  # 12586269025
     
     print("\nПроверка факториала:")
     for i in range(1, 6):
@@ -49,4 +202,5 @@ def demo_functions():
 
 
 if __name__ == "__main__":
-    demo_functions()
\ No newline at end of file
+    demo_functions()
+    benchmark_pow()
\ No newline at end of file
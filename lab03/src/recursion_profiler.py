@@ -0,0 +1,351 @@
+"""
+Профилировщик дерева рекурсивных вызовов.
+
+Два режима:
+  - RecursionProfiler - точный: оборачивает функцию и считает вызовы,
+    максимальную глубину, попадания в кеш, повторные подзадачи и
+    собственное время каждого вызова. Каждый вызов проходит через обертку
+    на Python, так что абсолютные времена завышены (во сколько раз -
+    показывает compare_overhead)
+  - SamplingProfiler - выборочный: отдельный поток периодически снимает
+    стек основного потока, сама функция при этом не замедляется.
+    Для замеров времени используйте его
+
+Результаты выгружаются в формате collapsed stack (вход для flamegraph.pl,
+speedscope, inferno) и в JSON.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+
+class FunctionStats:
+    """Статистика вызовов одной функции"""
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0  # Общее число вызовов
+        self.max_depth = 0  # Максимальная глубина рекурсии
+        self.cache_hits = 0  # Вызовы, результат которых уже был в кеше
+        self.repeated = 0  # Вызовы с уже встречавшимися аргументами
+        self.self_time = 0.0  # Время без учета вложенных вызовов
+        self.total_time = 0.0  # Время внешних (не рекурсивных) вызовов
+        self.seen_args = set()
+
+    def to_dict(self):
+        return {
+            "calls": self.calls,
+            "max_depth": self.max_depth,
+            "cache_hits": self.cache_hits,
+            "repeated_subproblems": self.repeated,
+            "unique_subproblems": len(self.seen_args),
+            "self_time": self.self_time,
+            "total_time": self.total_time,
+            "avg_self_time": self.self_time / self.calls if self.calls else 0.0,
+        }
+
+
+class RecursionProfiler:
+    """
+    Точный профилировщик рекурсии на основе декоратора
+
+    Вызовы складываются в дерево: узел - [собственное время, дети по имени].
+    На каждом вызове обертка только находит или создает дочерний узел,
+    пути стека "f;f;f" строятся один раз при выгрузке. Время между
+    соседними событиями (вход или выход) целиком относится к узлу
+    на вершине стека - одно чтение часов на событие.
+
+    Пример:
+        profiler = RecursionProfiler()
+        with profiler.profile(recursion, "fibonacci"):
+            recursion.fibonacci(20)
+        print(profiler.summary())
+    """
+
+    def __init__(self):
+        self.stats = {}  # Имя функции -> FunctionStats
+        self._root = [0.0, {}]  # Корень дерева вызовов
+        self._frames = []  # Стек узлов активных вызовов
+        self._last = [0.0]  # Момент последнего входа или выхода
+
+    def wrap(self, func, name=None, cache_check=None, track_args=False):
+        """
+        Обертка функции, собирающая статистику
+
+        cache_check(*args) -> bool вызывается до функции и сообщает,
+        есть ли результат уже в кеше (для мемоизированных версий).
+        track_args=True включает учет повторных подзадач: аргументы
+        каждого вызова хешируются и хранятся до конца профилирования.
+        """
+        name = name or func.__name__
+        stats = self.stats.setdefault(name, FunctionStats(name))
+        frames = self._frames
+        root = self._root
+        last = self._last
+        clock = time.perf_counter
+        seen = stats.seen_args
+        level = 0  # Текущая глубина рекурсии этой функции
+
+        def wrapper(*args, **kwargs):
+            nonlocal level
+            stats.calls += 1
+            if track_args:
+                if args in seen:
+                    stats.repeated += 1
+                else:
+                    seen.add(args)
+            if cache_check is not None and cache_check(*args):
+                stats.cache_hits += 1
+
+            level += 1
+            if level > stats.max_depth:
+                stats.max_depth = level
+
+            parent = frames[-1] if frames else root
+            node = parent[1].get(name)
+            if node is None:
+                node = parent[1][name] = [0.0, {}]
+            start = clock()
+            if frames:
+                parent[0] += start - last[0]
+            last[0] = start
+            frames.append(node)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                now = clock()
+                node[0] += now - last[0]
+                last[0] = now
+                frames.pop()
+                if level == 1:
+                    stats.total_time += now - start
+                level -= 1
+
+        wrapper.__wrapped__ = func
+        wrapper.__name__ = func.__name__
+        wrapper.__doc__ = func.__doc__
+        return wrapper
+
+    @contextmanager
+    def profile(self, module, attr, **options):
+        """
+        Временная подмена module.attr оберткой.
+        Рекурсивные вызовы ищут функцию в глобальных переменных модуля,
+        поэтому подмена атрибута модуля охватывает все уровни рекурсии.
+        """
+        original = getattr(module, attr)
+        setattr(module, attr, self.wrap(original, attr, **options))
+        try:
+            yield self
+        finally:
+            setattr(module, attr, original)
+
+    def _walk(self):
+        """Обход дерева вызовов: (путь стека, имя функции, собственное время)"""
+        stack = [(name, name, node) for name, node in self._root[1].items()]
+        while stack:
+            path, name, (own, children) = stack.pop()
+            yield path, name, own
+            for child_name, child in children.items():
+                stack.append((path + ";" + child_name, child_name, child))
+
+    def summary(self):
+        """Сводка по всем профилированным функциям"""
+        self_time = defaultdict(float)
+        for _, name, own in self._walk():
+            self_time[name] += own
+        for name, stats in self.stats.items():
+            stats.self_time = self_time[name]
+        return {name: stats.to_dict() for name, stats in self.stats.items()}
+
+    @property
+    def collapsed(self):
+        """Путь стека "f;f;f" -> собственное время"""
+        return {path: own for path, _, own in self._walk()}
+
+    def to_collapsed(self, unit=1e-6):
+        """
+        Строки формата collapsed stack: "f;f;f <значение>"
+        Значение - собственное время в единицах unit (по умолчанию мкс)
+        """
+        lines = []
+        for path, seconds in self.collapsed.items():
+            lines.append(f"{path} {max(1, round(seconds / unit))}")
+        return lines
+
+    def write_collapsed(self, path):
+        """Сохранение в формате для flamegraph.pl"""
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(self.to_collapsed()) + "\n")
+
+    def write_json(self, path):
+        """Сохранение сводки в JSON"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, ensure_ascii=False, indent=2)
+
+
+class SamplingProfiler:
+    """
+    Выборочный профилировщик: поток-наблюдатель каждые interval секунд
+    снимает стек основного потока через sys._current_frames().
+    Накладные расходы не зависят от числа вызовов, поэтому подходит
+    для глубокой и очень частой рекурсии.
+    """
+
+    def __init__(self, interval=0.001):
+        self.interval = interval
+        self.samples = defaultdict(int)  # Путь стека -> число выборок
+        self.sample_count = 0
+        self.max_depth = 0  # Максимальная наблюдаемая глубина
+
+    def run(self, func, *args, **kwargs):
+        """Выполнение func(*args) под наблюдением, возвращает ее результат"""
+        target_thread = threading.get_ident()
+        root = sys._getframe()
+        stop = threading.Event()
+
+        def sampler():
+            while not stop.wait(self.interval):
+                frame = sys._current_frames().get(target_thread)
+                names = []
+                while frame is not None and frame is not root:
+                    names.append(frame.f_code.co_name)
+                    frame = frame.f_back
+                if frame is None or not names:
+                    continue  # Стек не дошел до run - выборка вне func
+                names.reverse()
+                self.samples[";".join(names)] += 1
+                self.sample_count += 1
+                if len(names) > self.max_depth:
+                    self.max_depth = len(names)
+
+        # Без уменьшения интервала переключения GIL (по умолчанию 5 мс)
+        # поток-наблюдатель получал бы управление реже, чем нужно
+        old_switch = sys.getswitchinterval()
+        sys.setswitchinterval(min(old_switch, self.interval / 2))
+        thread = threading.Thread(target=sampler, daemon=True)
+        thread.start()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stop.set()
+            thread.join()
+            sys.setswitchinterval(old_switch)
+
+    def summary(self):
+        """Оценка времени по функциям: число выборок на вершине стека"""
+        own = defaultdict(int)
+        for path, count in self.samples.items():
+            own[path.rsplit(";", 1)[-1]] += count
+        return {
+            "interval": self.interval,
+            "samples": self.sample_count,
+            "max_depth": self.max_depth,
+            "self_samples": dict(own),
+            "estimated_self_time": {name: count * self.interval
+                                    for name, count in own.items()},
+        }
+
+    def to_collapsed(self):
+        """Строки формата collapsed stack, значение - число выборок"""
+        return [f"{path} {count}" for path, count in self.samples.items()]
+
+    def write_collapsed(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(self.to_collapsed()) + "\n")
+
+    def write_json(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, ensure_ascii=False, indent=2)
+
+
+PROFILE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           "profiles")
+
+
+def profile_recursive_functions(output_dir=PROFILE_DIR):
+    """
+    Профилирование рекурсивных функций лабораторной работы
+
+    Результаты сохраняются в output_dir (по умолчанию profiles/ рядом
+    с модулем), а не в текущий каталог.
+    """
+    import memoization
+    import recursion
+    import recursion_tasks
+
+    print("ПРОФИЛИРОВАНИЕ РЕКУРСИИ")
+    print("=" * 60)
+
+    profiler = RecursionProfiler()
+
+    with profiler.profile(recursion, "fibonacci", track_args=True):
+        recursion.fibonacci(20)
+
+    memoization.fib_cache = {}
+    with profiler.profile(memoization, "fibonacci_memo", track_args=True,
+                          cache_check=lambda n: n in memoization.fib_cache):
+        memoization.fibonacci_memo(300)
+
+    with profiler.profile(recursion, "factorial"):
+        recursion.factorial(300)
+
+    with profiler.profile(recursion, "fast_pow"):
+        recursion.fast_pow(3, 1000)
+
+    with profiler.profile(recursion_tasks, "hanoi_towers"):
+        recursion_tasks.hanoi_towers(12, verbose=False)
+
+    print(f"{'Функция':<16}{'Вызовы':>10}{'Глубина':>9}{'Кеш':>7}"
+          f"{'Повторы':>10}{'Собств. время':>16}")
+    for name, row in profiler.summary().items():
+        print(f"{name:<16}{row['calls']:>10}{row['max_depth']:>9}"
+              f"{row['cache_hits']:>7}{row['repeated_subproblems']:>10}"
+              f"{row['self_time']:>14.6f} с")
+
+    os.makedirs(output_dir, exist_ok=True)
+    collapsed_path = os.path.join(output_dir, "recursion_profile.collapsed")
+    json_path = os.path.join(output_dir, "recursion_profile.json")
+    profiler.write_collapsed(collapsed_path)
+    profiler.write_json(json_path)
+    print(f"\nСохранено: {collapsed_path}, {json_path}")
+
+
+def compare_overhead(n=28):
+    """Накладные расходы точного и выборочного режимов на fibonacci(n)"""
+    import recursion
+
+    print(f"\nНАКЛАДНЫЕ РАСХОДЫ ПРОФИЛИРОВАНИЯ (fibonacci({n}))")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    recursion.fibonacci(n)
+    time_plain = time.perf_counter() - start
+
+    profiler = RecursionProfiler()
+    start = time.perf_counter()
+    with profiler.profile(recursion, "fibonacci"):
+        recursion.fibonacci(n)
+    time_exact = time.perf_counter() - start
+
+    sampler = SamplingProfiler(interval=0.001)
+    start = time.perf_counter()
+    sampler.run(recursion.fibonacci, n)
+    time_sampling = time.perf_counter() - start
+
+    print(f"Без профилирования: {time_plain:.4f} сек")
+    print(f"Точный режим:       {time_exact:.4f} сек "
+          f"(x{time_exact / time_plain:.1f})")
+    print(f"Выборочный режим:   {time_sampling:.4f} сек "
+          f"(x{time_sampling / time_plain:.1f}), "
+          f"выборок: {sampler.sample_count}, глубина: {sampler.max_depth}")
+
+
+if __name__ == "__main__":
+    profile_recursive_functions()
+    compare_overhead()
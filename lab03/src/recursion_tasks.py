@@ -19,19 +19,190 @@ def binary_search_recursive(arr, target, left=0, right=None):
         return binary_search_recursive(arr, target, left, mid - 1)
 
 
-def hanoi_towers(n, source="A", auxiliary="B", destination="C"):
+def hanoi_towers(n, source="A", auxiliary="B", destination="C", verbose=True):
     """
     Решение задачи "Ханойские башни"
     Количество шагов: 2^n - 1
+    verbose=False отключает печать (для замеров производительности)
     """
     if n == 1:  # Базовый случай
-        print(f"Переместить диск 1 со стержня {source} на {destination}")
+        if verbose:
+            print(f"Переместить диск 1 со стержня {source} на {destination}")
         return
     
     # Рекурсивный шаг
-    hanoi_towers(n - 1, source, destination, auxiliary)
-    print(f"Переместить диск {n} со стержня {source} на {destination}")
-    hanoi_towers(n - 1, auxiliary, source, destination)
+    hanoi_towers(n - 1, source, destination, auxiliary, verbose)
+    if verbose:
+        print(f"Переместить диск {n} со стержня {source} на {destination}")
+    hanoi_towers(n - 1, auxiliary, source, destination, verbose)
+
+
+def _hanoi_pegs(n, source, auxiliary, destination):
+    """
+    Порядок стержней для формул итеративного решения.
+    Формулы ниже переносят башню на стержень 2 при нечетном n
+    и на стержень 1 при четном, поэтому для четного n меняем их местами.
+    """
+    if n % 2 == 1:
+        return (source, auxiliary, destination)
+    return (source, destination, auxiliary)
+
+
+def hanoi_moves(n, source="A", auxiliary="B", destination="C"):
+    """
+    Итеративный генератор ходов Ханойских башен
+    Выдает кортежи (диск, откуда, куда) лениво, по одному
+    Сложность: O(2^n) по времени, O(1) по памяти
+    
+    Ход с номером m (1..2^n-1):
+      - диск: номер младшего единичного бита m
+      - откуда: (m & (m - 1)) % 3
+      - куда: ((m | (m - 1)) + 1) % 3
+    """
+    pegs = _hanoi_pegs(n, source, auxiliary, destination)
+    for m in range(1, 1 << n):
+        yield ((m & -m).bit_length(),
+               pegs[(m & (m - 1)) % 3],
+               pegs[((m | (m - 1)) + 1) % 3])
+
+
+def hanoi_move(n, k, source="A", auxiliary="B", destination="C"):
+    """
+    k-й ход (нумерация с 1) решения для n дисков без перебора предыдущих
+    Сложность: O(n) - несколько битовых операций над числом из n бит
+    """
+    if not 1 <= k < (1 << n):
+        raise ValueError(f"Номер хода должен быть в диапазоне 1..{(1 << n) - 1}")
+    pegs = _hanoi_pegs(n, source, auxiliary, destination)
+    return ((k & -k).bit_length(),
+            pegs[(k & (k - 1)) % 3],
+            pegs[((k | (k - 1)) + 1) % 3])
+
+
+# Компактный двоичный формат: один байт на ход
+#   старшие 5 бит - номер диска минус 1 (до 32 дисков)
+#   младшие 3 бита - код пары стержней (откуда, куда) из HANOI_PAIRS
+# Стержни нумеруются 0 - исходный, 1 - вспомогательный, 2 - целевой
+HANOI_PAIRS = [(0, 1), (0, 2), (1, 0), (1, 2), (2, 0), (2, 1)]
+HANOI_MAX_DISKS = 32
+
+
+def _hanoi_translation(perm):
+    """
+    Таблица bytes.translate, переименовывающая стержни в закодированных ходах.
+    perm[i] - физический стержень, на который отображается логический i.
+    """
+    table = bytearray(range(256))
+    for byte in range(256):
+        code = byte & 7
+        if code < len(HANOI_PAIRS):
+            src, dst = HANOI_PAIRS[code]
+            table[byte] = (byte & ~7) | HANOI_PAIRS.index((perm[src], perm[dst]))
+    return bytes(table)
+
+
+def _hanoi_block(k):
+    """
+    Закодированные ходы переноса k дисков со стержня 0 на 2 целиком в памяти.
+    Строится удвоением: S(k) = S(k-1)[1<->2] + ход k + S(k-1)[0<->1],
+    переименование стержней делается через bytes.translate на скорости C.
+    """
+    block = b""
+    for disk in range(1, k + 1):
+        block = (block.translate(_hanoi_translation((0, 2, 1)))
+                 + bytes([((disk - 1) << 3) | HANOI_PAIRS.index((0, 2))])
+                 + block.translate(_hanoi_translation((1, 0, 2))))
+    return block
+
+
+def write_hanoi_moves(n, path, block_disks=20):
+    """
+    Потоковая запись всех 2^n - 1 ходов в двоичный файл (1 байт на ход)
+    В памяти хранится только блок на block_disks дисков (2^block_disks байт),
+    большие башни собираются из его копий с переименованными стержнями.
+    Возвращает количество записанных ходов.
+    """
+    if not 1 <= n <= HANOI_MAX_DISKS:
+        raise ValueError(f"Поддерживается от 1 до {HANOI_MAX_DISKS} дисков")
+    
+    base_disks = min(n, block_disks)
+    base = _hanoi_block(base_disks)
+    tables = {}
+    
+    def emit(k, perm, out):
+        # Перенос k дисков с perm[0] на perm[2] через perm[1]
+        if k == base_disks:
+            if perm not in tables:
+                tables[perm] = _hanoi_translation(perm)
+            out.write(base.translate(tables[perm]))
+            return
+        emit(k - 1, (perm[0], perm[2], perm[1]), out)
+        out.write(bytes([((k - 1) << 3) | HANOI_PAIRS.index((perm[0], perm[2]))]))
+        emit(k - 1, (perm[1], perm[0], perm[2]), out)
+    
+    with open(path, "wb") as out:
+        emit(n, (0, 1, 2), out)
+    return (1 << n) - 1
+
+
+def read_hanoi_moves(path, source="A", auxiliary="B", destination="C",
+                     chunk_size=1 << 16):
+    """Чтение ходов, записанных write_hanoi_moves (генератор)"""
+    pegs = (source, auxiliary, destination)
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            for byte in chunk:
+                src, dst = HANOI_PAIRS[byte & 7]
+                yield ((byte >> 3) + 1, pegs[src], pegs[dst])
+
+
+def benchmark_hanoi(n=20):
+    """Сравнение скорости (ходов в секунду) разных решений Ханойских башен"""
+    import os
+    import tempfile
+    import time
+    
+    print(f"\nПРОИЗВОДИТЕЛЬНОСТЬ ХАНОЙСКИХ БАШЕН (n = {n})")
+    print("=" * 50)
+    total = (1 << n) - 1
+    
+    start = time.perf_counter()
+    hanoi_towers(n, verbose=False)
+    time_recursive = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    for _ in hanoi_moves(n):
+        pass
+    time_generator = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    for k in range(1, total + 1):
+        hanoi_move(n, k)
+    time_direct = time.perf_counter() - start
+    
+    fd, path = tempfile.mkstemp(suffix=".bin")
+    os.close(fd)
+    try:
+        start = time.perf_counter()
+        write_hanoi_moves(n, path)
+        time_file = time.perf_counter() - start
+        file_size = os.path.getsize(path)
+    finally:
+        os.remove(path)
+    
+    results = [
+        ("Рекурсия без печати", time_recursive),
+        ("Генератор hanoi_moves", time_generator),
+        ("Прямой доступ hanoi_move", time_direct),
+        ("Запись в файл", time_file),
+    ]
+    for name, elapsed in results:
+        rate = total / elapsed if elapsed > 0 else float("inf")
+        print(f"{name:<26} {elapsed:.4f} сек  ({rate:,.0f} ходов/сек)")
+    print(f"Размер файла: {file_size} байт ({file_size / total:.0f} байт на ход)")
 
 
 def test_algorithms():
@@ -51,7 +222,14 @@ def test_algorithms():
     print("\n2. ХАНОЙСКИЕ БАШНИ (3 диска)")
     print("=" * 20)
     hanoi_towers(3)
+    
+    print("\n3. ИТЕРАТИВНЫЙ ГЕНЕРАТОР ХОДОВ (3 диска)")
+    print("=" * 20)
+    for disk, src, dst in hanoi_moves(3):
+        print(f"Переместить диск {disk} со стержня {src} на {dst}")
+    print(f"Ход №5 для 3 дисков: {hanoi_move(3, 5)}")
 
 
 if __name__ == "__main__":
-    test_algorithms()
\ No newline at end of file
+    test_algorithms()
+    benchmark_hanoi()
\ No newline at end of file
@@ -0,0 +1,209 @@
+"""
+Набор бенчмарков сортировок: алгоритмы x размеры x типы данных x повторы.
+
+  - время меряется time.perf_counter_ns, берется лучший и медианный замер
+  - по желанию считаются сравнения и перемещения (count_operations)
+  - ячейки, которые по прогнозу не уложатся в бюджет времени, пропускаются
+  - сортировка подсчетом пропускается, если диапазон ключей намного больше n
+  - результаты сохраняются в JSON и CSV, два прогона можно сравнить
+
+Запуск:
+    python benchmark_suite.py                       - полный прогон
+    python benchmark_suite.py compare old.json new.json
+"""
+
+import csv
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+
+from generate_data import DISTRIBUTIONS
+from performance_test import ALGORITHMS, count_operations
+from sorts import counting_sort, radix_sort
+
+DEFAULT_SIZES = [10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]
+
+# Инструментированный прогон в десятки раз медленнее - только для небольших n
+COUNT_OPS_LIMIT = 10 ** 5
+
+# Инструментированный замер примерно во столько раз медленнее обычного
+COUNT_OPS_SLOWDOWN = 30
+
+# Показатель роста времени при увеличении n для прогноза бюджета,
+# пока нет двух замеров для оценки по факту
+GROWTH_EXPONENT = {True: 2.0, False: 1.15}  # O(n²) и O(n log n)
+
+# Сортировки без сравнений: обертки-счетчики к ним неприменимы
+NON_COMPARISON_SORTS = {counting_sort, radix_sort}
+
+# Сортировки, которым нужна память O(max - min): на широком диапазоне ключей
+# они пропускаются (как в benchmark_integer_sorts). Поразрядной это не нужно -
+# ее память O(n + radix) при любом диапазоне
+RANGE_BOUND_SORTS = {counting_sort}
+RANGE_FACTOR = 10  # Пропуск, если max - min > RANGE_FACTOR * n
+
+CSV_FIELDS = ["algorithm", "distribution", "size", "repeats", "best_ns",
+              "median_ns", "comparisons", "moves", "skipped"]
+
+
+def _time_once(func, arr):
+    """Один замер в наносекундах на копии массива"""
+    data = arr.copy()
+    start = time.perf_counter_ns()
+    func(data)
+    return time.perf_counter_ns() - start
+
+
+def _predict_ns(history, size, quadratic):
+    """
+    Прогноз времени для размера size по предыдущим замерам
+    Показатель роста оценивается по двум последним точкам
+    """
+    prev_size, prev_ns = history[-1]
+    exponent = GROWTH_EXPONENT[quadratic]
+    if len(history) > 1:
+        old_size, old_ns = history[-2]
+        if old_ns > 0 and prev_ns > 0:
+            exponent = math.log(prev_ns / old_ns) / math.log(prev_size / old_size)
+            exponent = min(max(exponent, 1.0), 2.5)
+    return prev_ns * (size / prev_size) ** exponent
+
+
+def run_benchmark(algorithms=None, sizes=None, distributions=None, repeats=3,
+                  count_ops=False, time_budget=2.0, verbose=True):
+    """
+    Прогон матрицы бенчмарков
+      - algorithms - список (название, функция, квадратичная ли)
+      - distributions - словарь название -> генератор(size)
+      - time_budget - предел времени одного замера, сек
+    Возвращает список словарей-результатов (по одному на ячейку)
+    """
+    algorithms = algorithms or ALGORITHMS
+    sizes = sizes or DEFAULT_SIZES
+    distributions = distributions or DISTRIBUTIONS
+    budget_ns = time_budget * 1e9
+    results = []
+
+    for dist_name, generate in distributions.items():
+        # История замеров (размер, время) по каждому алгоритму
+        history = {}
+        for size in sorted(sizes):
+            arr = generate(size)
+            key_range = max(arr) - min(arr) if arr else 0
+            for algo_name, func, quadratic in algorithms:
+                row = {"algorithm": algo_name, "distribution": dist_name,
+                       "size": size, "repeats": 0, "best_ns": None,
+                       "median_ns": None, "comparisons": None, "moves": None,
+                       "skipped": ""}
+                if func in RANGE_BOUND_SORTS and key_range > RANGE_FACTOR * size:
+                    row["skipped"] = f"диапазон ключей {key_range} > {RANGE_FACTOR}n"
+                    results.append(row)
+                    continue
+                points = history.setdefault(algo_name, [])
+                if points:
+                    predicted = _predict_ns(points, size, quadratic)
+                    if predicted > budget_ns:
+                        row["skipped"] = f"прогноз {predicted / 1e9:.1f} сек"
+                        results.append(row)
+                        points.append((size, predicted))
+                        continue
+
+                times = [_time_once(func, arr) for _ in range(repeats)]
+                row["repeats"] = repeats
+                row["best_ns"] = min(times)
+                row["median_ns"] = int(statistics.median(times))
+                points.append((size, row["best_ns"]))
+
+                if (count_ops and size <= COUNT_OPS_LIMIT
+                        and func not in NON_COMPARISON_SORTS
+                        and row["best_ns"] * COUNT_OPS_SLOWDOWN <= budget_ns):
+                    row["comparisons"], row["moves"] = count_operations(func, arr)
+
+                results.append(row)
+                if verbose:
+                    print(f"{dist_name:<14}{size:>10} {algo_name:<22}"
+                          f"{row['best_ns'] / 1e6:>12.3f} мс")
+    return results
+
+
+def _metadata():
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+
+
+def save_results_json(results, path):
+    """Сохранение результатов и описания окружения в JSON"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"meta": _metadata(), "results": results}, f,
+                  ensure_ascii=False, indent=2)
+
+
+def save_results_csv(results, path):
+    """Сохранение результатов в CSV (одна строка на ячейку)"""
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def load_results(path):
+    """Загрузка результатов, сохраненных save_results_json"""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+
+def compare_runs(baseline, current, threshold=0.10):
+    """
+    Отчет о регрессиях: сравнение лучших времен двух прогонов
+    baseline и current - списки результатов или пути к JSON
+    Возвращает список (ячейка, отношение) для регрессий
+    """
+    if isinstance(baseline, str):
+        baseline = load_results(baseline)
+    if isinstance(current, str):
+        current = load_results(current)
+
+    def key(row):
+        return row["algorithm"], row["distribution"], row["size"]
+
+    base_index = {key(row): row for row in baseline if row["best_ns"]}
+    regressions = []
+    improvements = 0
+
+    print("СРАВНЕНИЕ ПРОГОНОВ")
+    print("=" * 70)
+    for row in current:
+        old = base_index.get(key(row))
+        if not old or not row["best_ns"]:
+            continue
+        ratio = row["best_ns"] / old["best_ns"]
+        if ratio > 1 + threshold:
+            regressions.append((key(row), ratio))
+            print(f"РЕГРЕССИЯ  {row['algorithm']:<22}{row['distribution']:<14}"
+                  f"{row['size']:>10}  x{ratio:.2f}")
+        elif ratio < 1 - threshold:
+            improvements += 1
+            print(f"УЛУЧШЕНИЕ  {row['algorithm']:<22}{row['distribution']:<14}"
+                  f"{row['size']:>10}  x{ratio:.2f}")
+
+    print(f"\nРегрессий: {len(regressions)}, улучшений: {improvements} "
+          f"(порог {threshold:.0%})")
+    return regressions
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "compare":
+        compare_runs(sys.argv[2], sys.argv[3])
+    else:
+        results = run_benchmark(count_ops=True)
+        save_results_json(results, "benchmark_results.json")
+        save_results_csv(results, "benchmark_results.csv")
+        print("\nРезультаты сохранены в benchmark_results.json и benchmark_results.csv")
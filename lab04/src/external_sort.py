@@ -0,0 +1,254 @@
+"""
+Внешняя сортировка: файлы чисел, которые не помещаются в оперативную память.
+
+Файл - плотная последовательность чисел фиксированного размера
+(по умолчанию int64, формат модуля array / numpy.tofile).
+
+  1. Фаза разбиения: файл читается блоками в пределах бюджета памяти,
+     каждый блок сортируется в памяти и сбрасывается во временный файл (серию)
+  2. Фаза слияния: серии сливаются кучей (heapq.merge) группами по fan_in
+     с буферизованным чтением и записью, пока не останется одна
+"""
+
+import heapq
+import os
+import random
+import shutil
+import tempfile
+import time
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необязателен - без него сортируем списками
+    np = None
+
+# Оценка памяти на элемент при сортировке без NumPy:
+# сам элемент в array, объект int и указатель в списке sorted()
+PYTHON_ITEM_OVERHEAD = 48
+
+# Без NumPy отсортированный список пишется кусками: не больше
+# 1/WRITE_CHUNK_FRACTION бюджета памяти и не больше WRITE_CHUNK_ITEMS элементов
+WRITE_CHUNK_FRACTION = 8
+WRITE_CHUNK_ITEMS = 1 << 16
+
+# Серии короче этого не создаются даже при крошечном бюджете:
+# иначе на каждый элемент приходится временный файл и лишние проходы слияния
+MIN_RUN_ITEMS = 1024
+
+
+def _write_chunk_items(memory_limit, itemsize):
+    """Размер куска записи отсортированной серии (в элементах)"""
+    return max(1, min(WRITE_CHUNK_ITEMS,
+                      memory_limit // (WRITE_CHUNK_FRACTION * itemsize)))
+
+
+def _items_per_run(memory_limit, itemsize):
+    """
+    Сколько элементов можно отсортировать в памяти за раз
+    С NumPy блок читается, сортируется и пишется на месте - в памяти только
+    сам блок. Без NumPy к нему добавляются список sorted() (учтен
+    в PYTHON_ITEM_OVERHEAD) и кусок записи
+    """
+    if np is not None:
+        return max(MIN_RUN_ITEMS, memory_limit // itemsize)
+    reserve = _write_chunk_items(memory_limit, itemsize) * itemsize
+    return max(MIN_RUN_ITEMS, (memory_limit - reserve) // PYTHON_ITEM_OVERHEAD)
+
+
+def _write_sorted_run(block, typecode, out, chunk_items=WRITE_CHUNK_ITEMS):
+    """Сортировка блока в памяти и запись в файл без копий всего блока"""
+    if np is not None:
+        # Сортировка на месте в буфере array, запись прямо из него
+        np.frombuffer(block, dtype=block.typecode).sort()
+        block.tofile(out)
+        return
+    items = sorted(block)
+    del block[:]  # Элементы уже в списке - буфер блока больше не нужен
+    for start in range(0, len(items), chunk_items):
+        array(typecode, items[start:start + chunk_items]).tofile(out)
+
+
+def _read_items(f, typecode, count):
+    """
+    Чтение до count элементов из файла в array
+    Данные читаются прямо в буфер массива (readinto), без промежуточных bytes
+    """
+    block = array(typecode, [0]) * count
+    view = memoryview(block).cast("B")
+    try:
+        nbytes = f.readinto(view)
+    finally:
+        view.release()
+    del block[nbytes // block.itemsize:]  # Конец файла - то, что успели прочитать
+    return block
+
+
+def _iter_run(path, typecode, buffer_items):
+    """Поток элементов серии с буферизованным чтением"""
+    with open(path, "rb") as f:
+        while True:
+            block = _read_items(f, typecode, buffer_items)
+            if not block:
+                return
+            yield from block
+
+
+def _merge_runs(paths, output_path, typecode, buffer_items, on_item_batch=None):
+    """k-путевое слияние серий через кучу с буферизованной записью"""
+    streams = [_iter_run(path, typecode, buffer_items) for path in paths]
+    out_buffer = array(typecode)
+    with open(output_path, "wb") as out:
+        for item in heapq.merge(*streams):
+            out_buffer.append(item)
+            if len(out_buffer) >= buffer_items:
+                out_buffer.tofile(out)
+                if on_item_batch:
+                    on_item_batch(len(out_buffer))
+                out_buffer = array(typecode)
+        if out_buffer:
+            out_buffer.tofile(out)
+            if on_item_batch:
+                on_item_batch(len(out_buffer))
+
+
+def external_sort(input_path, output_path, memory_limit=64 * 2 ** 20, fan_in=16,
+                  typecode="q", progress=None, tmp_dir=None):
+    """
+    Сортировка файла чисел с ограничением памяти
+      - memory_limit - бюджет памяти в байтах на фазу разбиения и слияния
+      - fan_in - сколько серий сливается за один проход
+      - progress(stage, done, total) - вызывается по ходу работы,
+        stage: "split" или "merge", done/total - в байтах
+    Временная сложность: O(n log n)
+    Ввод-вывод: O(n * (1 + log_fan_in(число серий)))
+    Возвращает число проходов слияния
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in должен быть не меньше 2")
+    itemsize = array(typecode).itemsize
+    total_bytes = os.path.getsize(input_path)
+    if total_bytes % itemsize:
+        raise ValueError(f"Размер файла {total_bytes} байт не кратен "
+                         f"размеру элемента {itemsize} ('{typecode}')")
+    run_items = _items_per_run(memory_limit, itemsize)
+    chunk_items = _write_chunk_items(memory_limit, itemsize)
+
+    work_dir = tempfile.mkdtemp(prefix="extsort_", dir=tmp_dir)
+    try:
+        # Фаза 1: разбиение на отсортированные серии
+        runs = []
+        done = 0
+        with open(input_path, "rb") as f:
+            while True:
+                # Не больше, чем осталось в файле: буфер выделяется заранее
+                remaining = (total_bytes - done) // itemsize
+                block = _read_items(f, typecode, min(run_items, remaining))
+                if not block:
+                    break
+                run_path = os.path.join(work_dir, f"run_{len(runs)}.bin")
+                count = len(block)
+                with open(run_path, "wb") as out:
+                    _write_sorted_run(block, typecode, out, chunk_items)
+                del block
+                runs.append(run_path)
+                done += count * itemsize
+                if progress:
+                    progress("split", done, total_bytes)
+
+        if len(runs) <= 1:
+            if runs:
+                shutil.move(runs[0], output_path)
+            else:
+                open(output_path, "wb").close()
+            return 0
+
+        # Фаза 2: слияние группами по fan_in. Буфер на каждую серию
+        # и на выход - равные доли бюджета памяти
+        buffer_items = max(1, memory_limit // ((fan_in + 1) * PYTHON_ITEM_OVERHEAD))
+        passes_needed, count = 0, len(runs)
+        while count > 1:
+            count = -(-count // fan_in)
+            passes_needed += 1
+        merge_total = passes_needed * total_bytes
+        passes = 0
+        merged_bytes = [0]
+
+        def on_item_batch(count):
+            merged_bytes[0] += count * itemsize
+            if progress:
+                progress("merge", merged_bytes[0], merge_total)
+
+        while len(runs) > 1:
+            passes += 1
+            final = len(runs) <= fan_in
+            next_runs = []
+            for start in range(0, len(runs), fan_in):
+                group = runs[start:start + fan_in]
+                if len(group) == 1:
+                    next_runs.append(group[0])
+                    merged_bytes[0] += os.path.getsize(group[0])
+                    continue
+                target = output_path if final else os.path.join(
+                    work_dir, f"pass{passes}_{len(next_runs)}.bin")
+                _merge_runs(group, target, typecode, buffer_items, on_item_batch)
+                for path in group:
+                    os.remove(path)
+                next_runs.append(target)
+            runs = next_runs
+        return passes
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def write_random_file(path, count, typecode="q", seed=None, chunk=1 << 20):
+    """Генерация файла из count случайных чисел"""
+    rng = random.Random(seed)
+    itemsize = array(typecode).itemsize
+    high = 2 ** (8 * itemsize - 1) - 1
+    with open(path, "wb") as f:
+        for start in range(0, count, chunk):
+            size = min(chunk, count - start)
+            array(typecode, (rng.randint(-high, high) for _ in range(size))).tofile(f)
+
+
+def is_sorted_file(path, typecode="q", chunk=1 << 20):
+    """Проверка, что файл отсортирован"""
+    prev = None
+    with open(path, "rb") as f:
+        while True:
+            block = _read_items(f, typecode, chunk)
+            if not block:
+                return True
+            if prev is not None and block[0] < prev:
+                return False
+            if any(block[i] > block[i + 1] for i in range(len(block) - 1)):
+                return False
+            prev = block[-1]
+
+
+def benchmark_external_sort(size_mb=64, budgets_mb=(1, 4, 16, 64), fan_in=16):
+    """Пропускная способность (МБ/с) в зависимости от бюджета памяти"""
+    print(f"ВНЕШНЯЯ СОРТИРОВКА ФАЙЛА {size_mb} МБ (fan_in={fan_in})")
+    print("=" * 60)
+
+    work_dir = tempfile.mkdtemp(prefix="extsort_bench_")
+    try:
+        input_path = os.path.join(work_dir, "input.bin")
+        output_path = os.path.join(work_dir, "output.bin")
+        write_random_file(input_path, size_mb * 2 ** 20 // 8, seed=42)
+
+        print(f"{'Память, МБ':>10}{'Проходов':>10}{'Время, сек':>12}{'МБ/с':>10}")
+        for budget in budgets_mb:
+            start = time.perf_counter()
+            passes = external_sort(input_path, output_path,
+                                   memory_limit=budget * 2 ** 20, fan_in=fan_in)
+            elapsed = time.perf_counter() - start
+            assert is_sorted_file(output_path)
+            print(f"{budget:>10}{passes:>10}{elapsed:>12.2f}{size_mb / elapsed:>10.2f}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    benchmark_external_sort()
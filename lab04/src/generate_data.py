@@ -1,4 +1,11 @@
+import os
 import random
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # Без NumPy используется медленный генератор на array
+    np = None
 
 def generate_random(size):
     """Случайный массив"""
@@ -23,6 +30,204 @@ def generate_almost_sorted(size, percent=5):
         arr[i], arr[j] = arr[j], arr[i]
     return arr
 
+# Каталог кеша наборов данных (.npy, без NumPy - .bin)
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data_cache')
+
+# Параметры распределений
+MAX_RANDOM_VALUE = 10000  # Как в generate_random
+ALMOST_SORTED_PERCENT = 5
+FEW_UNIQUE_VALUES = 10
+SAWTOOTH_TEETH = 10  # Число "зубцов"
+ZIPF_EXPONENT = 1.5
+RANDOM_TAIL_PERCENT = 10
+
+def _numpy_dataset(distribution, size, rng):
+    """Векторизованная генерация набора данных (int64)"""
+    if distribution == 'random':
+        return rng.integers(1, MAX_RANDOM_VALUE + 1, size, dtype=np.int64)
+    if distribution == 'sorted':
+        return np.arange(1, size + 1, dtype=np.int64)
+    if distribution == 'reversed':
+        return np.arange(size, 0, -1, dtype=np.int64)
+    if distribution == 'almost_sorted':
+        arr = np.arange(1, size + 1, dtype=np.int64)
+        swap_count = size * ALMOST_SORTED_PERCENT // 100
+        # Различные позиции: при повторах присваивание по массивам индексов
+        # затирало бы значения вместо обмена
+        pos = rng.choice(size, 2 * swap_count, replace=False)
+        i, j = pos[:swap_count], pos[swap_count:]
+        arr[i], arr[j] = arr[j].copy(), arr[i].copy()
+        return arr
+    if distribution == 'few_unique':
+        return rng.integers(1, FEW_UNIQUE_VALUES + 1, size, dtype=np.int64)
+    if distribution == 'sawtooth':
+        tooth = max(1, size // SAWTOOTH_TEETH)
+        return np.arange(size, dtype=np.int64) % tooth
+    if distribution == 'organ_pipe':
+        half = (size + 1) // 2
+        return np.concatenate([np.arange(half, dtype=np.int64),
+                               np.arange(size - half - 1, -1, -1, dtype=np.int64)])
+    if distribution == 'zipf':
+        # Ограничиваем хвост, чтобы значения помещались в int64
+        return np.minimum(rng.zipf(ZIPF_EXPONENT, size), 2 ** 62).astype(np.int64)
+    if distribution == 'sorted_random_tail':
+        arr = np.arange(1, size + 1, dtype=np.int64)
+        tail = size * RANDOM_TAIL_PERCENT // 100
+        if tail:
+            arr[size - tail:] = rng.integers(1, size + 1, tail, dtype=np.int64)
+        return arr
+    raise ValueError(f'Неизвестное распределение: {distribution}')
+
+def _python_dataset(distribution, size, rng):
+    """Генерация набора данных без NumPy (array('q'))"""
+    if distribution == 'random':
+        return array('q', (rng.randint(1, MAX_RANDOM_VALUE) for _ in range(size)))
+    if distribution == 'sorted':
+        return array('q', range(1, size + 1))
+    if distribution == 'reversed':
+        return array('q', range(size, 0, -1))
+    if distribution == 'almost_sorted':
+        arr = array('q', range(1, size + 1))
+        for _ in range(size * ALMOST_SORTED_PERCENT // 100):
+            i = rng.randrange(size)
+            j = rng.randrange(size)
+            arr[i], arr[j] = arr[j], arr[i]
+        return arr
+    if distribution == 'few_unique':
+        return array('q', (rng.randint(1, FEW_UNIQUE_VALUES) for _ in range(size)))
+    if distribution == 'sawtooth':
+        tooth = max(1, size // SAWTOOTH_TEETH)
+        return array('q', (i % tooth for i in range(size)))
+    if distribution == 'organ_pipe':
+        half = (size + 1) // 2
+        return array('q', list(range(half)) + list(range(size - half - 1, -1, -1)))
+    if distribution == 'zipf':
+        # Дискретное распределение Ципфа через паретовское: floor(pareto) ~ zipf
+        return array('q', (min(int(rng.paretovariate(ZIPF_EXPONENT - 1)), 2 ** 62)
+                           for _ in range(size)))
+    if distribution == 'sorted_random_tail':
+        arr = array('q', range(1, size + 1))
+        tail = size * RANDOM_TAIL_PERCENT // 100
+        for k in range(size - tail, size):
+            arr[k] = rng.randint(1, size)
+        return arr
+    raise ValueError(f'Неизвестное распределение: {distribution}')
+
+# Версия формата кеша: меняется, когда меняются сами данные генераторов
+# (v2 - almost_sorted в NumPy снова перестановка)
+CACHE_VERSION = 2
+
+def _cache_path(cache_dir, distribution, size, seed):
+    ext = '.npy' if np is not None else '.bin'
+    return os.path.join(cache_dir, f'{distribution}_{size}_{seed}_v{CACHE_VERSION}{ext}')
+
+def generate_dataset(distribution, size, seed=0, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Воспроизводимый набор данных: одинаковые (распределение, размер, seed)
+    дают одинаковый результат (в пределах одной реализации - NumPy и
+    запасная на array используют разные генераторы случайных чисел).
+    С NumPy возвращает numpy.ndarray (int64), без него - array('q').
+    Сгенерированные наборы кешируются в cache_dir, повторный вызов
+    отображает файл в память (mmap) без чтения целиком.
+    cache_dir=None или seed=None отключают кеш.
+    """
+    use_cache = cache_dir is not None and seed is not None
+    if use_cache:
+        path = _cache_path(cache_dir, distribution, size, seed)
+        if os.path.exists(path):
+            if np is not None:
+                return np.load(path, mmap_mode='r')
+            arr = array('q')
+            with open(path, 'rb') as f:
+                arr.fromfile(f, size)
+            return arr
+    
+    if np is not None:
+        arr = _numpy_dataset(distribution, size, np.random.default_rng(seed))
+    else:
+        arr = _python_dataset(distribution, size, random.Random(seed))
+    
+    if use_cache:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Пишем во временный файл и переименовываем - без полузаписанных файлов
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            if np is not None:
+                np.save(f, arr)
+            else:
+                arr.tofile(f)
+        os.replace(tmp_path, path)
+    return arr
+
+def generate_list(distribution, size, seed=0, cache_dir=DEFAULT_CACHE_DIR):
+    """Набор данных generate_dataset в виде списка для сортировок"""
+    return generate_dataset(distribution, size, seed, cache_dir).tolist()
+
+# Распределения, которые есть только в generate_dataset
+EXTRA_DISTRIBUTIONS = ['few_unique', 'sawtooth', 'organ_pipe', 'zipf', 'sorted_random_tail']
+
+# Все виды входных данных: название -> генератор(size)
+# Все идут через generate_list (seed=0), чтобы прогоны были воспроизводимы
+DISTRIBUTIONS = {
+    _name: lambda size, _name=_name: generate_list(_name, size)
+    for _name in ['random', 'sorted', 'reversed', 'almost_sorted'] + EXTRA_DISTRIBUTIONS
+}
+
+# Строковые наборы данных: длинные общие префиксы, как в реальных ключах
+URL_HOSTS = ['www.example.com', 'shop.example.com', 'api.example.com']
+URL_SECTIONS = ['catalog', 'catalog/electronics', 'catalog/electronics/phones',
+                'catalog/books', 'user/profile', 'search']
+LOG_LEVELS = ['INFO', 'INFO', 'INFO', 'DEBUG', 'WARNING', 'ERROR']
+LOG_MESSAGES = ['request handled', 'request handled', 'cache miss',
+                'connection reset by peer', 'slow query']
+
+def generate_urls(size, seed=None):
+    """URL-адреса: несколько хостов и разделов, различаются хвостом"""
+    rng = random.Random(seed)
+    return [f'https://{rng.choice(URL_HOSTS)}/{rng.choice(URL_SECTIONS)}/'
+            f'item?id={rng.randint(1, 10 ** 6)}&ref=campaign{rng.randint(1, 50)}'
+            for _ in range(size)]
+
+def generate_log_lines(size, seed=None):
+    """Строки журнала за один день: общий префикс - дата и начало времени"""
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(size):
+        seconds = rng.randrange(24 * 3600)
+        lines.append(f'2026-10-19 {seconds // 3600:02}:{seconds // 60 % 60:02}:'
+                     f'{seconds % 60:02}.{rng.randrange(1000):03} '
+                     f'{rng.choice(LOG_LEVELS)} [worker-{rng.randint(1, 8)}] '
+                     f'{rng.choice(LOG_MESSAGES)} user={rng.randint(1, 10 ** 5)}')
+    return lines
+
+# Строковые виды входных данных: название -> генератор(size)
+STRING_DISTRIBUTIONS = {
+    'urls': generate_urls,
+    'log_lines': generate_log_lines,
+}
+
+def benchmark_generation(sizes=(10 ** 6, 10 ** 7, 10 ** 8), distribution='random'):
+    """Время генерации и повторной загрузки из кеша"""
+    import time
+    
+    print(f"ГЕНЕРАЦИЯ ДАННЫХ ({distribution}, NumPy: {'да' if np is not None else 'нет'})")
+    print("=" * 50)
+    for size in sizes:
+        path = _cache_path(DEFAULT_CACHE_DIR, distribution, size, 0)
+        if os.path.exists(path):
+            os.remove(path)
+        
+        start = time.perf_counter()
+        generate_dataset(distribution, size)
+        time_generate = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        generate_dataset(distribution, size)
+        time_load = time.perf_counter() - start
+        
+        print(f"n = {size:>11}: генерация {time_generate:.3f} сек, "
+              f"из кеша {time_load:.4f} сек")
+
 def generate_test_data():
     """Создание всех тестовых данных"""
     sizes = [100, 500, 1000]
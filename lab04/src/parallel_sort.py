@@ -0,0 +1,176 @@
+"""
+Параллельная сортировка целых чисел на нескольких процессах.
+
+Схема (sample sort):
+  1. Массив копируется в разделяемую память (SharedMemory), процессы
+     получают только индексы - данные не сериализуются через pickle
+  2. Каждый процесс сортирует свой блок на месте
+  3. По выборке из отсортированных блоков выбираются p - 1 разделителей
+  4. Процесс j сливает (heapq.merge) j-е части всех блоков и пишет
+     результат в свой участок выходного буфера
+"""
+
+import heapq
+import os
+import random
+import time
+from array import array
+from bisect import bisect_left
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+
+# Массивы короче этого порога сортируются в одном процессе:
+# запуск пула и копирование в разделяемую память дороже выигрыша
+PARALLEL_THRESHOLD = 200_000
+
+ITEM_TYPE = "q"  # int64
+ITEM_SIZE = array(ITEM_TYPE).itemsize
+
+# Разделяемая память, подключенная в процессе-обработчике
+_shm_input = None
+_shm_output = None
+
+
+def _attach(input_name, output_name):
+    """Инициализация процесса пула: подключение к разделяемой памяти"""
+    global _shm_input, _shm_output
+    _shm_input = SharedMemory(name=input_name)
+    _shm_output = SharedMemory(name=output_name)
+
+
+def _sort_block(bounds):
+    """Сортировка блока data[lo:hi] на месте"""
+    lo, hi = bounds
+    data = _shm_input.buf.cast(ITEM_TYPE)
+    try:
+        data[lo:hi] = array(ITEM_TYPE, sorted(data[lo:hi]))
+    finally:
+        data.release()
+
+
+def _merge_parts(task):
+    """Слияние частей блоков [(lo, hi), ...] в output[offset:...]"""
+    offset, parts = task
+    data = _shm_input.buf.cast(ITEM_TYPE)
+    out = _shm_output.buf.cast(ITEM_TYPE)
+    try:
+        merged = array(ITEM_TYPE, heapq.merge(*(data[lo:hi] for lo, hi in parts)))
+        out[offset:offset + len(merged)] = merged
+    finally:
+        data.release()
+        out.release()
+
+
+def _choose_splitters(data, blocks, workers):
+    """
+    Выбор workers - 1 разделителей по регулярной выборке из блоков
+    (в каждом отсортированном блоке берется workers равноотстоящих элементов)
+    """
+    sample = []
+    for lo, hi in blocks:
+        step = max(1, (hi - lo) // workers)
+        sample.extend(data[lo:hi:step])
+    sample.sort()
+    step = len(sample) / workers
+    return [sample[int(step * j)] for j in range(1, workers)]
+
+
+def parallel_sort(arr, workers=None, threshold=PARALLEL_THRESHOLD):
+    """
+    Параллельная сортировка целых чисел (int64)
+    Короткие массивы и массивы с нецелыми / слишком большими числами
+    сортируются последовательно.
+    Временная сложность: O((n log n) / p + n log p) при p процессах
+    Пространственная сложность: O(n) - два буфера разделяемой памяти
+    """
+    workers = workers or os.cpu_count() or 1
+    n = len(arr)
+    if workers < 2 or n < max(threshold, 2):
+        arr.sort()
+        return arr
+    try:
+        packed = array(ITEM_TYPE, arr)
+    except (OverflowError, TypeError):
+        arr.sort()
+        return arr
+
+    shm_input = SharedMemory(create=True, size=n * ITEM_SIZE)
+    shm_output = SharedMemory(create=True, size=n * ITEM_SIZE)
+    data = shm_input.buf.cast(ITEM_TYPE)
+    out = shm_output.buf.cast(ITEM_TYPE)
+    try:
+        data[:] = packed
+        del packed
+
+        step = -(-n // workers)
+        blocks = [(lo, min(lo + step, n)) for lo in range(0, n, step)]
+
+        with Pool(workers, initializer=_attach,
+                  initargs=(shm_input.name, shm_output.name)) as pool:
+            pool.map(_sort_block, blocks)
+
+            # Границы частей: в блоке i часть j - элементы между
+            # разделителями j - 1 и j
+            splitters = _choose_splitters(data, blocks, workers)
+            cuts = [[lo] + [bisect_left(data, s, lo, hi) for s in splitters] + [hi]
+                    for lo, hi in blocks]
+
+            tasks = []
+            offset = 0
+            for j in range(workers):
+                parts = [(cut[j], cut[j + 1]) for cut in cuts if cut[j] < cut[j + 1]]
+                tasks.append((offset, parts))
+                offset += sum(hi - lo for lo, hi in parts)
+            pool.map(_merge_parts, tasks)
+
+        arr[:] = out.tolist()
+        return arr
+    finally:
+        data.release()
+        out.release()
+        for shm in (shm_input, shm_output):
+            shm.close()
+            shm.unlink()
+
+
+def benchmark_scaling(sizes=(10 ** 6, 10 ** 7), per_worker=10 ** 6, max_workers=None):
+    """
+    Масштабируемость параллельной сортировки
+      - сильная: фиксированный размер, растет число процессов
+      - слабая: на каждый процесс приходится per_worker элементов
+    Для 10^8 элементов передайте sizes=(10 ** 8,) (нужно ~3 ГБ памяти)
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    worker_counts = sorted({1, *range(2, max_workers + 1, 2), max_workers})
+
+    def measure(size, workers):
+        arr = [random.randint(-10 ** 9, 10 ** 9) for _ in range(size)]
+        start = time.perf_counter()
+        parallel_sort(arr, workers=workers, threshold=0)
+        return time.perf_counter() - start
+
+    print("СИЛЬНАЯ МАСШТАБИРУЕМОСТЬ")
+    print("=" * 50)
+    for size in sizes:
+        print(f"\nn = {size}:")
+        base = None
+        for workers in worker_counts:
+            elapsed = measure(size, workers)
+            base = base or elapsed
+            speedup = base / elapsed
+            print(f"  процессов: {workers:>3}  время: {elapsed:8.3f} сек  "
+                  f"ускорение: {speedup:5.2f}  эффективность: {speedup / workers:5.2f}")
+
+    print("\nСЛАБАЯ МАСШТАБИРУЕМОСТЬ")
+    print("=" * 50)
+    print(f"Элементов на процесс: {per_worker}")
+    base = None
+    for workers in worker_counts:
+        elapsed = measure(per_worker * workers, workers)
+        base = base or elapsed
+        print(f"  процессов: {workers:>3}  n = {per_worker * workers:>11}  "
+              f"время: {elapsed:8.3f} сек  эффективность: {base / elapsed:5.2f}")
+
+
+if __name__ == "__main__":
+    benchmark_scaling()
@@ -1,6 +1,14 @@
 import time
 import random
-from sorts import bubble_sort, selection_sort, insertion_sort
+from operator import itemgetter
+from sorts import (bubble_sort, selection_sort, insertion_sort,
+                   binary_insertion_sort, shell_sort, merge_sort,
+                   merge_sort_bottom_up, quick_sort, heap_sort, tim_sort,
+                   counting_sort, radix_sort, radix_sort_numpy, smart_sort,
+                   choose_sort_algorithm, argsort, nth_element,
+                   partial_sort, top_k, multikey_quick_sort, msd_radix_sort)
+from generate_data import (generate_random, generate_sorted, generate_reversed,
+                           generate_almost_sorted, STRING_DISTRIBUTIONS)
 
 
 def generate_random_array(size):
@@ -17,9 +25,350 @@ def measure_sort_time(sort_func, arr):
     return end_time - start_time
 
 
+# (название, функция, квадратичная ли сложность)
+ALGORITHMS = [
+    ("Пузырьком", bubble_sort, True),
+    ("Выбором", selection_sort, True),
+    ("Вставками", insertion_sort, True),
+    ("Бинарными вставками", binary_insertion_sort, True),
+    ("Шелла (Ciura)", shell_sort, False),
+    ("Слиянием", merge_sort, False),
+    ("Слиянием (восх.)", merge_sort_bottom_up, False),
+    ("Быстрая", quick_sort, False),
+    ("Пирамидальная", heap_sort, False),
+    ("Timsort", tim_sort, False),
+    ("Подсчетом", counting_sort, False),
+    ("Поразрядная", radix_sort, False),
+]
+
+# O(n²) алгоритмы на больших массивах работали бы часами - пропускаем их
+QUADRATIC_SIZE_LIMIT = 5000
+
+
+def measure_algorithms(arr):
+    """Замер всех подходящих по размеру алгоритмов на одном массиве"""
+    results = []
+    for name, func, quadratic in ALGORITHMS:
+        if quadratic and len(arr) > QUADRATIC_SIZE_LIMIT:
+            continue
+        results.append((name, measure_sort_time(func, arr)))
+    return results
+
+
+def print_results(results):
+    """Вывод результатов замеров"""
+    for name, time_taken in results:
+        print(f"{name + ':':<20} {time_taken:.6f} сек")
+
+
+class OperationCounter:
+    """Счетчики сравнений и перемещений элементов"""
+    
+    def __init__(self):
+        self.comparisons = 0
+        self.moves = 0
+
+
+class CountingItem:
+    """Обертка элемента, считающая каждое сравнение"""
+    __slots__ = ("value", "counter")
+    
+    def __init__(self, value, counter):
+        self.value = value
+        self.counter = counter
+    
+    def __lt__(self, other):
+        self.counter.comparisons += 1
+        return self.value < other.value
+    
+    def __gt__(self, other):
+        self.counter.comparisons += 1
+        return self.value > other.value
+    
+    def __le__(self, other):
+        self.counter.comparisons += 1
+        return self.value <= other.value
+    
+    def __ge__(self, other):
+        self.counter.comparisons += 1
+        return self.value >= other.value
+
+
+class CountingList(list):
+    """Список, считающий записи элементов (перемещения)"""
+    
+    def __init__(self, items, counter):
+        super().__init__(items)
+        self.counter = counter
+    
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            self.counter.moves += len(value)
+        else:
+            self.counter.moves += 1
+        super().__setitem__(index, value)
+
+
+def count_operations(sort_func, arr):
+    """
+    Подсчет сравнений и перемещений при сортировке копии arr
+    Перемещением считается запись элемента в сортируемый массив
+    (записи во внутренние буферы алгоритма не учитываются)
+    """
+    counter = OperationCounter()
+    items = CountingList((CountingItem(x, counter) for x in arr), counter)
+    result = sort_func(items)
+    assert [item.value for item in result] == sorted(arr)
+    return counter.comparisons, counter.moves
+
+
+def benchmark_insertion_family(sizes=(1000, 10_000, 100_000)):
+    """
+    Бинарные вставки и сортировка Шелла с разными шагами против
+    трех простых сортировок: время и число сравнений
+    Простые O(n²) сортировки замеряются только до QUADRATIC_SIZE_LIMIT
+    """
+    print("\nВСТАВКИ И СОРТИРОВКА ШЕЛЛА")
+    print("=" * 70)
+    
+    algorithms = [
+        ("Пузырьком", bubble_sort, True),
+        ("Выбором", selection_sort, True),
+        ("Вставками", insertion_sort, True),
+        ("Бинарными вставками", binary_insertion_sort, False),
+        ("Шелла (Ciura)", lambda a: shell_sort(a, "ciura"), False),
+        ("Шелла (Tokuda)", lambda a: shell_sort(a, "tokuda"), False),
+        ("Шелла (Sedgewick)", lambda a: shell_sort(a, "sedgewick"), False),
+    ]
+    data_kinds = [
+        ("Случайный", generate_random),
+        ("Отсортированный", generate_sorted),
+        ("Обратный", generate_reversed),
+        ("Почти отсорт.", generate_almost_sorted),
+    ]
+    
+    for size in sizes:
+        for data_name, generate in data_kinds:
+            arr = generate(size)
+            print(f"\n{data_name} (n={size}):")
+            for name, func, quadratic in algorithms:
+                if quadratic and size > QUADRATIC_SIZE_LIMIT:
+                    continue
+                time_taken = measure_sort_time(func, arr)
+                comparisons, _ = count_operations(func, arr)
+                print(f"  {name:<20} {time_taken:10.6f} сек, сравнений: {comparisons:>12}")
+
+
+def benchmark_adaptive_sort(size=5000):
+    """
+    Сравнение адаптивной сортировки (Timsort) с остальными алгоритмами
+    на всех типах данных: время, сравнения и перемещения
+    """
+    print("\nАДАПТИВНАЯ СОРТИРОВКА НА РАЗНЫХ ТИПАХ ДАННЫХ")
+    print("=" * 70)
+    
+    data_types = [
+        ("Случайный", generate_random(size)),
+        ("Отсортированный", generate_sorted(size)),
+        ("Обратный", generate_reversed(size)),
+        ("Почти отсорт.", generate_almost_sorted(size)),
+    ]
+    algorithms = [
+        ("Timsort", tim_sort),
+        ("Слиянием", merge_sort),
+        ("Быстрая", quick_sort),
+        ("Вставками", insertion_sort),
+    ]
+    
+    for data_name, arr in data_types:
+        print(f"\n{data_name} (n={size}):")
+        for algo_name, func in algorithms:
+            time_taken = measure_sort_time(func, arr)
+            comparisons, moves = count_operations(func, arr)
+            print(f"  {algo_name:<12} {time_taken:.6f} сек, "
+                  f"сравнений: {comparisons:>10}, перемещений: {moves:>10}")
+    
+    print(f"\nПочти отсортированный массив (n={size}): доля перестановок")
+    print(f"{'Беспорядок':<12}{'Timsort, сравн.':>18}{'Слиянием, сравн.':>20}"
+          f"{'Timsort, сек':>15}{'Слиянием, сек':>16}")
+    for percent in [0, 1, 2, 5, 10, 20, 30, 40, 50]:
+        arr = generate_almost_sorted(size, percent)
+        tim_cmp, _ = count_operations(tim_sort, arr)
+        merge_cmp, _ = count_operations(merge_sort, arr)
+        tim_time = measure_sort_time(tim_sort, arr)
+        merge_time = measure_sort_time(merge_sort, arr)
+        print(f"{percent:>10}% {tim_cmp:>18}{merge_cmp:>20}"
+              f"{tim_time:>15.6f}{merge_time:>16.6f}")
+
+
+def benchmark_integer_sorts(size=100_000):
+    """
+    Сортировки целых чисел без сравнений против sorted() и быстрой сортировки
+    при разной ширине диапазона ключей
+    """
+    print(f"\nЛИНЕЙНЫЕ СОРТИРОВКИ ЦЕЛЫХ ЧИСЕЛ (n={size})")
+    print("=" * 70)
+    
+    algorithms = [
+        ("sorted()", sorted),
+        ("Быстрая", quick_sort),
+        ("Подсчетом", counting_sort),
+        ("Поразрядная", radix_sort),
+        ("Поразр. NumPy", radix_sort_numpy),
+    ]
+    print(f"{'Диапазон':>14}" + "".join(f"{name:>15}" for name, _ in algorithms))
+    
+    for key_range in [10, 100, 1000, 10_000, 100_000, 10 ** 6, 10 ** 9, 10 ** 18]:
+        arr = [random.randint(-key_range // 2, key_range // 2) for _ in range(size)]
+        row = f"{key_range:>14.0e}"
+        for name, func in algorithms:
+            # Подсчет с огромным диапазоном требует слишком много памяти
+            if func is counting_sort and key_range > 10 * size:
+                row += f"{'-':>15}"
+                continue
+            if func is radix_sort_numpy and func(arr[:2]) is None:
+                row += f"{'нет NumPy':>15}"
+                continue
+            row += f"{measure_sort_time(func, arr):>15.4f}"
+        print(row)
+
+
+def benchmark_smart_sort(sizes=(1000, 100_000)):
+    """
+    Гибридная сортировка против каждого отдельного алгоритма:
+    во сколько раз smart_sort медленнее лучшего на данном входе
+    """
+    print("\nГИБРИДНАЯ СОРТИРОВКА smart_sort")
+    print("=" * 70)
+    
+    data_kinds = [
+        ("Случайный", generate_random),
+        ("Отсортированный", generate_sorted),
+        ("Обратный", generate_reversed),
+        ("Почти отсорт.", generate_almost_sorted),
+        ("Широкие целые", lambda n: [random.randint(-10 ** 12, 10 ** 12) for _ in range(n)]),
+        ("Дробные", lambda n: [random.random() for _ in range(n)]),
+    ]
+    
+    for size in sizes:
+        print(f"\nn = {size}")
+        print(f"{'Данные':<18}{'Выбор':<16}{'smart_sort':>12}{'Лучший':>20}{'Отношение':>12}")
+        for data_name, generate in data_kinds:
+            arr = generate(size)
+            name, _, _ = choose_sort_algorithm(arr)
+            smart_time = measure_sort_time(smart_sort, arr)
+            
+            best_name, best_time = None, None
+            for algo_name, func, quadratic in ALGORITHMS:
+                if quadratic and size > QUADRATIC_SIZE_LIMIT:
+                    continue
+                if func in (counting_sort, radix_sort) and not isinstance(arr[0], int):
+                    continue
+                if func is counting_sort and max(arr) - min(arr) > 10 * size:
+                    continue
+                time_taken = measure_sort_time(func, arr)
+                if best_time is None or time_taken < best_time:
+                    best_name, best_time = algo_name, time_taken
+            
+            ratio = smart_time / best_time if best_time > 0 else 1.0
+            print(f"{data_name:<18}{name:<16}{smart_time:>12.6f}"
+                  f"{best_name + f' {best_time:.6f}':>20}{ratio:>12.2f}")
+
+
+def benchmark_key_sort(size=1_000_000):
+    """
+    Сортировка записей по ключу (key=) против sorted(key=...)
+    Записи - словари, ключ - целое поле score
+    """
+    print(f"\nСОРТИРОВКА ЗАПИСЕЙ ПО КЛЮЧУ (n={size})")
+    print("=" * 50)
+    
+    records = [{"id": i, "score": random.randint(1, 10 ** 6)} for i in range(size)]
+    key = itemgetter("score")
+    expected = sorted(records, key=key)
+    
+    algorithms = [
+        ("sorted(key=...)", lambda arr: sorted(arr, key=key)),
+        ("Timsort", lambda arr: tim_sort(arr, key=key)),
+        ("Слиянием", lambda arr: merge_sort(arr, key=key)),
+        ("Быстрая", lambda arr: quick_sort(arr, key=key)),
+        ("Поразрядная", lambda arr: radix_sort(arr, key=key)),
+        ("argsort (Timsort)", lambda arr: argsort(arr, key=key)),
+        ("argsort (поразр.)", lambda arr: argsort(arr, key=key, algorithm=radix_sort)),
+    ]
+    for name, func in algorithms:
+        data = records.copy()
+        start = time.perf_counter()
+        result = func(data)
+        elapsed = time.perf_counter() - start
+        if name.startswith("argsort"):
+            result = [records[i] for i in result]
+        assert result == expected, name
+        print(f"{name:<20} {elapsed:.4f} сек")
+
+
+def benchmark_selection(size=200_000):
+    """
+    Выбор k наименьших против полной сортировки для k от 1 до n/2
+    Чистые версии (use_numpy=False) и путь через np.partition
+    """
+    print(f"\nВЫБОР И ЧАСТИЧНАЯ СОРТИРОВКА (n={size})")
+    print("=" * 50)
+    
+    arr = [random.randint(1, 10 ** 9) for _ in range(size)]
+    
+    def measure(func):
+        data = arr.copy()
+        start = time.perf_counter()
+        func(data)
+        return time.perf_counter() - start
+    
+    time_quick = measure(quick_sort)
+    time_sorted = measure(sorted)
+    print(f"Полная сортировка: быстрая {time_quick:.4f} сек, "
+          f"sorted() {time_sorted:.4f} сек")
+    
+    print(f"{'k':>8}{'nth_element':>13}{'partial_sort':>14}{'top_k':>10}"
+          f"{'partition (NumPy)':>19}")
+    for k in [1, 10, 100, 1000, 10_000, size // 2]:
+        times = [
+            measure(lambda data: nth_element(data, k - 1, use_numpy=False)),
+            measure(lambda data: partial_sort(data, k, use_numpy=False)),
+            measure(lambda data: top_k(data, k, largest=False, use_numpy=False)),
+            measure(lambda data: partial_sort(data, k)),
+        ]
+        print(f"{k:>8}" + "".join(f"{t:>{w}.4f}" for t, w in zip(times, (13, 14, 10, 19))))
+
+
+def benchmark_string_sorts(size=200_000):
+    """Сортировки строк с длинными общими префиксами против sorted()"""
+    print(f"\nСОРТИРОВКА СТРОК (n={size})")
+    print("=" * 50)
+    
+    algorithms = [
+        ("sorted()", sorted),
+        ("Быстрая", quick_sort),
+        ("Слиянием", merge_sort),
+        ("Трехпутевая поразр.", multikey_quick_sort),
+        ("MSD поразрядная", msd_radix_sort),
+    ]
+    for dist_name, generate in STRING_DISTRIBUTIONS.items():
+        arr = generate(size, seed=42)
+        expected = sorted(arr)
+        print(f"\n{dist_name} (пример: {arr[0]})")
+        for name, func in algorithms:
+            data = arr.copy()
+            start = time.perf_counter()
+            result = func(data)
+            elapsed = time.perf_counter() - start
+            assert result == expected, name
+            print(f"{name:<20} {elapsed:.4f} сек")
+
+
 def run_performance_test():
     """Запуск тестов производительности"""
-    sizes = [100, 500, 1000]
+    sizes = [100, 500, 1000, 10_000, 100_000, 1_000_000]
     
     print("⏱ТЕСТ ПРОИЗВОДИТЕЛЬНОСТИ СОРТИРОВОК")
     print("=" * 50)
@@ -32,21 +381,12 @@ def run_performance_test():
         random_array = generate_random_array(size)
         
         # Замеряем время для каждого алгоритма
-        time_bubble = measure_sort_time(bubble_sort, random_array)
-        time_selection = measure_sort_time(selection_sort, random_array)
-        time_insertion = measure_sort_time(insertion_sort, random_array)
-        
-        print(f"Сортировка пузырьком: {time_bubble:.6f} сек")
-        print(f"Сортировка выбором:   {time_selection:.6f} сек")
-        print(f"Сортировка вставками: {time_insertion:.6f} сек")
+        results = measure_algorithms(random_array)
+        print_results(results)
         
         # Находим самый быстрый
-        times = [time_bubble, time_selection, time_insertion]
-        fastest = min(times)
-        fastest_idx = times.index(fastest)
-        algorithms = ["Пузырьком", "Выбором", "Вставками"]
-        
-        print(f"Самый быстрый: {algorithms[fastest_idx]}")
+        fastest_name, _ = min(results, key=lambda item: item[1])
+        print(f"Самый быстрый: {fastest_name}")
 
 
 def test_worst_case():
@@ -54,18 +394,12 @@ def test_worst_case():
     print("\nТЕСТИРОВАНИЕ ХУДШЕГО СЛУЧАЯ")
     print("=" * 40)
     
-    size = 500
-    # Создаем массив в обратном порядке
-    reversed_array = list(range(size, 0, -1))
-    
-    time_bubble = measure_sort_time(bubble_sort, reversed_array)
-    time_selection = measure_sort_time(selection_sort, reversed_array)
-    time_insertion = measure_sort_time(insertion_sort, reversed_array)
-    
-    print(f"Массив {size} элементов в обратном порядке:")
-    print(f"Пузырьком:    {time_bubble:.6f} сек")
-    print(f"Выбором:      {time_selection:.6f} сек")
-    print(f"Вставками:    {time_insertion:.6f} сек")
+    for size in [500, 10_000, 1_000_000]:
+        # Создаем массив в обратном порядке
+        reversed_array = list(range(size, 0, -1))
+        
+        print(f"\nМассив {size} элементов в обратном порядке:")
+        print_results(measure_algorithms(reversed_array))
 
 
 def test_best_case():
@@ -73,21 +407,22 @@ def test_best_case():
     print("\nТЕСТИРОВАНИЕ ЛУЧШЕГО СЛУЧАЯ")
     print("=" * 40)
     
-    size = 500
-    # Создаем уже отсортированный массив
-    sorted_array = list(range(1, size + 1))
-    
-    time_bubble = measure_sort_time(bubble_sort, sorted_array)
-    time_selection = measure_sort_time(selection_sort, sorted_array)
-    time_insertion = measure_sort_time(insertion_sort, sorted_array)
-    
-    print(f"Массив {size} элементов уже отсортирован:")
-    print(f"Пузырьком:    {time_bubble:.6f} сек")
-    print(f"Выбором:      {time_selection:.6f} сек")
-    print(f"Вставками:    {time_insertion:.6f} сек")
+    for size in [500, 10_000, 1_000_000]:
+        # Создаем уже отсортированный массив
+        sorted_array = list(range(1, size + 1))
+        
+        print(f"\nМассив {size} элементов уже отсортирован:")
+        print_results(measure_algorithms(sorted_array))
 
 
 if __name__ == "__main__":
     run_performance_test()
     test_worst_case()
-    test_best_case()
\ No newline at end of file
+    test_best_case()
+    benchmark_insertion_family()
+    benchmark_adaptive_sort()
+    benchmark_integer_sorts()
+    benchmark_smart_sort()
+    benchmark_key_sort()
+    benchmark_selection()
+    benchmark_string_sorts()
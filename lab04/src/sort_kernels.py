@@ -0,0 +1,199 @@
+"""
+Ядра сортировки коротких участков для гибридных сортировок.
+
+Рекурсивные сортировки в конце концов упираются в крошечные участки,
+где время уходит на вызовы и циклы интерпретатора, а не на сравнения.
+
+  - сети сортировки для n <= 16: сеть Бэтчера (четно-нечетное слияние)
+    разворачивается в линейный код без циклов, элементы живут в локальных
+    переменных, каждый компаратор - одно сравнение и обмен
+  - вставки для n <= 64: позиция ищется бинарным поиском (bisect на C),
+    сдвиг - одно присваивание среза
+
+Порог перехода на эти ядра (INSERTION_THRESHOLD в sorts.py) подбирается
+замером на конкретной машине (autotune_cutoff) и сохраняется в JSON.
+"""
+
+import json
+import os
+import platform
+import random
+import time
+from bisect import bisect_right
+
+MAX_NETWORK_SIZE = 16  # Наибольший размер, для которого строится сеть
+MAX_INSERTION_SIZE = 64  # Выше вставки уже проигрывают слиянию/разбиению
+
+# Файл с подобранным порогом (создается autotune_cutoff)
+TUNING_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sort_tuning.json")
+
+CUTOFF_CANDIDATES = (4, 8, 12, 16, 24, 32, 48, 64)
+
+
+def batcher_network(n):
+    """
+    Компараторы (i, j), i < j, сети четно-нечетного слияния Бэтчера для n входов
+    Число компараторов: O(n log² n), для n = 16 - 63
+    """
+    pairs = []
+    p = 1
+    while p < n:
+        k = p
+        while k >= 1:
+            for j in range(k % p, n - k, 2 * k):
+                for i in range(min(k, n - j - k)):
+                    # Сравниваем только элементы одного сливаемого блока 2p
+                    if (i + j) // (2 * p) == (i + j + k) // (2 * p):
+                        pairs.append((i + j, i + j + k))
+            k //= 2
+        p *= 2
+    return pairs
+
+
+def _compile_network(n):
+    """
+    Функция kernel(arr, lo), сортирующая arr[lo:lo + n] сетью Бэтчера
+    Код генерируется как линейная последовательность сравнений
+    """
+    if n < 2:
+        return lambda arr, lo: None
+    names = ", ".join(f"x{i}" for i in range(n))
+    lines = ["def kernel(arr, lo):",
+             f"    {names} = arr[lo:lo + {n}]"]
+    for i, j in batcher_network(n):
+        lines.append(f"    if x{j} < x{i}: x{i}, x{j} = x{j}, x{i}")
+    lines.append(f"    arr[lo:lo + {n}] = {names},")
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    kernel = namespace["kernel"]
+    kernel.__name__ = f"network_sort_{n}"
+    return kernel
+
+
+# NETWORK_KERNELS[n] сортирует ровно n элементов
+NETWORK_KERNELS = [_compile_network(n) for n in range(MAX_NETWORK_SIZE + 1)]
+
+
+def network_sort_range(arr, lo, hi):
+    """
+    Сортировка arr[lo:hi] сетью сортировки (hi - lo <= 16)
+    Временная сложность: O(log² n) слоев, O(n log² n) сравнений
+    Устойчивость: нет
+    """
+    NETWORK_KERNELS[hi - lo](arr, lo)
+
+
+def insertion_sort_small(arr, lo, hi):
+    """
+    Вставки для коротких участков arr[lo:hi]: бинарный поиск позиции
+    и сдвиг срезом. Уже стоящие на месте элементы пропускаются без сдвига
+    Временная сложность: O(n log n) сравнений, O(n²) перемещений (memmove)
+    Устойчивость: да
+    """
+    for i in range(lo + 1, hi):
+        item = arr[i]
+        if not item < arr[i - 1]:
+            continue
+        pos = bisect_right(arr, item, lo, i - 1)
+        arr[pos + 1:i + 1] = arr[pos:i]
+        arr[pos] = item
+
+
+def small_sort(arr, lo, hi):
+    """Неустойчивая сортировка короткого участка: сеть или вставки"""
+    if hi - lo <= MAX_NETWORK_SIZE:
+        NETWORK_KERNELS[hi - lo](arr, lo)
+    else:
+        insertion_sort_small(arr, lo, hi)
+
+
+def load_cutoff(default, path=TUNING_PATH):
+    """Порог из файла настройки или default, если файла нет или он испорчен"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            cutoff = int(json.load(f)["insertion_threshold"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return default
+    return min(max(cutoff, 2), MAX_INSERTION_SIZE)
+
+
+def autotune_cutoff(candidates=CUTOFF_CANDIDATES, size=20_000, repeats=5,
+                    path=TUNING_PATH, verbose=True):
+    """
+    Подбор порога перехода на короткие ядра для этой машины
+    Для каждого кандидата замеряются быстрая сортировка и сортировка
+    слиянием на случайных данных, выбирается минимум суммарного времени.
+    Результат сохраняется в path (path=None - не сохранять) и сразу
+    применяется в sorts.INSERTION_THRESHOLD
+    Возвращает выбранный порог
+    """
+    import sorts
+
+    rng = random.Random(42)
+    data = [rng.random() for _ in range(size)]
+    timings = {}
+    for cutoff in candidates:
+        best = {}
+        for name, func in (("quick_sort", sorts.quick_sort), ("merge_sort", sorts.merge_sort)):
+            times = []
+            for _ in range(repeats):
+                arr = data.copy()
+                start = time.perf_counter_ns()
+                func(arr, cutoff=cutoff)
+                times.append(time.perf_counter_ns() - start)
+            best[name] = min(times)
+        timings[cutoff] = best
+        if verbose:
+            print(f"порог {cutoff:>3}: быстрая {best['quick_sort'] / 1e6:8.3f} мс, "
+                  f"слиянием {best['merge_sort'] / 1e6:8.3f} мс")
+
+    chosen = min(candidates, key=lambda c: sum(timings[c].values()))
+    sorts.INSERTION_THRESHOLD = chosen
+    if path is not None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({
+                "insertion_threshold": chosen,
+                "python": platform.python_version(),
+                "implementation": platform.python_implementation(),
+                "machine": platform.machine(),
+                "size": size,
+                "timings_ns": {str(c): t for c, t in timings.items()},
+            }, f, ensure_ascii=False, indent=2)
+    if verbose:
+        print(f"Выбран порог: {chosen}" + (f" (сохранен в {path})" if path else ""))
+    return chosen
+
+
+def benchmark_kernels(sizes=(2, 4, 8, 12, 16, 24, 32, 48, 64), blocks=2000):
+    """Время на один короткий участок: сеть, вставки, бинарные вставки, sorted()"""
+    from sorts import _insertion_sort_range
+
+    print("ЯДРА ДЛЯ КОРОТКИХ УЧАСТКОВ (мкс на участок)")
+    print("=" * 60)
+    print(f"{'n':>4}{'Сеть':>10}{'Вставки':>10}{'Бинарные':>10}{'sorted()':>10}")
+
+    def slice_sorted(arr, lo, hi):
+        arr[lo:hi] = sorted(arr[lo:hi])
+
+    rng = random.Random(1)
+    for n in sizes:
+        data = [rng.random() for _ in range(n * blocks)]
+        kernels = [network_sort_range if n <= MAX_NETWORK_SIZE else None,
+                   _insertion_sort_range, insertion_sort_small, slice_sorted]
+        row = f"{n:>4}"
+        for kernel in kernels:
+            if kernel is None:
+                row += f"{'-':>10}"
+                continue
+            arr = data.copy()
+            start = time.perf_counter()
+            for lo in range(0, len(arr), n):
+                kernel(arr, lo, lo + n)
+            row += f"{(time.perf_counter() - start) / blocks * 1e6:>10.2f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    benchmark_kernels()
+    print()
+    autotune_cutoff()
@@ -1,3 +1,125 @@
+import functools
+import heapq
+import logging
+import operator
+from array import array
+from bisect import bisect_left, bisect_right
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необязателен - без него работают чистые версии
+    np = None
+
+from sort_kernels import insertion_sort_small, load_cutoff, small_sort
+
+logger = logging.getLogger(__name__)
+
+
+# Поддержка key= и reverse= (преобразование Шварца)
+#
+# Ключи вычисляются один раз на элемент. Сортируются пары (ключ, индекс),
+# индекс - ссылка на элемент исходного массива, поэтому сами записи
+# не сравниваются и не перемещаются до последнего шага. Индекс разрешает
+# равенство ключей, так что в режиме key/reverse устойчив любой алгоритм,
+# а reverse=True сохраняет исходный порядок равных, как sorted().
+
+def _keys_of(arr, key):
+    """Ключи всех элементов, вычисленные один раз"""
+    return list(map(key, arr)) if key is not None else list(arr)
+
+
+def _decorated_argsort(sort_func, arr, key, reverse, *args, **kwargs):
+    """Перестановка индексов для сортировок сравнением"""
+    keys = _keys_of(arr, key)
+    if reverse:
+        # По возрастанию (ключ, -индекс), затем разворот: равные ключи
+        # остаются в исходном порядке
+        decorated = [(k, -i) for i, k in enumerate(keys)]
+        sort_func(decorated, *args, **kwargs)
+        return [-i for _, i in reversed(decorated)]
+    decorated = list(zip(keys, range(len(keys))))
+    sort_func(decorated, *args, **kwargs)
+    return [i for _, i in decorated]
+
+
+# Подсчет выделяет массив на весь диапазон ключей: если он больше n
+# в столько раз, сортировка подсчетом уступает место поразрядной
+COUNTING_MAX_RANGE_FACTOR = 10
+
+
+def _counting_argsort(sort_func, arr, key, reverse, *args, **kwargs):
+    """Устойчивая перестановка подсчетом для целых ключей"""
+    keys = _keys_of(arr, key)
+    if reverse:
+        keys = [-k for k in keys]
+    if not keys:
+        return []
+    lo = min(keys)
+    if max(keys) - lo > COUNTING_MAX_RANGE_FACTOR * len(keys):
+        return _radix_argsort(radix_sort, keys, None, False)
+    positions = [0] * (max(keys) - lo + 2)
+    for k in keys:
+        positions[k - lo + 1] += 1
+    for digit in range(1, len(positions)):
+        positions[digit] += positions[digit - 1]
+    order = [0] * len(keys)
+    for i, k in enumerate(keys):
+        order[positions[k - lo]] = i
+        positions[k - lo] += 1
+    return order
+
+
+def _radix_argsort(sort_func, arr, key, reverse, *args, **kwargs):
+    """
+    Перестановка поразрядной сортировкой для целых ключей:
+    сортируются числа ключ * n + индекс, индекс восстанавливается по модулю n
+    """
+    keys = _keys_of(arr, key)
+    n = len(keys)
+    if reverse:
+        keys = [-k for k in keys]
+    combined = [k * n + i for i, k in enumerate(keys)]
+    sort_func(combined, *args, **kwargs)
+    return [c % n for c in combined]
+
+
+def _string_argsort(sort_func, arr, key, reverse, *args, **kwargs):
+    """
+    Перестановка для строковых сортировок: сортируются только различные
+    ключи, индексы равных выдаются в исходном порядке
+    """
+    groups = {}
+    for i, k in enumerate(_keys_of(arr, key)):
+        groups.setdefault(k, []).append(i)
+    distinct = sort_func(list(groups), *args, **kwargs)
+    if reverse:
+        distinct.reverse()
+    return [i for k in distinct for i in groups[k]]
+
+
+def _with_key(argsort_impl):
+    """
+    Декоратор: добавляет сортировке параметры key и reverse
+    и атрибут argsort(arr, key=None, reverse=False) - перестановку индексов
+    """
+    def decorate(sort_func):
+        @functools.wraps(sort_func)
+        def wrapper(arr, *args, key=None, reverse=False, **kwargs):
+            if key is None and not reverse:
+                return sort_func(arr, *args, **kwargs)
+            order = argsort_impl(sort_func, arr, key, reverse, *args, **kwargs)
+            arr[:] = [arr[i] for i in order]
+            return arr
+        
+        def argsort_method(arr, *args, key=None, reverse=False, **kwargs):
+            return argsort_impl(sort_func, arr, key, reverse, *args, **kwargs)
+        
+        wrapper.argsort = argsort_method
+        return wrapper
+    return decorate
+
+
+@_with_key(_decorated_argsort)
 def bubble_sort(arr):
     """
     Сортировка пузырьком
@@ -23,6 +145,7 @@ def bubble_sort(arr):
     return arr
 
 
+@_with_key(_decorated_argsort)
 def selection_sort(arr):
     """
     Сортировка выбором
@@ -44,6 +167,7 @@ def selection_sort(arr):
     return arr
 
 
+@_with_key(_decorated_argsort)
 def insertion_sort(arr):
     """
     Сортировка вставками
@@ -65,6 +189,1085 @@ def insertion_sort(arr):
     return arr
 
 
+@_with_key(_decorated_argsort)
+def binary_insertion_sort(arr):
+    """
+    Сортировка бинарными вставками
+    Позиция вставки ищется бинарным поиском (bisect), сдвиг - одним срезом
+    Временная сложность:
+      - сравнений: O(n log n) во всех случаях
+      - перемещений: O(n²) в худшем, но сдвиг срезом выполняется на уровне C
+    Пространственная сложность: O(1)
+    Устойчивость: да
+    """
+    _binary_insertion_sort_range(arr, 0, len(arr), 1)
+    return arr
+
+
+def _ciura_gaps(n):
+    """Последовательность Циуры, продолженная умножением на 2.25"""
+    gaps = [1, 4, 10, 23, 57, 132, 301, 701, 1750]
+    while gaps[-1] < n:
+        gaps.append(int(gaps[-1] * 2.25))
+    return gaps
+
+
+def _tokuda_gaps(n):
+    """Последовательность Токуды: ceil((9^k - 4^k) / (5 * 4^(k-1)))"""
+    gaps = []
+    k = 1
+    while True:
+        gap = -(-(9 ** k - 4 ** k) // (5 * 4 ** (k - 1)))
+        if gap >= n and gaps:
+            return gaps
+        gaps.append(gap)
+        k += 1
+
+
+def _sedgewick_gaps(n):
+    """Последовательность Седжвика (1986): 4^k + 3 * 2^(k-1) + 1 и 1"""
+    gaps = [1]
+    k = 1
+    while True:
+        gap = 4 ** k + 3 * 2 ** (k - 1) + 1
+        if gap >= n:
+            return gaps
+        gaps.append(gap)
+        k += 1
+
+
+SHELL_GAPS = {
+    "ciura": _ciura_gaps,
+    "tokuda": _tokuda_gaps,
+    "sedgewick": _sedgewick_gaps,
+}
+
+
+@_with_key(_decorated_argsort)
+def shell_sort(arr, gaps="ciura"):
+    """
+    Сортировка Шелла: вставки с убывающим шагом
+    gaps - последовательность шагов: "ciura", "tokuda" или "sedgewick"
+    Временная сложность (зависит от шагов):
+      - Лучший: O(n log n)
+      - Средний: около O(n^1.25) для Циуры и Токуды
+      - Худший: O(n^(4/3)) для Седжвика
+    Пространственная сложность: O(1)
+    Устойчивость: нет
+    """
+    if gaps not in SHELL_GAPS:
+        raise ValueError(f"Неизвестная последовательность шагов: {gaps}")
+    n = len(arr)
+    for gap in reversed([g for g in SHELL_GAPS[gaps](n) if g < n]):
+        # Сортировка вставками с шагом gap
+        for i in range(gap, n):
+            key = arr[i]
+            j = i - gap
+            while j >= 0 and key < arr[j]:
+                arr[j + gap] = arr[j]
+                j -= gap
+            arr[j + gap] = key
+    return arr
+
+
+# Подмассивы не длиннее этого порога досортировываются короткими ядрами
+# (sort_kernels). Значение по умолчанию заменяется подобранным для машины,
+# если есть файл настройки (sort_kernels.autotune_cutoff). Сортировки
+# читают порог при каждом вызове, параметр cutoff задает его явно
+INSERTION_THRESHOLD = load_cutoff(16)
+
+
+def _insertion_sort_range(arr, lo, hi):
+    """Сортировка вставками участка arr[lo:hi]"""
+    for i in range(lo + 1, hi):
+        key = arr[i]
+        j = i - 1
+        while j >= lo and key < arr[j]:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = key
+
+
+def _merge(arr, buf, lo, mid, hi):
+    """
+    Слияние отсортированных участков arr[lo:mid] и arr[mid:hi]
+    Левая половина копируется в буфер, правая остается на месте
+    """
+    if not arr[mid] < arr[mid - 1]:  # Участки уже упорядочены
+        return
+    buf[lo:mid] = arr[lo:mid]
+    i, j, k = lo, mid, lo
+    while i < mid and j < hi:
+        # При равенстве берем из левой половины - сортировка устойчива
+        if arr[j] < buf[i]:
+            arr[k] = arr[j]
+            j += 1
+        else:
+            arr[k] = buf[i]
+            i += 1
+        k += 1
+    # Остаток правой половины уже на своем месте
+    arr[k:k + mid - i] = buf[i:mid]
+
+
+def _merge_sort(arr, buf, lo, hi, cutoff):
+    if hi - lo <= cutoff:
+        insertion_sort_small(arr, lo, hi)  # Устойчиво - сети не подходят
+        return
+    mid = (lo + hi) // 2
+    _merge_sort(arr, buf, lo, mid, cutoff)
+    _merge_sort(arr, buf, mid, hi, cutoff)
+    _merge(arr, buf, lo, mid, hi)
+
+
+@_with_key(_decorated_argsort)
+def merge_sort(arr, cutoff=None):
+    """
+    Сортировка слиянием (нисходящая, рекурсивная)
+    cutoff - порог перехода на вставки (по умолчанию INSERTION_THRESHOLD)
+    Временная сложность:
+      - Лучший: O(n) - уже отсортирован (слияния пропускаются)
+      - Средний: O(n log n)
+      - Худший: O(n log n)
+    Пространственная сложность: O(n) - один общий буфер
+    """
+    if len(arr) > 1:
+        cutoff = INSERTION_THRESHOLD if cutoff is None else cutoff
+        _merge_sort(arr, [None] * len(arr), 0, len(arr), max(cutoff, 1))
+    return arr
+
+
+@_with_key(_decorated_argsort)
+def merge_sort_bottom_up(arr, cutoff=None):
+    """
+    Сортировка слиянием (восходящая, без рекурсии)
+    cutoff - длина блоков, сортируемых вставками (по умолчанию INSERTION_THRESHOLD)
+    Временная сложность: O(n log n) во всех случаях
+    Пространственная сложность: O(n)
+    """
+    n = len(arr)
+    width = max(INSERTION_THRESHOLD if cutoff is None else cutoff, 1)
+    # Сначала сортируем вставками короткие блоки
+    for lo in range(0, n, width):
+        insertion_sort_small(arr, lo, min(lo + width, n))
+    
+    buf = [None] * n
+    while width < n:
+        # Сливаем соседние блоки ширины width
+        for lo in range(0, n - width, 2 * width):
+            _merge(arr, buf, lo, lo + width, min(lo + 2 * width, n))
+        width *= 2
+    return arr
+
+
+def _sift_down(arr, lo, root, end):
+    """Погружение элемента в max-куче, занимающей arr[lo:end]"""
+    item = arr[root]
+    while True:
+        child = lo + 2 * (root - lo) + 1
+        if child >= end:
+            break
+        # Выбираем большего из детей
+        if child + 1 < end and arr[child] < arr[child + 1]:
+            child += 1
+        if not item < arr[child]:
+            break
+        arr[root] = arr[child]
+        root = child
+    arr[root] = item
+
+
+def _heap_sort_range(arr, lo, hi):
+    """Пирамидальная сортировка участка arr[lo:hi]"""
+    # Построение max-кучи
+    for root in range(lo + (hi - lo) // 2 - 1, lo - 1, -1):
+        _sift_down(arr, lo, root, hi)
+    # Переносим максимум в конец и восстанавливаем кучу
+    for end in range(hi - 1, lo, -1):
+        arr[lo], arr[end] = arr[end], arr[lo]
+        _sift_down(arr, lo, lo, end)
+
+
+@_with_key(_decorated_argsort)
+def heap_sort(arr):
+    """
+    Пирамидальная сортировка (heapsort)
+    Временная сложность: O(n log n) во всех случаях
+    Пространственная сложность: O(1)
+    Устойчивость: нет
+    """
+    _heap_sort_range(arr, 0, len(arr))
+    return arr
+
+
+def _partition(arr, lo, hi):
+    """
+    Разбиение Хоара участка arr[lo..hi] (включительно)
+    Опорный элемент - медиана трех (первого, среднего и последнего)
+    Возвращает j: arr[lo..j] <= опорного <= arr[j+1..hi]
+    """
+    mid = (lo + hi) // 2
+    # Упорядочиваем три элемента, медиана оказывается в arr[mid]
+    if arr[mid] < arr[lo]:
+        arr[lo], arr[mid] = arr[mid], arr[lo]
+    if arr[hi] < arr[mid]:
+        arr[mid], arr[hi] = arr[hi], arr[mid]
+        if arr[mid] < arr[lo]:
+            arr[lo], arr[mid] = arr[mid], arr[lo]
+    # Ставим медиану в начало и делим как в классической схеме Хоара
+    arr[lo], arr[mid] = arr[mid], arr[lo]
+    return _hoare_partition(arr, lo, hi)
+
+
+def _hoare_partition(arr, lo, hi):
+    """
+    Разбиение Хоара участка arr[lo..hi] с опорным элементом arr[lo]
+    Возвращает j (lo <= j < hi): arr[lo..j] <= опорного <= arr[j+1..hi]
+    """
+    pivot = arr[lo]
+    i = lo - 1
+    j = hi + 1
+    while True:
+        i += 1
+        while arr[i] < pivot:
+            i += 1
+        j -= 1
+        while pivot < arr[j]:
+            j -= 1
+        if i >= j:
+            return j
+        arr[i], arr[j] = arr[j], arr[i]
+
+
+def _introsort(arr, lo, hi, depth_limit, cutoff):
+    """Интроспективная сортировка участка arr[lo..hi] (включительно)"""
+    while hi - lo + 1 > cutoff:
+        if depth_limit == 0:
+            # Слишком глубокая рекурсия - неудачные опорные элементы
+            _heap_sort_range(arr, lo, hi + 1)
+            return
+        depth_limit -= 1
+        p = _partition(arr, lo, hi)
+        # Рекурсия в меньшую часть, цикл по большей - стек O(log n)
+        if p - lo < hi - p:
+            _introsort(arr, lo, p, depth_limit, cutoff)
+            lo = p + 1
+        else:
+            _introsort(arr, p + 1, hi, depth_limit, cutoff)
+            hi = p
+    small_sort(arr, lo, hi + 1)
+
+
+@_with_key(_decorated_argsort)
+def quick_sort(arr, cutoff=None):
+    """
+    Быстрая сортировка (интроспективная)
+      - опорный элемент: медиана трех
+      - при глубине рекурсии > 2 log2(n) переход на пирамидальную сортировку
+      - участки не длиннее cutoff (по умолчанию INSERTION_THRESHOLD)
+        досортировываются сетями сортировки или вставками
+    Временная сложность:
+      - Лучший: O(n log n)
+      - Средний: O(n log n)
+      - Худший: O(n log n) - благодаря переходу на heapsort
+    Пространственная сложность: O(log n)
+    Устойчивость: нет
+    """
+    n = len(arr)
+    if n > 1:
+        cutoff = INSERTION_THRESHOLD if cutoff is None else cutoff
+        _introsort(arr, 0, n - 1, 2 * n.bit_length(), max(cutoff, 2))
+    return arr
+
+
+# Порог перехода в режим галопа при слиянии (как в Timsort)
+MIN_GALLOP = 7
+
+
+def _min_run(n):
+    """
+    Минимальная длина серии: от 32 до 64, так чтобы n / min_run
+    было равно или чуть меньше степени двойки
+    """
+    r = 0
+    while n >= 64:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+
+def _count_run(arr, lo, hi):
+    """
+    Длина естественной серии, начинающейся в arr[lo]
+    Строго убывающая серия разворачивается на месте (строгость нужна
+    для устойчивости - равные элементы не меняются местами)
+    """
+    run_hi = lo + 1
+    if run_hi == hi:
+        return 1
+    if arr[run_hi] < arr[lo]:  # Убывающая серия
+        run_hi += 1
+        while run_hi < hi and arr[run_hi] < arr[run_hi - 1]:
+            run_hi += 1
+        arr[lo:run_hi] = arr[lo:run_hi][::-1]
+    else:  # Неубывающая серия
+        run_hi += 1
+        while run_hi < hi and not arr[run_hi] < arr[run_hi - 1]:
+            run_hi += 1
+    return run_hi - lo
+
+
+def _binary_insertion_sort_range(arr, lo, hi, start):
+    """
+    Бинарные вставки: участок arr[lo:start] уже отсортирован,
+    остальные элементы до hi вставляются по одному.
+    Позиция ищется бинарным поиском, сдвиг делается срезом.
+    """
+    for i in range(max(start, lo + 1), hi):
+        item = arr[i]
+        pos = bisect_right(arr, item, lo, i)  # После равных - устойчиво
+        if pos < i:
+            arr[pos + 1:i + 1] = arr[pos:i]
+            arr[pos] = item
+
+
+def _gallop_left(key, seq, lo, hi):
+    """
+    Экспоненциальный поиск от левого края: bisect_left(seq, key, lo, hi)
+    Сложность: O(log d), где d - расстояние до ответа
+    """
+    last, ofs = lo, 1
+    while lo + ofs - 1 < hi and seq[lo + ofs - 1] < key:
+        last = lo + ofs
+        ofs <<= 1
+    return bisect_left(seq, key, last, min(lo + ofs - 1, hi))
+
+
+def _gallop_right(key, seq, lo, hi):
+    """Экспоненциальный поиск от левого края: bisect_right(seq, key, lo, hi)"""
+    last, ofs = lo, 1
+    while lo + ofs - 1 < hi and not key < seq[lo + ofs - 1]:
+        last = lo + ofs
+        ofs <<= 1
+    return bisect_right(seq, key, last, min(lo + ofs - 1, hi))
+
+
+def _gallop_left_from_end(key, seq, lo, hi):
+    """Экспоненциальный поиск от правого края: bisect_left(seq, key, lo, hi)"""
+    last, ofs = hi, 1
+    while hi - ofs >= lo and not seq[hi - ofs] < key:
+        last = hi - ofs
+        ofs <<= 1
+    return bisect_left(seq, key, max(lo, hi - ofs + 1), last)
+
+
+def _gallop_right_from_end(key, seq, lo, hi):
+    """Экспоненциальный поиск от правого края: bisect_right(seq, key, lo, hi)"""
+    last, ofs = hi, 1
+    while hi - ofs >= lo and key < seq[hi - ofs]:
+        last = hi - ofs
+        ofs <<= 1
+    return bisect_right(seq, key, max(lo, hi - ofs + 1), last)
+
+
+class _TimSortState:
+    """Общее состояние Timsort: стек серий, буфер и порог галопа"""
+    
+    def __init__(self, arr):
+        self.arr = arr
+        self.runs = []  # Стек серий (начало, длина)
+        self.buf = []  # Единственный временный буфер, растет по мере надобности
+        self.min_gallop = MIN_GALLOP
+    
+    def _ensure_buf(self, size):
+        if len(self.buf) < size:
+            self.buf.extend([None] * (size - len(self.buf)))
+    
+    def merge_at(self, i):
+        """Слияние серий i и i + 1 на стеке"""
+        arr = self.arr
+        lo, len_a = self.runs[i]
+        mid, len_b = self.runs[i + 1]
+        self.runs[i] = (lo, len_a + len_b)
+        del self.runs[i + 1]
+        hi = mid + len_b
+        
+        # Начало A, не превосходящее B[0], уже на месте
+        lo = _gallop_right(arr[mid], arr, lo, mid)
+        if lo == mid:
+            return
+        # Конец B, не меньший A[-1], тоже уже на месте
+        hi = _gallop_left(arr[mid - 1], arr, mid, hi)
+        if hi == mid:
+            return
+        # В буфер копируется меньшая из серий
+        if mid - lo <= hi - mid:
+            self._merge_lo(lo, mid, hi)
+        else:
+            self._merge_hi(lo, mid, hi)
+    
+    def _merge_lo(self, lo, mid, hi):
+        """Слияние слева направо, серия A = arr[lo:mid] копируется в буфер"""
+        arr = self.arr
+        len_a = mid - lo
+        self._ensure_buf(len_a)
+        buf = self.buf
+        buf[:len_a] = arr[lo:mid]
+        i, j, k = 0, mid, lo
+        min_gallop = self.min_gallop
+        
+        while i < len_a and j < hi:
+            # Поэлементное слияние, пока одна серия не "выигрывает" подряд
+            count_a = count_b = 0
+            while i < len_a and j < hi:
+                if arr[j] < buf[i]:
+                    arr[k] = arr[j]
+                    j += 1
+                    count_b += 1
+                    count_a = 0
+                else:
+                    arr[k] = buf[i]
+                    i += 1
+                    count_a += 1
+                    count_b = 0
+                k += 1
+                if count_a >= min_gallop or count_b >= min_gallop:
+                    break
+            
+            # Режим галопа: переносим сразу целые блоки
+            while i < len_a and j < hi:
+                p = _gallop_right(arr[j], buf, i, len_a)
+                count_a = p - i
+                if count_a:
+                    arr[k:k + count_a] = buf[i:p]
+                    k += count_a
+                    i = p
+                    if i == len_a:
+                        break
+                arr[k] = arr[j]
+                k += 1
+                j += 1
+                if j == hi:
+                    break
+                
+                p = _gallop_left(buf[i], arr, j, hi)
+                count_b = p - j
+                if count_b:
+                    arr[k:k + count_b] = arr[j:p]
+                    k += count_b
+                    j = p
+                    if j == hi:
+                        break
+                arr[k] = buf[i]
+                k += 1
+                i += 1
+                
+                if count_a < MIN_GALLOP and count_b < MIN_GALLOP:
+                    min_gallop += 1  # Галоп не окупается - выходим из него
+                    break
+                min_gallop = max(1, min_gallop - 1)
+        
+        self.min_gallop = min_gallop
+        # Остаток B уже на месте, остаток A переносим из буфера
+        if i < len_a:
+            arr[k:k + len_a - i] = buf[i:len_a]
+    
+    def _merge_hi(self, lo, mid, hi):
+        """Слияние справа налево, серия B = arr[mid:hi] копируется в буфер"""
+        arr = self.arr
+        len_b = hi - mid
+        self._ensure_buf(len_b)
+        buf = self.buf
+        buf[:len_b] = arr[mid:hi]
+        i, j, k = mid - 1, len_b - 1, hi - 1
+        min_gallop = self.min_gallop
+        
+        while i >= lo and j >= 0:
+            count_a = count_b = 0
+            while i >= lo and j >= 0:
+                if buf[j] < arr[i]:
+                    arr[k] = arr[i]
+                    i -= 1
+                    count_a += 1
+                    count_b = 0
+                else:
+                    arr[k] = buf[j]
+                    j -= 1
+                    count_b += 1
+                    count_a = 0
+                k -= 1
+                if count_a >= min_gallop or count_b >= min_gallop:
+                    break
+            
+            while i >= lo and j >= 0:
+                # Элементы A, строго большие B[j], уходят в конец
+                p = _gallop_right_from_end(buf[j], arr, lo, i + 1)
+                count_a = i + 1 - p
+                if count_a:
+                    arr[k - count_a + 1:k + 1] = arr[p:i + 1]
+                    k -= count_a
+                    i = p - 1
+                    if i < lo:
+                        break
+                arr[k] = buf[j]
+                k -= 1
+                j -= 1
+                if j < 0:
+                    break
+                
+                # Элементы B, не меньшие A[i], уходят в конец
+                p = _gallop_left_from_end(arr[i], buf, 0, j + 1)
+                count_b = j + 1 - p
+                if count_b:
+                    arr[k - count_b + 1:k + 1] = buf[p:j + 1]
+                    k -= count_b
+                    j = p - 1
+                    if j < 0:
+                        break
+                arr[k] = arr[i]
+                k -= 1
+                i -= 1
+                
+                if count_a < MIN_GALLOP and count_b < MIN_GALLOP:
+                    min_gallop += 1
+                    break
+                min_gallop = max(1, min_gallop - 1)
+        
+        self.min_gallop = min_gallop
+        # Остаток A уже на месте, остаток B переносим из буфера
+        if j >= 0:
+            arr[lo:lo + j + 1] = buf[:j + 1]
+    
+    def merge_collapse(self):
+        """
+        Поддержание инвариантов стека серий (A > B + C, B > C),
+        благодаря которым слияния сбалансированы, а стек имеет глубину O(log n)
+        """
+        runs = self.runs
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if ((n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1])
+                    or (n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1])):
+                if runs[n - 1][1] < runs[n + 1][1]:
+                    n -= 1
+                self.merge_at(n)
+            elif runs[n][1] <= runs[n + 1][1]:
+                self.merge_at(n)
+            else:
+                break
+    
+    def merge_force_collapse(self):
+        """Слияние всех оставшихся серий в конце сортировки"""
+        runs = self.runs
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if n > 0 and runs[n - 1][1] < runs[n + 1][1]:
+                n -= 1
+            self.merge_at(n)
+
+
+@_with_key(_decorated_argsort)
+def tim_sort(arr):
+    """
+    Адаптивная сортировка слиянием естественных серий (в стиле Timsort)
+      - находит возрастающие и убывающие серии (убывающие разворачивает)
+      - короткие серии дополняет бинарными вставками до min_run
+      - сливает серии с галопом и одним общим временным буфером
+    Временная сложность:
+      - Лучший: O(n) - отсортированный или обратный массив
+      - Средний: O(n log n)
+      - Худший: O(n log n)
+    Пространственная сложность: O(n)
+    Устойчивость: да
+    """
+    n = len(arr)
+    if n < 2:
+        return arr
+    
+    state = _TimSortState(arr)
+    min_run = _min_run(n)
+    lo = 0
+    while lo < n:
+        run_len = _count_run(arr, lo, n)
+        if run_len < min_run:
+            # Короткая серия - дополняем бинарными вставками
+            forced = min(min_run, n - lo)
+            _binary_insertion_sort_range(arr, lo, lo + forced, lo + run_len)
+            run_len = forced
+        state.runs.append((lo, run_len))
+        state.merge_collapse()
+        lo += run_len
+    state.merge_force_collapse()
+    return arr
+
+
+@_with_key(_counting_argsort)
+def counting_sort(arr):
+    """
+    Сортировка подсчетом (только целые числа, в том числе отрицательные)
+    Диапазон ключей k = max - min + 1 определяется автоматически;
+    при k > COUNTING_MAX_RANGE_FACTOR * n сортирует radix_sort
+    Временная сложность: O(n + k)
+    Пространственная сложность: O(k)
+    """
+    if len(arr) < 2:
+        return arr
+    lo = min(arr)
+    if max(arr) - lo > COUNTING_MAX_RANGE_FACTOR * len(arr):
+        return radix_sort(arr)
+    counts = [0] * (max(arr) - lo + 1)
+    for x in arr:
+        counts[x - lo] += 1
+    
+    pos = 0
+    for offset, count in enumerate(counts):
+        if count:
+            arr[pos:pos + count] = [offset + lo] * count
+            pos += count
+    return arr
+
+
+# Начиная с этого размера radix_sort использует NumPy (если он установлен)
+NUMPY_RADIX_THRESHOLD = 50_000
+
+
+def _radix_typecode(span):
+    """Тип элементов array для ключей от 0 до span (или None, если не влезает)"""
+    for typecode in ("I", "L", "Q"):
+        if span < 1 << (8 * array(typecode).itemsize):
+            return typecode
+    return None
+
+
+@_with_key(_radix_argsort)
+def radix_sort(arr, radix=256):
+    """
+    Поразрядная сортировка LSD (только целые числа)
+      - radix - основание системы счисления, степень двойки
+      - отрицательные числа обрабатываются сдвигом на минимум
+      - разряды, одинаковые у всех элементов, пропускаются
+      - буферы - компактные массивы array вместо списков
+    Временная сложность: O(d * (n + radix)), d - число разрядов
+    Пространственная сложность: O(n + radix)
+    Устойчивость: да
+    """
+    if radix < 2 or radix & (radix - 1):
+        raise ValueError("Основание должно быть степенью двойки")
+    n = len(arr)
+    if n < 2:
+        return arr
+    if np is not None and n >= NUMPY_RADIX_THRESHOLD:
+        result = radix_sort_numpy(arr, radix)
+        if result is not None:
+            arr[:] = result
+            return arr
+    
+    lo = min(arr)
+    span = max(arr) - lo
+    typecode = _radix_typecode(span)
+    if typecode is None:  # Ключи длиннее 64 бит - обычные списки
+        src = [x - lo for x in arr]
+        dst = [0] * n
+    else:
+        src = array(typecode, [x - lo for x in arr])
+        dst = array(typecode, bytes(n * src.itemsize))
+    
+    bits = radix.bit_length() - 1
+    mask = radix - 1
+    for shift in range(0, max(span.bit_length(), 1), bits):
+        counts = [0] * radix
+        for x in src:
+            counts[(x >> shift) & mask] += 1
+        if max(counts) == n:  # Разряд одинаков у всех - пропускаем
+            continue
+        # Префиксные суммы - начальные позиции цифр
+        total = 0
+        for digit in range(radix):
+            counts[digit], total = total, total + counts[digit]
+        for x in src:
+            digit = (x >> shift) & mask
+            dst[counts[digit]] = x
+            counts[digit] += 1
+        src, dst = dst, src
+    
+    arr[:] = [x + lo for x in src]
+    return arr
+
+
+def radix_sort_numpy(arr, radix=256):
+    """
+    Векторизованная поразрядная сортировка LSD на NumPy
+    Каждый проход - устойчивая сортировка массива цифр (для uint8/uint16
+    NumPy сам применяет поразрядную сортировку) и перестановка значений
+    Возвращает отсортированный список или None, если NumPy недоступен
+    или числа не помещаются в int64
+    """
+    if np is None or radix < 2 or radix & (radix - 1) or radix > 1 << 16:
+        return None
+    try:
+        values = np.asarray(arr, dtype=np.int64)
+    except (OverflowError, TypeError, ValueError):
+        return None
+    if values.size < 2:
+        return values.tolist()
+    
+    lo = values.min()
+    keys = (values - lo).view(np.uint64)  # Сдвиг на минимум - без знака
+    span = int(keys.max())
+    digit_type = np.uint8 if radix <= 256 else np.uint16
+    bits = radix.bit_length() - 1
+    for shift in range(0, max(span.bit_length(), 1), bits):
+        digits = ((keys >> np.uint64(shift)) & np.uint64(radix - 1)).astype(digit_type)
+        order = np.argsort(digits, kind="stable")
+        keys = keys[order]
+    return (keys.view(np.int64) + lo).tolist()
+
+
+# Сортировка строк (str или bytes)
+#
+# Сортировки сравнением на каждом сравнении заново проходят общий префикс
+# строк. Здесь строки разбираются по одному символу на позиции d, а общий
+# для группы префикс пропускается целиком. s[d:d + 1] - символ (для bytes -
+# байт) или пустая строка за концом, которая меньше любого символа.
+
+# Группы короче порога сортируются вставками: сравнение строк идет на C
+STRING_INSERTION_THRESHOLD = 32
+
+
+def _skip_common_prefix(arr, lo, hi, d):
+    """
+    Длина общего префикса строк arr[lo:hi], не меньше d
+    Общий префикс всей группы - общий префикс ее минимума и максимума
+    """
+    first = min(arr[lo:hi])
+    last = max(arr[lo:hi])
+    while first[d:d + 1] and first[d:d + 1] == last[d:d + 1]:
+        d += 1
+    return d
+
+
+@_with_key(_string_argsort)
+def multikey_quick_sort(arr):
+    """
+    Трехпутевая поразрядная быстрая сортировка (Бентли - Седжвик)
+    Разбиение на <, =, > по символу в позиции d: группа "=" дальше
+    сортируется со следующего символа, общий префикс не сравнивается
+    повторно. Рекурсия заменена явным стеком - длина строк не ограничена
+    глубиной рекурсии
+    Временная сложность: O(n log n + D), D - сумма длин различающих префиксов
+    Пространственная сложность: O(n) в худшем случае (стек)
+    Устойчивость: нет
+    """
+    stack = [(0, len(arr), 0)]
+    while stack:
+        lo, hi, d = stack.pop()
+        if hi - lo <= STRING_INSERTION_THRESHOLD:
+            _insertion_sort_range(arr, lo, hi)
+            continue
+        
+        # Опорный символ - медиана символов первой, средней и последней строк
+        a, b, c = arr[lo][d:d + 1], arr[(lo + hi) // 2][d:d + 1], arr[hi - 1][d:d + 1]
+        pivot = max(min(a, b), min(max(a, b), c))
+        
+        lt, i, gt = lo, lo, hi - 1
+        while i <= gt:
+            ch = arr[i][d:d + 1]
+            if ch < pivot:
+                arr[lt], arr[i] = arr[i], arr[lt]
+                lt += 1
+                i += 1
+            elif pivot < ch:
+                arr[i], arr[gt] = arr[gt], arr[i]
+                gt -= 1
+            else:
+                i += 1
+        
+        stack.append((lo, lt, d))
+        stack.append((gt + 1, hi, d))
+        # Пустой опорный символ - строки группы "=" закончились и равны
+        if pivot and gt + 1 - lt > 1:
+            stack.append((lt, gt + 1, _skip_common_prefix(arr, lt, gt + 1, d + 1)))
+    return arr
+
+
+@_with_key(_string_argsort)
+def msd_radix_sort(arr):
+    """
+    Поразрядная сортировка MSD (от старшего символа) для строк
+    Строки раскладываются по корзинам символа в позиции d (словарь -
+    алфавит Unicode не перебирается), корзины упорядочиваются и
+    обрабатываются дальше независимо; общий префикс группы пропускается
+    Временная сложность: O(D + n log σ), σ - число различных символов в позиции
+    Пространственная сложность: O(n)
+    Устойчивость: да
+    """
+    stack = [(0, len(arr), 0)]
+    while stack:
+        lo, hi, d = stack.pop()
+        if hi - lo <= STRING_INSERTION_THRESHOLD:
+            _insertion_sort_range(arr, lo, hi)
+            continue
+        d = _skip_common_prefix(arr, lo, hi, d)
+        
+        buckets = {}
+        for s in arr[lo:hi]:
+            ch = s[d:d + 1]
+            bucket = buckets.get(ch)
+            if bucket is None:
+                buckets[ch] = [s]
+            else:
+                bucket.append(s)
+        
+        start = lo
+        for ch in sorted(buckets):
+            bucket = buckets[ch]
+            end = start + len(bucket)
+            arr[start:end] = bucket
+            # Корзина "" - строки кончились на d, все они равны
+            if ch and len(bucket) > 1:
+                stack.append((start, end, d + 1))
+            start = end
+    return arr
+
+
+# Параметры выбора алгоритма в smart_sort
+SMALL_SORT_SIZE = 32  # До этого размера - вставки
+COUNTING_RANGE_FACTOR = 4  # Подсчет, если диапазон ключей <= 4n
+FEW_RUNS_FRACTION = 16  # Timsort, если спусков не больше n / 16
+
+
+def probe_input(arr):
+    """
+    Дешевый O(n) анализ входа для smart_sort:
+    размер, число спусков (arr[i+1] < arr[i]), тип и диапазон ключей
+    """
+    n = len(arr)
+    # map с operator.lt и type выполняются на уровне C - анализ дешевле сортировки
+    descents = sum(map(operator.lt, arr[1:], arr)) if n > 1 else 0
+    # bool - подкласс int, но сортировать его подсчетом бессмысленно
+    is_int = n > 0 and set(map(type, arr)) == {int}
+    profile = {"size": n, "descents": descents, "runs": descents + 1,
+               "is_int": is_int, "key_range": None}
+    if is_int:
+        profile["key_range"] = max(arr) - min(arr) + 1
+    return profile
+
+
+def choose_sort_algorithm(arr):
+    """
+    Выбор алгоритма по результатам probe_input
+    Возвращает (название, функция, профиль входа)
+    """
+    profile = probe_input(arr)
+    n = profile["size"]
+    descents = profile["descents"]
+    
+    if n <= SMALL_SORT_SIZE:
+        choice = ("insertion", insertion_sort)
+    elif descents == 0:
+        choice = ("already_sorted", lambda a: a)
+    elif descents == n - 1:
+        # Строго убывающий массив - достаточно развернуть
+        choice = ("reverse", lambda a: (a.reverse(), a)[1])
+    elif profile["is_int"] and np is not None and n >= NUMPY_RADIX_THRESHOLD:
+        # Векторизованная поразрядная сортировка быстрее всех остальных
+        choice = ("radix", radix_sort)
+    elif profile["is_int"] and profile["key_range"] <= COUNTING_RANGE_FACTOR * n:
+        choice = ("counting", counting_sort)
+    elif descents <= n // FEW_RUNS_FRACTION:
+        # Мало серий - почти отсортированный вход
+        choice = ("tim", tim_sort)
+    elif (profile["is_int"]
+          and -(-profile["key_range"].bit_length() // 8) <= n.bit_length() // 4):
+        # Чистая поразрядная выгодна, пока проходов по байтам мало
+        # относительно log n
+        choice = ("radix", radix_sort)
+    else:
+        choice = ("quick", quick_sort)
+    return choice[0], choice[1], profile
+
+
+@_with_key(_decorated_argsort)
+def smart_sort(arr):
+    """
+    Гибридная сортировка: выбирает алгоритм по свойствам входа
+      - до 32 элементов - вставки
+      - отсортированный - ничего не делает, строго убывающий - разворот
+      - целые с узким диапазоном - подсчет
+      - мало серий (почти отсортирован) - Timsort
+      - прочие целые - поразрядная, остальное - быстрая сортировка
+    Решение пишется в лог (logging, уровень DEBUG)
+    Временная сложность: O(n) на анализ + сложность выбранного алгоритма
+    Устойчивость: не гарантируется
+    """
+    name, func, profile = choose_sort_algorithm(arr)
+    logger.debug("smart_sort: %s -> %s", profile, name)
+    return func(arr)
+
+
+def argsort(arr, key=None, reverse=False, algorithm=None):
+    """
+    Перестановка индексов, упорядочивающая arr, без перемещения самих записей:
+    [arr[i] for i in argsort(arr)] - отсортированный массив
+    algorithm - любая сортировка этого модуля (по умолчанию Timsort)
+    Порядок равных ключей - исходный (устойчиво)
+    """
+    algorithm = algorithm or tim_sort
+    return algorithm.argsort(arr, key=key, reverse=reverse)
+
+
+# Выбор k-го элемента и частичная сортировка
+#
+# Порядковые статистики отсчитываются от нуля: k-й элемент - тот, что
+# оказался бы в arr[k] после полной сортировки.
+
+# С этого размера числовые массивы отдаются np.partition
+NUMPY_SELECT_THRESHOLD = 10_000
+
+
+def _median_of_medians(arr, lo, hi):
+    """
+    Опорный элемент с гарантией: медиана медиан пятерок участка arr[lo..hi]
+    Медианы собираются в начало участка, возвращается индекс опорного
+    """
+    store = lo
+    for start in range(lo, hi + 1, 5):
+        end = min(start + 5, hi + 1)
+        _insertion_sort_range(arr, start, end)
+        mid = (start + end - 1) // 2
+        arr[store], arr[mid] = arr[mid], arr[store]
+        store += 1
+    middle = (lo + store - 1) // 2
+    _introselect(arr, lo, store - 1, middle, 2 * (store - lo).bit_length())
+    return middle
+
+
+def _introselect(arr, lo, hi, k, depth_limit):
+    """
+    Интроспективный выбор на участке arr[lo..hi] (включительно)
+    Быстрый выбор с медианой трех, после depth_limit неудачных разбиений -
+    опорный элемент по медиане медиан
+    """
+    while hi - lo + 1 > INSERTION_THRESHOLD:
+        if depth_limit == 0:
+            m = _median_of_medians(arr, lo, hi)
+            arr[lo], arr[m] = arr[m], arr[lo]
+            p = _hoare_partition(arr, lo, hi)
+        else:
+            depth_limit -= 1
+            p = _partition(arr, lo, hi)
+        # Продолжаем только в той части, где лежит k-й элемент
+        if k <= p:
+            hi = p
+        else:
+            lo = p + 1
+    small_sort(arr, lo, hi + 1)
+
+
+def _numpy_values(arr):
+    """
+    Массив NumPy для однотипных int/float списков или None,
+    если NumPy недоступен, массив короткий или числа не помещаются в int64
+    """
+    if np is None or len(arr) < NUMPY_SELECT_THRESHOLD:
+        return None
+    types = set(map(type, arr))
+    if types == {int}:
+        try:
+            return np.asarray(arr, dtype=np.int64)
+        except OverflowError:
+            return None
+    if types == {float}:
+        return np.asarray(arr, dtype=np.float64)
+    return None
+
+
+def _check_index(k, n):
+    if not 0 <= k < n:
+        raise IndexError(f"k={k} вне диапазона [0, {n})")
+
+
+def nth_element(arr, k, use_numpy=True):
+    """
+    Перестановка на месте, как std::nth_element: arr[k] - k-й по величине
+    элемент, слева от него не больше, справа не меньше
+    Временная сложность:
+      - Средний: O(n)
+      - Худший: O(n) - благодаря переходу на медиану медиан
+    Пространственная сложность: O(log n)
+    Устойчивость: нет
+    """
+    n = len(arr)
+    _check_index(k, n)
+    values = _numpy_values(arr) if use_numpy else None
+    if values is not None:
+        arr[:] = np.partition(values, k).tolist()
+        return arr
+    _introselect(arr, 0, n - 1, k, 2 * n.bit_length())
+    return arr
+
+
+def introselect(arr, k):
+    """
+    k-й по величине элемент (с нуля), исходный массив не меняется
+    Временная сложность: O(n) в худшем случае
+    Пространственная сложность: O(n) - копия массива
+    """
+    return nth_element(list(arr), k)[k]
+
+
+def partial_sort(arr, k, use_numpy=True):
+    """
+    Частичная сортировка на месте: arr[:k] - k наименьших элементов
+    по возрастанию, порядок остальных не определен
+    Выбор k-го элемента, затем сортировка только первых k
+    Временная сложность: O(n + k log k)
+    Пространственная сложность: O(log n)
+    Устойчивость: нет
+    """
+    n = len(arr)
+    if k <= 0:
+        return arr
+    k = min(k, n)
+    values = _numpy_values(arr) if use_numpy else None
+    if values is not None:
+        values = np.partition(values, k - 1)
+        values[:k].sort()
+        arr[:] = values.tolist()
+        return arr
+    _introselect(arr, 0, n - 1, k - 1, 2 * n.bit_length())
+    head = arr[:k]
+    quick_sort(head)
+    arr[:k] = head
+    return arr
+
+
+def top_k(arr, k, key=None, largest=True, use_numpy=True):
+    """
+    k наибольших (largest=False - наименьших) элементов в порядке убывания
+    (возрастания) - новый список, исходный массив не меняется
+    Куча размера k за один проход по данным (heapq), поэтому подходит
+    и для потоков, и для k, много меньших n
+    Временная сложность: O(n log k)
+    Пространственная сложность: O(k)
+    Порядок равных - исходный (как у sorted)
+    """
+    if k <= 0:
+        return []
+    if key is None and use_numpy and k < len(arr):
+        values = _numpy_values(arr)
+        if values is not None:
+            n = len(values)
+            if largest:
+                values = np.partition(values, n - k)[n - k:]
+                return np.sort(values)[::-1].tolist()
+            values = np.partition(values, k - 1)[:k]
+            return np.sort(values).tolist()
+    if largest:
+        return heapq.nlargest(k, arr, key=key)
+    return heapq.nsmallest(k, arr, key=key)
+
+
 def test_sorts():
     """Тестирование алгоритмов сортировки"""
     test_arrays = [
@@ -88,6 +1291,19 @@ def test_sorts():
         print(f"Пузырьком:    {bubble_sort(arr1)}")
         print(f"Выбором:      {selection_sort(arr2)}")
         print(f"Вставками:    {insertion_sort(arr3)}")
+        print(f"Бинарными вставками: {binary_insertion_sort(arr.copy())}")
+        print(f"Шелла:        {shell_sort(arr.copy())}")
+        print(f"Слиянием:     {merge_sort(arr.copy())}")
+        print(f"Слиянием (восходящая): {merge_sort_bottom_up(arr.copy())}")
+        print(f"Быстрая:      {quick_sort(arr.copy())}")
+        print(f"Пирамидальная: {heap_sort(arr.copy())}")
+        print(f"Timsort:      {tim_sort(arr.copy())}")
+        print(f"Подсчетом:    {counting_sort(arr.copy())}")
+        print(f"Поразрядная:  {radix_sort(arr.copy())}")
+        print(f"Гибридная:    {smart_sort(arr.copy())}")
+        print(f"Строковая (MSD): {msd_radix_sort([str(x) for x in arr])}")
+        print(f"Частичная (k=3): {partial_sort(arr.copy(), 3)[:3]}")
+        print(f"Топ-3:        {top_k(arr, 3)}")
 
 
 if __name__ == "__main__":
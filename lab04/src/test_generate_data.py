@@ -0,0 +1,28 @@
+from generate_data import _numpy_dataset, _python_dataset, generate_dataset, np
+import random
+
+def test_almost_sorted_is_permutation():
+    """Почти отсортированный набор - перестановка чисел 1..size"""
+    print("Тестирование almost_sorted...")
+    
+    size = 100_000
+    arr = _python_dataset('almost_sorted', size, random.Random(0))
+    assert sorted(arr) == list(range(1, size + 1))
+    
+    if np is None:
+        print("NumPy не установлен - векторизованный генератор не проверяется")
+        return
+    for seed in range(5):
+        arr = _numpy_dataset('almost_sorted', size, np.random.default_rng(seed))
+        assert np.array_equal(np.sort(arr), np.arange(1, size + 1))
+        # Переставлено около 2 * 5% позиций
+        moved = np.count_nonzero(arr != np.arange(1, size + 1))
+        assert 0 < moved <= size // 10
+    
+    arr = generate_dataset('almost_sorted', 1000, seed=1, cache_dir=None)
+    assert np.array_equal(np.sort(arr), np.arange(1, 1001))
+    
+    print("✓ almost_sorted - перестановка")
+
+if __name__ == "__main__":
+    test_almost_sorted_is_permutation()
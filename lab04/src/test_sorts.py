@@ -0,0 +1,31 @@
+from sorts import counting_sort, radix_sort
+import random
+
+def test_counting_sort_wide_range():
+    """Подсчет на широком диапазоне ключей не выделяет O(k) памяти"""
+    print("Тестирование counting_sort на широком диапазоне...")
+    
+    rng = random.Random(0)
+    for size in [2, 100, 10_000]:
+        arr = [rng.randint(-10 ** 12, 10 ** 12) for _ in range(size)]
+        assert counting_sort(arr.copy()) == sorted(arr)
+        assert counting_sort(arr.copy(), reverse=True) == sorted(arr, reverse=True)
+    
+    # Разреженные ключи, как у zipf: почти все малые и несколько огромных
+    arr = [1, 3, 2, 10 ** 11, 1, 2 ** 62, 5] * 100
+    assert counting_sort(arr.copy()) == sorted(arr)
+    assert radix_sort(arr.copy()) == sorted(arr)
+    
+    # Устойчивость сохраняется и при переходе на поразрядную сортировку
+    records = [(rng.choice([-10 ** 12, 0, 10 ** 12]), i) for i in range(1000)]
+    result = counting_sort(records.copy(), key=lambda r: r[0])
+    assert result == sorted(records, key=lambda r: r[0])
+    
+    # Узкий диапазон по-прежнему сортируется подсчетом
+    arr = [rng.randint(-50, 50) for _ in range(1000)]
+    assert counting_sort(arr.copy()) == sorted(arr)
+    
+    print("✓ counting_sort - широкий диапазон")
+
+if __name__ == "__main__":
+    test_counting_sort_wide_range()
@@ -1,3 +1,9 @@
+import itertools
+import random
+import secrets
+import struct
+
+
 def simple_hash(key, table_size):
     """
     Простая хеш-функция для строк
@@ -5,11 +11,220 @@ def simple_hash(key, table_size):
     Особенность: простая, но плохое распределение для похожих строк
     """
     hash_value = 0
-    for char in key:
+    for char in str(key):
         hash_value += ord(char)  # Сумма кодов символов
     return hash_value % table_size  # Приводим к размеру таблицы
 
 
+MASK64 = (1 << 64) - 1
+
+FNV_OFFSET_BASIS = 0xCBF29CE484222325
+FNV_PRIME = 0x100000001B3
+
+MURMUR_C1 = 0x87C37B91114253D5
+MURMUR_C2 = 0x4CF5AD432745937F
+_WORDS = struct.Struct("<Q")  # 64-битное слово little-endian
+
+# Нечетная константа ≈ 2^64 / φ (хеширование Фибоначчи, Кнут)
+GOLDEN_RATIO_64 = 0x9E3779B97F4A7C15
+
+
+def _key_bytes(key):
+    """Байты ключа: bytes как есть, строки и прочее - UTF-8 от str(key)"""
+    if isinstance(key, bytes):
+        return key
+    return str(key).encode("utf-8")
+
+
+def fnv1a_hash(key, table_size):
+    """
+    FNV-1a (64 бита) над UTF-8 байтами ключа
+    Каждый байт сначала смешивается XOR, затем умножение на простое
+    число FNV - изменение любого байта меняет весь результат
+    Сложность: O(n) где n - длина ключа в байтах
+    """
+    hash_value = FNV_OFFSET_BASIS
+    for byte in _key_bytes(key):
+        hash_value = ((hash_value ^ byte) * FNV_PRIME) & MASK64
+    return hash_value % table_size
+
+
+def _rotl64(x, r):
+    return ((x << r) | (x >> (64 - r))) & MASK64
+
+
+def _fmix64(h):
+    """Финальное перемешивание MurmurHash3: каждый бит влияет на все"""
+    h ^= h >> 33
+    h = (h * 0xFF51AFD7ED558CCD) & MASK64
+    h ^= h >> 33
+    h = (h * 0xC4CEB9FE1A85EC53) & MASK64
+    h ^= h >> 33
+    return h
+
+
+def murmur_hash(key, table_size, seed=0):
+    """
+    Хеш в стиле MurmurHash3 (64 бита, одна полоса) над UTF-8 байтами ключа
+    Ключ читается словами по 8 байт (умножение, циклический сдвиг, XOR),
+    хвост дополняется нулями, в конце - перемешивание fmix64
+    Сложность: O(n) где n - длина ключа, но шагов цикла в 8 раз меньше, чем у FNV
+    """
+    data = _key_bytes(key)
+    length = len(data)
+    h = seed & MASK64
+    tail = length % 8
+    if tail:
+        data = data + bytes(8 - tail)
+    for (block,) in _WORDS.iter_unpack(data):
+        block = (block * MURMUR_C1) & MASK64
+        block = (_rotl64(block, 31) * MURMUR_C2) & MASK64
+        h ^= block
+        h = (_rotl64(h, 27) * 5 + 0x52DCE729) & MASK64
+    return _fmix64(h ^ length) % table_size
+
+
+def _sipround(v0, v1, v2, v3):
+    v0 = (v0 + v1) & MASK64
+    v1 = _rotl64(v1, 13) ^ v0
+    v0 = _rotl64(v0, 32)
+    v2 = (v2 + v3) & MASK64
+    v3 = _rotl64(v3, 16) ^ v2
+    v0 = (v0 + v3) & MASK64
+    v3 = _rotl64(v3, 21) ^ v0
+    v2 = (v2 + v1) & MASK64
+    v1 = _rotl64(v1, 17) ^ v2
+    v2 = _rotl64(v2, 32)
+    return v0, v1, v2, v3
+
+
+def siphash24(key, table_size, seed=0):
+    """
+    SipHash-2-4 - хеш с секретным 128-битным ключом seed (как у dict в CPython)
+    Не зная seed, нельзя заранее подобрать ключи с одинаковым хешем,
+    поэтому атака "все ключи в одну цепочку" невозможна
+    Сложность: O(n) где n - длина ключа в байтах
+    """
+    data = _key_bytes(key)
+    length = len(data)
+    k0 = seed & MASK64
+    k1 = (seed >> 64) & MASK64
+    v0 = k0 ^ 0x736F6D6570736575
+    v1 = k1 ^ 0x646F72616E646F6D
+    v2 = k0 ^ 0x6C7967656E657261
+    v3 = k1 ^ 0x7465646279746573
+    
+    # Последнее слово: остаток байтов и длина сообщения в старшем байте
+    tail = length % 8
+    data = data + bytes(7 - tail) + bytes([length & 0xFF])
+    for (block,) in _WORDS.iter_unpack(data):
+        v3 ^= block
+        v0, v1, v2, v3 = _sipround(v0, v1, v2, v3)
+        v0, v1, v2, v3 = _sipround(v0, v1, v2, v3)
+        v0 ^= block
+    
+    v2 ^= 0xFF
+    for _ in range(4):
+        v0, v1, v2, v3 = _sipround(v0, v1, v2, v3)
+    return (v0 ^ v1 ^ v2 ^ v3) % table_size
+
+
+def random_seed():
+    """Случайный 128-битный ключ для хеш-функций с ключом"""
+    return secrets.randbits(128)
+
+
+def multiplicative_hash(key, table_size):
+    """
+    Мультипликативный хеш для целых ключей (хеширование Фибоначчи)
+    h = key * A mod 2^64; у произведения младшие биты слабые (зависят только
+    от младших битов ключа), поэтому половины h меняются местами и остаток
+    от деления берется по старшим битам
+    Сложность: O(1)
+    """
+    hash_value = (key * GOLDEN_RATIO_64) & MASK64
+    return _rotl64(hash_value, 32) % table_size
+
+
+# Таблицы для хеширования табуляцией: 8 байт ключа x 256 значений
+_TABULATION_TABLES = [[random.Random(byte_index * 256 + value).getrandbits(64)
+                       for value in range(256)] for byte_index in range(8)]
+
+
+def tabulation_hash(key, table_size):
+    """
+    Простое хеширование табуляцией для целых ключей (до 64 бит)
+    XOR случайных 64-битных чисел, выбранных по каждому байту ключа;
+    3-независимо - хорошее распределение для любых наборов ключей
+    Сложность: O(1) - 8 обращений к таблицам
+    """
+    key &= MASK64  # Отрицательные - в дополнительном коде
+    hash_value = 0
+    for table in _TABULATION_TABLES:
+        hash_value ^= table[key & 0xFF]
+        key >>= 8
+    return hash_value % table_size
+
+
+# Все хеш-функции: hash_func(key, m) == hash_func(key, FULL_HASH_SIZE) % m,
+# поэтому таблица может один раз вычислить полный хеш, сохранить его
+# и получать индекс для любой емкости без повторного хеширования ключа
+FULL_HASH_SIZE = 2 ** 64
+
+# Хеш-функции по названиям: строковые принимают любые ключи (через str),
+# целочисленные - только int
+HASH_FUNCTIONS = {
+    "simple": simple_hash,
+    "fnv1a": fnv1a_hash,
+    "murmur": murmur_hash,
+    "siphash": siphash24,
+    "multiplicative": multiplicative_hash,
+    "tabulation": tabulation_hash,
+}
+INT_HASH_FUNCTIONS = {"multiplicative", "tabulation"}
+
+# Хеш-функции с ключом: третий аргумент seed, таблица выбирает его случайно
+KEYED_HASH_FUNCTIONS = {siphash24, murmur_hash}
+
+
+def anagram_keys(count, letters="abcdefghijkl"):
+    """
+    Набор для атаки на simple_hash: перестановки одних и тех же букв -
+    у всех одинаковая сумма кодов, значит и одинаковый хеш
+    """
+    return ["".join(p) for p in itertools.islice(itertools.permutations(letters), count)]
+
+
+def chain_length_stats(keys, hash_func, table_size):
+    """
+    Распределение ключей по ячейкам без построения таблицы
+    Возвращает словарь:
+      - lengths - длина цепочки в каждой ячейке
+      - histogram - длина цепочки -> число таких ячеек
+      - max_chain, empty
+      - chi_square - статистика хи-квадрат против равномерного распределения
+        и chi_square_ratio = chi_square / (m - 1) (около 1 - равномерно)
+    """
+    lengths = [0] * table_size
+    for key in keys:
+        lengths[hash_func(key, table_size)] += 1
+    
+    histogram = {}
+    for length in lengths:
+        histogram[length] = histogram.get(length, 0) + 1
+    
+    expected = len(keys) / table_size
+    chi_square = sum((length - expected) ** 2 for length in lengths) / expected if expected else 0.0
+    return {
+        "lengths": lengths,
+        "histogram": dict(sorted(histogram.items())),
+        "max_chain": max(lengths) if lengths else 0,
+        "empty": histogram.get(0, 0),
+        "chi_square": chi_square,
+        "chi_square_ratio": chi_square / max(table_size - 1, 1),
+    }
+
+
 def test_hash_functions():
     """Тестирование хеш-функции"""
     print("ТЕСТ ХЕШ-ФУНКЦИИ")
@@ -44,7 +259,18 @@ def test_hash_functions():
     print(f"\nВсего ключей: {len(test_keys)}")
     print(f"Коллизий: {collisions}")
     print(f"Коэффициент коллизий: {collisions/len(test_keys):.2f}")
+    
+    # Анаграммы и похожие ключи для разных хеш-функций
+    print("\nАНАГРАММЫ И ПОХОЖИЕ КЛЮЧИ (таблица 1024):")
+    anagrams = ["listen", "silent", "enlist", "tinsel", "inlets"]
+    similar = [f"key_{i}" for i in range(1, 100)]
+    for name in ("simple", "fnv1a", "murmur"):
+        hash_func = HASH_FUNCTIONS[name]
+        anagram_cells = len({hash_func(key, 1024) for key in anagrams})
+        similar_cells = len({hash_func(key, 1024) for key in similar})
+        print(f"  {name:<8} анаграммы: {anagram_cells} ячеек из {len(anagrams)}, "
+              f"key_1..key_99: {similar_cells} ячеек из {len(similar)}")
 
 
 if __name__ == "__main__":
-    test_hash_functions()
\ No newline at end of file
+    test_hash_functions()
@@ -1,3 +1,16 @@
+from hash_functions import KEYED_HASH_FUNCTIONS, fnv1a_hash, random_seed, siphash24
+
+# Цепочка длиннее этого (плюс средней длины) считается признаком атаки
+MAX_CHAIN_LENGTH = 32
+
+# Пороги коэффициента заполнения для увеличения и уменьшения таблицы
+MAX_LOAD_FACTOR = 1.0
+MIN_LOAD_FACTOR = 0.25
+
+# Сколько ячеек старой таблицы переносится за одну операцию
+REHASH_STEP = 4
+
+
 class Node:
     """Узел для метода цепочек"""
     def __init__(self, key, value):
@@ -11,33 +24,177 @@ class HashTableChaining:
     Хеш-таблица с методом цепочек
     Сложность операций в среднем случае: O(1 + α), где α = n/m
     Сложность в худшем случае: O(n)
+    hash_func(key, table_size) - хеш-функция таблицы (см. hash_functions)
+    Хеш-функции с ключом (SipHash) получают случайный seed таблицы.
+    Защита от атаки коллизиями: если цепочка длиннее max_chain_length
+    (плюс средней длины), таблица переходит на SipHash с новым случайным
+    seed и перехеширует элементы (max_chain_length=None - отключить)
+    
+    Размер меняется автоматически: при α > max_load_factor таблица
+    удваивается, при α < min_load_factor - уменьшается вдвое (но не меньше
+    начальной емкости); None отключает соответствующее правило.
+    При incremental=True элементы переносятся в новую таблицу постепенно -
+    по REHASH_STEP ячеек за операцию, до конца переноса живы обе таблицы.
+    Так ни одна вставка не платит O(n) за перехеширование целиком
     """
     
-    def __init__(self, capacity=10):
+    def __init__(self, capacity=10, hash_func=fnv1a_hash, max_chain_length=MAX_CHAIN_LENGTH,
+                 seed=None, max_load_factor=MAX_LOAD_FACTOR, min_load_factor=MIN_LOAD_FACTOR,
+                 incremental=True):
         self.capacity = capacity  # Размер таблицы
         self.size = 0  # Количество элементов
         self.table = [None] * capacity  # Основная таблица
+        self.hash_func = hash_func
+        self.seed = None
+        if hash_func in KEYED_HASH_FUNCTIONS:
+            self.seed = random_seed() if seed is None else seed
+        self.max_chain_length = max_chain_length
+        self.reseeds = 0  # Сколько раз таблица перехеширована из-за атаки
+        self._reseed_size = 0  # Размер при последнем перехешировании
+        
+        self.max_load_factor = max_load_factor
+        self.min_load_factor = min_load_factor
+        self.incremental = incremental
+        self.resizes = 0  # Сколько раз менялся размер
+        self._min_capacity = capacity
+        # Старая таблица во время постепенного переноса (иначе None);
+        # ячейки старой таблицы до _rehash_index уже перенесены
+        self._old_table = None
+        self._old_capacity = 0
+        self._rehash_index = 0
+    
+    def _hash(self, key, capacity=None):
+        """Вычисление хеша для ключа (по умолчанию - для текущей емкости)"""
+        capacity = capacity or self.capacity
+        if self.seed is None:
+            return self.hash_func(key, capacity)
+        return self.hash_func(key, capacity, self.seed)
     
-    def _hash(self, key):
-        """Вычисление хеша для ключа"""
-        from hash_functions import simple_hash
-        return simple_hash(key, self.capacity)
+    def _start_resize(self, new_capacity):
+        """Новая таблица емкости new_capacity, старая переносится постепенно"""
+        self._finish_rehash()
+        self._old_table = self.table
+        self._old_capacity = self.capacity
+        self._rehash_index = 0
+        self.capacity = new_capacity
+        self.table = [None] * new_capacity
+        self.resizes += 1
+        if not self.incremental:
+            self._finish_rehash()
+    
+    def _rehash_step(self, buckets=None):
+        """Перенос следующих buckets ячеек старой таблицы (по умолчанию REHASH_STEP)"""
+        old_table = self._old_table
+        if old_table is None:
+            return
+        start = self._rehash_index
+        end = min(start + (buckets or REHASH_STEP), self._old_capacity)
+        table = self.table
+        for i in range(start, end):
+            node = old_table[i]
+            while node:
+                next_node = node.next
+                index = self._hash(node.key)
+                node.next = table[index]
+                table[index] = node
+                node = next_node
+            old_table[i] = None
+        self._rehash_index = end
+        if end == self._old_capacity:
+            self._old_table = None
+    
+    def _finish_rehash(self):
+        """Завершение переноса, если он идет"""
+        if self._old_table is not None:
+            self._rehash_step(self._old_capacity)
+    
+    def _old_bucket(self, key):
+        """
+        Индекс ячейки ключа в старой таблице, если ключ может там быть
+        (перенос идет и ячейка еще не перенесена), иначе None
+        """
+        if self._old_table is None:
+            return None
+        index = self._hash(key, self._old_capacity)
+        return index if index >= self._rehash_index else None
+    
+    def _target_capacity(self, size):
+        """
+        Емкость для size элементов: удвоение, пока α > max_load_factor,
+        или уменьшение вдвое, пока α < min_load_factor
+        """
+        capacity = self.capacity
+        if self.max_load_factor is not None:
+            while size > self.max_load_factor * capacity:
+                capacity *= 2
+        if self.min_load_factor is not None:
+            while capacity > self._min_capacity and size < self.min_load_factor * capacity:
+                capacity = max(capacity // 2, self._min_capacity)
+        return capacity
+    
+    def _check_resize(self):
+        """Запуск увеличения или уменьшения таблицы по коэффициенту заполнения"""
+        capacity = self._target_capacity(self.size)
+        if capacity != self.capacity:
+            self._start_resize(capacity)
+    
+    def _is_pathological(self, chain_length):
+        """
+        Слишком длинная цепочка - вероятно, подобранные ключи.
+        Не чаще одного перехеширования на удвоение числа элементов,
+        чтобы перехеширование оставалось амортизированно O(1)
+        """
+        return (self.max_chain_length is not None
+                and chain_length > self.max_chain_length + self.size // self.capacity
+                and self.size >= 2 * self._reseed_size)
+    
+    def _reseed(self):
+        """Переход на SipHash с новым случайным seed и перехеширование"""
+        self._finish_rehash()
+        self.hash_func = siphash24  # Стойкая к подбору коллизий без знания seed
+        self.seed = random_seed()
+        self.reseeds += 1
+        self._reseed_size = self.size
+        
+        old_table = self.table
+        self.table = [None] * self.capacity
+        for node in old_table:
+            while node:
+                next_node = node.next
+                index = self._hash(node.key)
+                node.next = self.table[index]
+                self.table[index] = node
+                node = next_node
     
     def insert(self, key, value):
         """
         Вставка элемента в таблицу
-        Средняя сложность: O(1 + α)
+        Средняя сложность: O(1 + α), с учетом перехеширования - амортизированная
         """
+        self._rehash_step()
+        
+        # Во время переноса ключ может еще лежать в старой таблице
+        old_index = self._old_bucket(key)
+        if old_index is not None:
+            current = self._old_table[old_index]
+            while current:
+                if current.key == key:
+                    current.value = value
+                    return True
+                current = current.next
+        
         index = self._hash(key)
         
         # Если ячейка пуста
         if self.table[index] is None:
             self.table[index] = Node(key, value)
             self.size += 1
+            self._check_resize()
             return True
         
         # Если ячейка занята - идем по цепочке
         current = self.table[index]
+        chain_length = 1
         while current:
             # Если ключ уже существует - обновляем значение
             if current.key == key:
@@ -46,10 +203,14 @@ class HashTableChaining:
             if current.next is None:
                 break
             current = current.next
+            chain_length += 1
         
         # Добавляем в конец цепочки
         current.next = Node(key, value)
         self.size += 1
+        if self._is_pathological(chain_length + 1):
+            self._reseed()
+        self._check_resize()
         return True
     
     def search(self, key):
@@ -57,6 +218,7 @@ class HashTableChaining:
         Поиск элемента по ключу
         Средняя сложность: O(1 + α)
         """
+        self._rehash_step()
         index = self._hash(key)
         current = self.table[index]
         
@@ -65,6 +227,14 @@ class HashTableChaining:
                 return current.value
             current = current.next
         
+        old_index = self._old_bucket(key)
+        if old_index is not None:
+            current = self._old_table[old_index]
+            while current:
+                if current.key == key:
+                    return current.value
+                current = current.next
+        
         return None  # Ключ не найден
     
     def delete(self, key):
@@ -72,29 +242,129 @@ class HashTableChaining:
         Удаление элемента по ключу
         Средняя сложность: O(1 + α)
         """
-        index = self._hash(key)
-        current = self.table[index]
-        prev = None
+        self._rehash_step()
+        buckets = [(self.table, self._hash(key))]
+        old_index = self._old_bucket(key)
+        if old_index is not None:
+            buckets.append((self._old_table, old_index))
         
-        while current:
-            if current.key == key:
-                if prev:
-                    prev.next = current.next
-                else:
-                    self.table[index] = current.next
-                self.size -= 1
-                return True
-            prev = current
-            current = current.next
+        for table, index in buckets:
+            current = table[index]
+            prev = None
+            
+            while current:
+                if current.key == key:
+                    if prev:
+                        prev.next = current.next
+                    else:
+                        table[index] = current.next
+                    self.size -= 1
+                    self._check_resize()
+                    return True
+                prev = current
+                current = current.next
         
         return False  # Ключ не найден
     
+    def _bulk_indexes(self, keys):
+        """Индексы ячеек для всех ключей за один проход (перенос завершается)"""
+        self._finish_rehash()
+        capacity = self.capacity
+        hash_func = self.hash_func
+        if self.seed is None:
+            return [hash_func(key, capacity) for key in keys]
+        seed = self.seed
+        return [hash_func(key, capacity, seed) for key in keys]
+    
+    def insert_many(self, items):
+        """
+        Пакетная вставка пар (ключ, значение): таблица сразу увеличивается
+        под итоговый размер (перенос целиком), индексы всего пакета
+        вычисляются за один проход, узлы добавляются без проверок размера
+        Средняя сложность: O(k) для k пар
+        """
+        items = list(items)
+        self._finish_rehash()
+        capacity = self._target_capacity(self.size + len(items))
+        if capacity > self.capacity:
+            self._start_resize(capacity)
+            self._finish_rehash()
+        
+        table = self.table
+        indexes = self._bulk_indexes([key for key, _ in items])
+        longest = 0
+        for (key, value), index in zip(items, indexes):
+            current = table[index]
+            chain_length = 1
+            while current:
+                if current.key == key:
+                    current.value = value
+                    break
+                current = current.next
+                chain_length += 1
+            else:
+                # Новый узел - в начало цепочки
+                node = Node(key, value)
+                node.next = table[index]
+                table[index] = node
+                self.size += 1
+                if chain_length > longest:
+                    longest = chain_length
+        if self._is_pathological(longest):
+            self._reseed()
+        self._check_resize()
+    
+    def get_many(self, keys):
+        """Значения для списка ключей (None для отсутствующих)"""
+        keys = list(keys)
+        table = self.table
+        values = []
+        for key, index in zip(keys, self._bulk_indexes(keys)):
+            current = table[index]
+            while current and current.key != key:
+                current = current.next
+            values.append(current.value if current else None)
+        return values
+    
+    def delete_many(self, keys):
+        """
+        Пакетное удаление: уменьшение таблицы - один раз в конце
+        Возвращает число удаленных элементов
+        """
+        keys = list(keys)
+        table = self.table
+        deleted = 0
+        for key, index in zip(keys, self._bulk_indexes(keys)):
+            current = table[index]
+            prev = None
+            while current:
+                if current.key == key:
+                    if prev:
+                        prev.next = current.next
+                    else:
+                        table[index] = current.next
+                    deleted += 1
+                    break
+                prev = current
+                current = current.next
+        self.size -= deleted
+        self._check_resize()
+        return deleted
+    
+    @classmethod
+    def from_items(cls, items, **kwargs):
+        """Таблица из пар (ключ, значение); kwargs - параметры конструктора"""
+        ht = cls(**kwargs)
+        ht.insert_many(items)
+        return ht
+    
     def get_load_factor(self):
         """Коэффициент заполнения таблицы"""
         return self.size / self.capacity
     
     def display(self):
         """Вывод содержимого таблицы"""
+        self._finish_rehash()
         print("\n📋 СОДЕРЖАНИЕ ХЕШ-ТАБЛИЦЫ:")
         print("=" * 40)
         print(f"Размер: {self.size}/{self.capacity}")
@@ -195,6 +465,100 @@ def measure_performance():
     print(f"  Итоговый размер: {ht.size}")
 
 
+def benchmark_resize_latency(count=10 ** 7):
+    """
+    Хвост задержек вставки: перехеширование целиком против постепенного
+    Ключи - целые числа, хеш - мультипликативный (быстрее строковых)
+    Для 10^7 вставок нужно несколько ГБ памяти и несколько минут
+    """
+    print(f"\n⏱️ ЗАДЕРЖКИ ВСТАВКИ ПРИ РОСТЕ ТАБЛИЦЫ (n={count})")
+    print("=" * 40)
+    
+    import gc
+    import time
+    from array import array
+    from hash_functions import multiplicative_hash
+    
+    clock = time.perf_counter_ns
+    print(f"{'Перехеширование':<16}{'p50':>8}{'p99':>8}{'p99.9':>9}{'max, мс':>11}{'всего, с':>10}")
+    for name, incremental in (("целиком", False), ("постепенное", True)):
+        ht = HashTableChaining(capacity=16, hash_func=multiplicative_hash,
+                               incremental=incremental)
+        latencies = array("q", bytes(8 * count))
+        # Сборщик мусора обходит все узлы - его паузы заслонили бы паузы таблицы
+        gc.disable()
+        try:
+            total_start = clock()
+            for key in range(count):
+                start = clock()
+                ht.insert(key, key)
+                latencies[key] = clock() - start
+            total = (clock() - total_start) / 1e9
+        finally:
+            gc.enable()
+        
+        ordered = sorted(latencies)
+        p50, p99, p999 = (ordered[int(count * q)] for q in (0.5, 0.99, 0.999))
+        print(f"{name:<16}{p50 / 1e3:>6.1f}мк{p99 / 1e3:>6.1f}мк{p999 / 1e3:>7.1f}мк"
+              f"{ordered[-1] / 1e6:>11.2f}{total:>10.2f}")
+        print(f"  увеличений: {ht.resizes}, итоговая емкость: {ht.capacity}")
+
+
+def benchmark_bulk_load(count=10 ** 7):
+    """
+    Загрузка count пар: цикл insert (как в measure_performance) против
+    from_items (одно увеличение, хеши пакета за один проход) для всех таблиц
+    Ключи - целые числа, хеш - мультипликативный
+    Для 10^7 пар нужно несколько ГБ памяти и десятки минут
+    """
+    print(f"\n⏱️ ПАКЕТНАЯ ЗАГРУЗКА (n={count})")
+    print("=" * 60)
+    
+    import gc
+    import time
+    from hash_functions import multiplicative_hash
+    from hash_table_compact import CompactHashTable
+    from hash_table_cuckoo import HashTableCuckoo
+    from hash_table_open_addressing import HashTableOpenAddressing
+    from hash_table_robin_hood import HashTableRobinHood
+    
+    # Без защиты от атак: переход на SipHash замерил бы хеш-функцию
+    tables = [
+        ("цепочки", HashTableChaining, {"max_chain_length": None}),
+        ("открытая", HashTableOpenAddressing, {"max_probe_length": None, "verbose": False}),
+        ("Robin Hood", HashTableRobinHood, {"max_probe_length": None, "verbose": False}),
+        ("компактная", CompactHashTable, {}),
+        ("кукушкина", HashTableCuckoo, {}),
+    ]
+    pairs = [(key, key) for key in range(count)]
+    
+    print(f"{'Таблица':<12}{'insert, с':>11}{'from_items, с':>15}{'Ускорение':>11}"
+          f"{'Увеличений':>12}")
+    for name, table_class, kwargs in tables:
+        kwargs = dict(kwargs, hash_func=multiplicative_hash)
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            ht = table_class(**kwargs)
+            for key, value in pairs:
+                ht.insert(key, value)
+            loop_time = time.perf_counter() - start
+            loop_resizes = ht.resizes
+            del ht
+            
+            start = time.perf_counter()
+            ht = table_class.from_items(pairs, **kwargs)
+            bulk_time = time.perf_counter() - start
+        finally:
+            gc.enable()
+        assert ht.size == count and ht.get_many([0, count - 1]) == [0, count - 1]
+        print(f"{name:<12}{loop_time:>11.2f}{bulk_time:>15.2f}{loop_time / bulk_time:>10.2f}x"
+              f"{loop_resizes:>6} -> {ht.resizes}")
+        del ht
+
+
 if __name__ == "__main__":
     test_hash_table()
-    measure_performance()
\ No newline at end of file
+    measure_performance()
+    benchmark_resize_latency(10 ** 5)  # Полный замер: benchmark_resize_latency(10 ** 7)
+    benchmark_bulk_load(10 ** 5)  # Полный замер: benchmark_bulk_load(10 ** 7)
\ No newline at end of file
@@ -0,0 +1,353 @@
+"""
+Компактная хеш-таблица по образцу dict в CPython (3.6+).
+
+Элементы не хранятся в самой хеш-таблице:
+  - индексная таблица (indices) - массив array с номерами записей,
+    тип элемента самый узкий из подходящих для емкости (1-8 байт)
+  - записи - плотные параллельные массивы hashes (array 'Q'), keys,
+    values в порядке вставки, без объектов-узлов и кортежей
+Полный хеш ключа хранится в hashes: сравнение начинается с хешей,
+а при изменении размера индексы строятся по сохраненным хешам.
+Пробирование - как в CPython: i = 5i + 1 + perturb, perturb >>= 5,
+так в выборе ячейки участвуют все биты хеша.
+"""
+
+from array import array
+
+from hash_functions import FULL_HASH_SIZE, KEYED_HASH_FUNCTIONS, fnv1a_hash, random_seed
+
+EMPTY = -1  # Ячейка индекса свободна
+DUMMY = -2  # Запись удалена (серия проб продолжается)
+
+PERTURB_SHIFT = 5
+
+# Запись занята, пока их меньше 2/3 емкости индекса
+USABLE_FRACTION = 2 / 3
+# При перестроении емкость выбирается под size * GROWTH_RATE
+GROWTH_RATE = 3
+
+MIN_CAPACITY = 8
+
+
+def _index_typecode(capacity):
+    """Самый узкий знаковый тип array для номеров записей (и DUMMY)"""
+    for typecode in ("b", "h", "i", "q"):
+        if capacity <= 2 ** (8 * array(typecode).itemsize - 1):
+            return typecode
+    raise OverflowError("слишком большая емкость")
+
+
+class _Deleted:
+    """Маркер удаленной записи в keys"""
+    def __repr__(self):
+        return "DELETED"
+
+
+DELETED = _Deleted()
+
+
+class CompactHashTable:
+    """
+    Компактная хеш-таблица (индекс + плотные массивы записей)
+    Сложность операций в среднем случае: O(1)
+    Сложность в худшем случае: O(n)
+    hash_func(key, table_size) - хеш-функция таблицы (см. hash_functions)
+    Хеш-функции с ключом (SipHash) получают случайный seed таблицы.
+    Емкость индекса - степень двойки; записей (включая удаленные) не больше
+    2/3 емкости. Удаленные записи остаются в массивах до перестроения,
+    которое уплотняет записи и может уменьшить таблицу.
+    Обход (items) - в порядке вставки
+    """
+
+    def __init__(self, capacity=MIN_CAPACITY, hash_func=fnv1a_hash, seed=None):
+        self.capacity = MIN_CAPACITY  # Размер индекса (степень двойки)
+        while self.capacity < capacity:
+            self.capacity *= 2
+        self.size = 0  # Количество элементов
+        self.hash_func = hash_func
+        self.seed = None
+        if hash_func in KEYED_HASH_FUNCTIONS:
+            self.seed = random_seed() if seed is None else seed
+        self.resizes = 0  # Сколько раз перестраивался индекс
+        self.indices = array(_index_typecode(self.capacity), [EMPTY]) * self.capacity
+        self.hashes = array("Q")  # Полные хеши записей
+        self.keys = []
+        self.values = []
+        self._usable = int(self.capacity * USABLE_FRACTION)
+
+    def _full_hash(self, key):
+        """Полный хеш ключа, не зависящий от емкости"""
+        if self.seed is None:
+            return self.hash_func(key, FULL_HASH_SIZE)
+        return self.hash_func(key, FULL_HASH_SIZE, self.seed)
+
+    def _lookup(self, key, full_hash):
+        """
+        Ячейка индекса для key: (ячейка, номер записи) если ключ есть,
+        иначе (первая свободная или DUMMY ячейка на пути, EMPTY)
+        """
+        indices = self.indices
+        mask = self.capacity - 1
+        perturb = full_hash
+        i = full_hash & mask
+        free_slot = None
+        while True:
+            ix = indices[i]
+            if ix == EMPTY:
+                return (i if free_slot is None else free_slot), EMPTY
+            if ix == DUMMY:
+                if free_slot is None:
+                    free_slot = i
+            elif self.hashes[ix] == full_hash and self.keys[ix] == key:
+                return i, ix
+            perturb >>= PERTURB_SHIFT
+            i = (i * 5 + perturb + 1) & mask
+
+    def _build_indices(self, capacity):
+        """Индекс емкости capacity по сохраненным хешам записей"""
+        indices = array(_index_typecode(capacity), [EMPTY]) * capacity
+        mask = capacity - 1
+        for ix, full_hash in enumerate(self.hashes):
+            perturb = full_hash
+            i = full_hash & mask
+            while indices[i] != EMPTY:
+                perturb >>= PERTURB_SHIFT
+                i = (i * 5 + perturb + 1) & mask
+            indices[i] = ix
+        return indices
+
+    def _resize(self, expected=0):
+        """
+        Уплотнение записей и новый индекс под size * GROWTH_RATE
+        (и не меньше чем под expected записей без перестроения)
+        Хеши не вычисляются заново. Сложность: O(n + capacity)
+        """
+        if len(self.keys) != self.size:
+            live = [ix for ix, key in enumerate(self.keys) if key is not DELETED]
+            self.hashes = array("Q", [self.hashes[ix] for ix in live])
+            self.keys = [self.keys[ix] for ix in live]
+            self.values = [self.values[ix] for ix in live]
+
+        capacity = MIN_CAPACITY
+        while (capacity * USABLE_FRACTION <= self.size * GROWTH_RATE
+               or int(capacity * USABLE_FRACTION) < expected):
+            capacity *= 2
+        self.resizes += 1
+        self.capacity = capacity
+        self.indices = self._build_indices(capacity)
+        self._usable = int(capacity * USABLE_FRACTION)
+
+    def insert(self, key, value):
+        """
+        Вставка элемента в таблицу
+        Средняя сложность: O(1)
+        """
+        full_hash = self._full_hash(key)
+        slot, ix = self._lookup(key, full_hash)
+        if ix != EMPTY:
+            self.values[ix] = value  # Ключ уже есть - обновляем значение
+            return True
+
+        if len(self.keys) >= self._usable:
+            self._resize()
+            slot, _ = self._lookup(key, full_hash)
+        self.indices[slot] = len(self.keys)
+        self.hashes.append(full_hash)
+        self.keys.append(key)
+        self.values.append(value)
+        self.size += 1
+        return True
+
+    def search(self, key):
+        """
+        Поиск элемента по ключу
+        Средняя сложность: O(1)
+        """
+        _, ix = self._lookup(key, self._full_hash(key))
+        return None if ix == EMPTY else self.values[ix]
+
+    def delete(self, key):
+        """
+        Удаление элемента по ключу: ячейка индекса становится DUMMY,
+        запись - DELETED (место освобождается при перестроении)
+        Средняя сложность: O(1)
+        """
+        slot, ix = self._lookup(key, self._full_hash(key))
+        if ix == EMPTY:
+            return False
+        self.indices[slot] = DUMMY
+        self.keys[ix] = DELETED
+        self.values[ix] = None
+        self.size -= 1
+        return True
+
+    def insert_many(self, items):
+        """
+        Пакетная вставка пар (ключ, значение): индекс перестраивается
+        не больше одного раза - сразу под итоговое число записей,
+        хеши всего пакета вычисляются за один проход
+        Средняя сложность: O(k) для k пар
+        """
+        items = list(items)
+        if len(self.keys) + len(items) > self._usable:
+            self._resize(self.size + len(items))
+        full_hashes = [self._full_hash(key) for key, _ in items]
+        for (key, value), full_hash in zip(items, full_hashes):
+            slot, ix = self._lookup(key, full_hash)
+            if ix != EMPTY:
+                self.values[ix] = value
+                continue
+            self.indices[slot] = len(self.keys)
+            self.hashes.append(full_hash)
+            self.keys.append(key)
+            self.values.append(value)
+            self.size += 1
+
+    def get_many(self, keys):
+        """Значения для списка ключей (None для отсутствующих)"""
+        keys = list(keys)
+        full_hashes = [self._full_hash(key) for key in keys]
+        values = []
+        for key, full_hash in zip(keys, full_hashes):
+            _, ix = self._lookup(key, full_hash)
+            values.append(None if ix == EMPTY else self.values[ix])
+        return values
+
+    def delete_many(self, keys):
+        """Пакетное удаление. Возвращает число удаленных элементов"""
+        keys = list(keys)
+        full_hashes = [self._full_hash(key) for key in keys]
+        deleted = 0
+        for key, full_hash in zip(keys, full_hashes):
+            slot, ix = self._lookup(key, full_hash)
+            if ix == EMPTY:
+                continue
+            self.indices[slot] = DUMMY
+            self.keys[ix] = DELETED
+            self.values[ix] = None
+            deleted += 1
+        self.size -= deleted
+        return deleted
+
+    @classmethod
+    def from_items(cls, items, **kwargs):
+        """Таблица из пар (ключ, значение); kwargs - параметры конструктора"""
+        ht = cls(**kwargs)
+        ht.insert_many(items)
+        return ht
+
+    def items(self):
+        """Пары (ключ, значение) в порядке вставки"""
+        for key, value in zip(self.keys, self.values):
+            if key is not DELETED:
+                yield key, value
+
+    def get_load_factor(self):
+        """Коэффициент заполнения индекса"""
+        return self.size / self.capacity
+
+    def display(self):
+        """Вывод содержимого таблицы"""
+        print("\n📋 СОДЕРЖАНИЕ КОМПАКТНОЙ ХЕШ-ТАБЛИЦЫ:")
+        print("=" * 40)
+        print(f"Размер: {self.size}/{self.capacity}")
+        print(f"Коэф. заполнения: {self.get_load_factor():.2f}")
+        print(f"Индекс ({self.indices.typecode}): {self.indices.tolist()}")
+        for ix, (key, value) in enumerate(zip(self.keys, self.values)):
+            print(f"[{ix}]: {key} -> {value}")
+
+
+def benchmark_compact(count=10 ** 6):
+    """
+    Память (tracemalloc, байт на элемент без самих ключей и значений)
+    и скорость вставки, поиска и удаления: метод цепочек, открытая
+    адресация, Robin Hood, компактная таблица и встроенный dict
+    """
+    print(f"\nПАМЯТЬ И СКОРОСТЬ ХЕШ-ТАБЛИЦ (n={count})")
+    print("=" * 70)
+
+    import gc
+    import time
+    import tracemalloc
+    from hash_table_chaining import HashTableChaining
+    from hash_table_open_addressing import HashTableOpenAddressing
+    from hash_table_robin_hood import HashTableRobinHood
+
+    class DictTable(dict):
+        """dict с интерфейсом таблиц лабораторной"""
+        insert = dict.__setitem__
+        search = dict.get
+
+        def delete(self, key):
+            return self.pop(key, DELETED) is not DELETED
+
+    # Все таблицы на FNV-1a: без защиты от атак - переход на SipHash
+    # (чистый Python) замерил бы хеш-функцию, а не устройство таблицы
+    tables = [
+        ("цепочки", lambda: HashTableChaining(capacity=16, max_chain_length=None)),
+        ("открытая", lambda: HashTableOpenAddressing(capacity=16, max_probe_length=None,
+                                                     verbose=False)),
+        ("Robin Hood", lambda: HashTableRobinHood(capacity=16, max_probe_length=None,
+                                                  verbose=False)),
+        ("компактная", lambda: CompactHashTable()),
+        ("dict", DictTable),
+    ]
+    # Ключи создаются заранее и служат значениями - в замер памяти не входят
+    keys = [f"key_{i}" for i in range(count)]
+
+    print(f"{'Таблица':<12}{'байт/элем.':>12}{'Вставка':>14}{'Поиск':>14}{'Удаление':>14}")
+    print(f"{'':<12}{'':>12}{'тыс. оп/с':>14}{'тыс. оп/с':>14}{'тыс. оп/с':>14}")
+    for name, make in tables:
+        tracemalloc.start()
+        ht = make()
+        for key in keys:
+            ht.insert(key, key)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del ht
+
+        gc.disable()
+        try:
+            ht = make()
+            rates = []
+            for operation in ("insert", "search", "delete"):
+                method = getattr(ht, operation)
+                start = time.perf_counter()
+                if operation == "insert":
+                    for key in keys:
+                        method(key, key)
+                else:
+                    for key in keys:
+                        method(key)
+                rates.append(count / (time.perf_counter() - start))
+        finally:
+            gc.enable()
+        print(f"{name:<12}{memory / count:>12.1f}"
+              + "".join(f"{rate / 1e3:>14.1f}" for rate in rates))
+
+
+def test_compact():
+    """Тестирование компактной хеш-таблицы"""
+    print("🧪 ТЕСТИРОВАНИЕ КОМПАКТНОЙ ХЕШ-ТАБЛИЦЫ")
+    print("=" * 40)
+
+    ht = CompactHashTable()
+    test_data = [("apple", 10), ("banana", 20), ("orange", 30), ("grape", 40),
+                 ("kiwi", 50), ("melon", 60)]
+    for key, value in test_data:
+        ht.insert(key, value)
+    ht.display()
+
+    print("\nУДАЛЕНИЕ orange:")
+    ht.delete("orange")
+    ht.display()
+    for key, value in test_data:
+        expected = None if key == "orange" else value
+        assert ht.search(key) == expected, key
+    assert [key for key, _ in ht.items()] == ["apple", "banana", "grape", "kiwi", "melon"]
+    print("Поиск и порядок обхода после удаления правильные")
+
+
+if __name__ == "__main__":
+    test_compact()
+    benchmark_compact(count=10 ** 5)  # Полный замер: benchmark_compact()
@@ -0,0 +1,432 @@
+"""
+Кукушкино хеширование (cuckoo hashing) с гарантированным временем поиска.
+
+Каждый ключ может лежать только в одной из ways ячеек-корзин
+(по одной на хеш-функцию), в корзине bucket_size мест. Поиск
+просматривает не больше ways * bucket_size мест таблицы и stash_size
+мест тайника (stash) - константа, не зависящая от n и от заполнения.
+
+Вставка: свободное место в одной из своих корзин, иначе элемент
+вытесняет ("выталкивает") случайного соседа, тот переходит в другую
+свою корзину и т.д. - не больше max_kicks шагов. Оставшийся без места
+элемент кладется в небольшой тайник; если и тайник полон - цикл,
+таблица перехешируется с новым seed (и увеличивается, если не помогло).
+
+Хеш-функции корзин получаются из одного 64-битного хеша ключа двойным
+хешированием: bucket_i = (h1 + i * h2) mod число корзин, где h1, h2 -
+половины хеша, h2 нечетный. Число корзин - степень двойки (не меньше ways),
+поэтому i * h2 не делится на него и все ways корзин ключа различны.
+Полные хеши хранятся рядом с ключами.
+"""
+
+import random
+
+from hash_functions import (FULL_HASH_SIZE, KEYED_HASH_FUNCTIONS, MASK64, _fmix64,
+                            fnv1a_hash, random_seed, siphash24)
+
+MAX_KICKS = 500  # Длина цепочки вытеснений до перехода в тайник
+STASH_SIZE = 4  # Мест в тайнике (столько же лишних проверок при поиске)
+MAX_REBUILD_ATTEMPTS = 3  # Попыток перехеширования с новым seed до смены хеша/увеличения
+
+
+def bucket_count(buckets, ways):
+    """
+    Число корзин, округленное вверх до степени двойки и не меньше ways:
+    при нечетном шаге h2 корзины (h1 + i * h2) mod число корзин для
+    i < ways попарно различны
+    """
+    return 1 << (max(buckets, ways) - 1).bit_length()
+
+
+def default_load_factor(ways, bucket_size):
+    """
+    Заполнение, до которого вставка почти всегда удается: порог для
+    2 хешей и корзин по 1 месту - 50%, по 4 места - около 98%,
+    для 3 хешей и корзин по 1 месту - около 91%
+    """
+    if bucket_size >= 4:
+        return 0.9
+    if bucket_size >= 2:
+        return 0.8 if ways == 2 else 0.9
+    return 0.45 if ways == 2 else 0.85
+
+
+class HashTableCuckoo:
+    """
+    Хеш-таблица с кукушкиным хешированием
+    Поиск и удаление в худшем случае: O(ways * bucket_size + stash_size) = O(1)
+    Вставка в среднем: O(1), с ограничением max_kicks вытеснений
+    hash_func(key, table_size) - хеш-функция таблицы (см. hash_functions).
+    Хеш-функции с ключом получают seed таблицы, остальные перемешиваются
+    с seed (fmix64), поэтому перехеширование при цикле возможно для любой.
+    Если новый seed не помогает (много ключей с одинаковым полным хешем,
+    например у simple_hash), таблица переходит на SipHash.
+    Таблица увеличивается вдвое при заполнении больше max_load_factor
+    (по умолчанию - по числу хешей и размеру корзины, см. default_load_factor)
+    """
+
+    def __init__(self, capacity=16, hash_func=fnv1a_hash, ways=2, bucket_size=4,
+                 max_kicks=MAX_KICKS, stash_size=STASH_SIZE, seed=None, max_load_factor=None):
+        if ways < 2:
+            raise ValueError("нужно не меньше двух хеш-функций")
+        self.ways = ways
+        self.bucket_size = bucket_size
+        self.buckets = bucket_count(-(-capacity // bucket_size), ways)  # Число корзин
+        self.capacity = self.buckets * bucket_size  # Мест в таблице (без тайника)
+        self.size = 0  # Количество элементов
+        self.hash_func = hash_func
+        self.seed = random_seed() if seed is None else seed
+        self.max_kicks = max_kicks
+        self.stash_size = stash_size
+        if max_load_factor is None:
+            max_load_factor = default_load_factor(ways, bucket_size)
+        self.max_load_factor = max_load_factor
+        self.resizes = 0  # Сколько раз таблица увеличивалась
+        self.rehashes = 0  # Сколько раз перехеширована из-за цикла
+        self.kicks = 0  # Всего вытеснений
+        self._rng = random.Random(self.seed)
+        # Место корзины b с номером j - индекс b * bucket_size + j
+        self.hashes = [None] * self.capacity  # None - место свободно
+        self.keys = [None] * self.capacity
+        self.values = [None] * self.capacity
+        self.stash = []  # Тайник: [полный хеш, ключ, значение]
+
+    def _full_hash(self, key):
+        """Полный 64-битный хеш ключа с учетом seed таблицы"""
+        if self.hash_func in KEYED_HASH_FUNCTIONS:
+            return self.hash_func(key, FULL_HASH_SIZE, self.seed)
+        return _fmix64(self.hash_func(key, FULL_HASH_SIZE) ^ (self.seed & MASK64))
+
+    def _bucket_starts(self, full_hash):
+        """Индексы первых мест всех корзин ключа (по одной на хеш-функцию)"""
+        h1 = full_hash & 0xFFFFFFFF
+        h2 = (full_hash >> 32) | 1  # Нечетный шаг, корзин 2^k - корзины различаются
+        buckets = self.buckets
+        size = self.bucket_size
+        return [((h1 + i * h2) % buckets) * size for i in range(self.ways)]
+
+    def _find(self, key, full_hash):
+        """Индекс места с ключом, -1 - ключ в тайнике, None - ключа нет"""
+        hashes = self.hashes
+        keys = self.keys
+        for start in self._bucket_starts(full_hash):
+            for index in range(start, start + self.bucket_size):
+                if hashes[index] == full_hash and keys[index] == key:
+                    return index
+        for entry in self.stash:
+            if entry[0] == full_hash and entry[1] == key:
+                return -1
+        return None
+
+    def _place(self, full_hash, key, value):
+        """
+        Размещение нового элемента с вытеснениями
+        Возвращает None или элемент (хеш, ключ, значение), оставшийся
+        без места после max_kicks вытеснений
+        """
+        hashes = self.hashes
+        keys = self.keys
+        values = self.values
+        size = self.bucket_size
+        previous = -1  # Корзина, из которой элемент только что вытеснен
+        for _ in range(self.max_kicks + 1):
+            starts = self._bucket_starts(full_hash)
+            for start in starts:
+                for index in range(start, start + size):
+                    if hashes[index] is None:
+                        hashes[index] = full_hash
+                        keys[index] = key
+                        values[index] = value
+                        return None
+            # Мест нет: выталкиваем случайного соседа не из той же корзины
+            choices = [start for start in starts if start != previous] or starts
+            start = self._rng.choice(choices)
+            index = start + self._rng.randrange(size)
+            full_hash, hashes[index] = hashes[index], full_hash
+            key, keys[index] = keys[index], key
+            value, values[index] = values[index], value
+            previous = start
+            self.kicks += 1
+        return full_hash, key, value
+
+    def _rebuild(self, buckets, reseed, extra=()):
+        """
+        Перераскладка всех элементов (и extra) в buckets корзин (reseed -
+        с новым seed). При неудаче - новый seed; после MAX_REBUILD_ATTEMPTS
+        попыток - переход на SipHash, затем вдвое больше корзин. Без рекурсии
+        """
+        items = [(self.hashes[i], self.keys[i], self.values[i])
+                 for i in range(self.capacity) if self.hashes[i] is not None]
+        items.extend(tuple(entry) for entry in self.stash)
+        items.extend(extra)
+        buckets = bucket_count(buckets, self.ways)
+        attempts = 0
+        while True:
+            if reseed:
+                self.seed = random_seed()
+                self.rehashes += 1
+            self.buckets = buckets
+            self.capacity = buckets * self.bucket_size
+            self.hashes = [None] * self.capacity
+            self.keys = [None] * self.capacity
+            self.values = [None] * self.capacity
+            self.stash = []
+            for full_hash, key, value in items:
+                if reseed:
+                    full_hash = self._full_hash(key)
+                homeless = self._place(full_hash, key, value)
+                if homeless is not None:
+                    if len(self.stash) >= self.stash_size:
+                        break
+                    self.stash.append(list(homeless))
+            else:
+                return
+            # Цикл при перераскладке: другой seed, а потом и больше места
+            reseed = True
+            attempts += 1
+            if attempts % MAX_REBUILD_ATTEMPTS == 0:
+                if self.hash_func is not siphash24:
+                    self.hash_func = siphash24
+                else:
+                    buckets *= 2
+                    self.resizes += 1
+
+    def _resize(self, buckets=None):
+        """Увеличение таблицы (по умолчанию вдвое, хеши не пересчитываются)"""
+        self.resizes += 1
+        self._rebuild(buckets or self.buckets * 2, reseed=False)
+
+    def insert(self, key, value):
+        """
+        Вставка элемента в таблицу
+        Средняя сложность: O(1)
+        """
+        full_hash = self._full_hash(key)
+        if self._update(key, value, full_hash):
+            return True
+        if self.size + 1 > self.capacity * self.max_load_factor:
+            self._resize()
+        self._add(key, value, full_hash)
+        return True
+
+    def _update(self, key, value, full_hash):
+        """Замена значения, если ключ уже есть. Возвращает True, если был"""
+        index = self._find(key, full_hash)
+        if index is None:
+            return False
+        if index >= 0:
+            self.values[index] = value
+        else:
+            for entry in self.stash:
+                if entry[0] == full_hash and entry[1] == key:
+                    entry[2] = value
+        return True
+
+    def _add(self, key, value, full_hash):
+        """Добавление нового ключа без проверки размера"""
+        self.size += 1
+        homeless = self._place(full_hash, key, value)
+        if homeless is not None:
+            if len(self.stash) < self.stash_size:
+                self.stash.append(list(homeless))
+            else:
+                # Цикл вытеснений и тайник полон: перехеширование с новым seed
+                self._rebuild(self.buckets, reseed=True, extra=[homeless])
+
+    def search(self, key):
+        """
+        Поиск элемента по ключу
+        Сложность в худшем случае: O(ways * bucket_size + stash_size)
+        """
+        return self._search_hashed(key, self._full_hash(key))
+
+    def _search_hashed(self, key, full_hash):
+        """Поиск по готовому полному хешу"""
+        hashes = self.hashes
+        h1 = full_hash & 0xFFFFFFFF
+        h2 = (full_hash >> 32) | 1
+        size = self.bucket_size
+        for i in range(self.ways):
+            start = ((h1 + i * h2) % self.buckets) * size
+            for index in range(start, start + size):
+                if hashes[index] == full_hash and self.keys[index] == key:
+                    return self.values[index]
+        for entry in self.stash:
+            if entry[0] == full_hash and entry[1] == key:
+                return entry[2]
+        return None
+
+    def delete(self, key):
+        """
+        Удаление элемента по ключу (без маркеров удаления)
+        Сложность в худшем случае: O(ways * bucket_size + stash_size)
+        """
+        return self._delete_hashed(key, self._full_hash(key))
+
+    def _delete_hashed(self, key, full_hash):
+        """Удаление по готовому полному хешу"""
+        index = self._find(key, full_hash)
+        if index is None:
+            return False
+        self.size -= 1
+        if index < 0:
+            self.stash = [entry for entry in self.stash
+                          if not (entry[0] == full_hash and entry[1] == key)]
+            return True
+        self.hashes[index] = None
+        self.keys[index] = None
+        self.values[index] = None
+        # Освободилось место - элементы тайника пробуют вернуться в таблицу
+        if self.stash:
+            stash = self.stash
+            self.stash = []
+            for entry in stash:
+                homeless = self._place(entry[0], entry[1], entry[2])
+                if homeless is not None:
+                    self.stash.append(list(homeless))
+        return True
+
+    def insert_many(self, items):
+        """
+        Пакетная вставка пар (ключ, значение): таблица сразу увеличивается
+        под итоговый размер, хеши всего пакета вычисляются за один проход,
+        элементы раскладываются без проверок размера по ходу
+        Средняя сложность: O(k) для k пар
+        """
+        items = list(items)
+        buckets = self.buckets
+        while self.size + len(items) > buckets * self.bucket_size * self.max_load_factor:
+            buckets *= 2
+        if buckets != self.buckets:
+            self._resize(buckets)
+        full_hashes = [self._full_hash(key) for key, _ in items]
+        seed, hash_func = self.seed, self.hash_func
+        for (key, value), full_hash in zip(items, full_hashes):
+            if self.seed != seed or self.hash_func is not hash_func:
+                full_hash = self._full_hash(key)  # Перехеширование посреди пакета
+            if not self._update(key, value, full_hash):
+                self._add(key, value, full_hash)
+
+    def get_many(self, keys):
+        """Значения для списка ключей (None для отсутствующих)"""
+        keys = list(keys)
+        full_hashes = [self._full_hash(key) for key in keys]
+        return [self._search_hashed(key, full_hash)
+                for key, full_hash in zip(keys, full_hashes)]
+
+    def delete_many(self, keys):
+        """Пакетное удаление. Возвращает число удаленных элементов"""
+        keys = list(keys)
+        full_hashes = [self._full_hash(key) for key in keys]
+        return sum(self._delete_hashed(key, full_hash)
+                   for key, full_hash in zip(keys, full_hashes))
+
+    @classmethod
+    def from_items(cls, items, **kwargs):
+        """Таблица из пар (ключ, значение); kwargs - параметры конструктора"""
+        ht = cls(**kwargs)
+        ht.insert_many(items)
+        return ht
+
+    def get_load_factor(self):
+        """Коэффициент заполнения таблицы"""
+        return self.size / self.capacity
+
+    def display(self):
+        """Вывод содержимого таблицы"""
+        print("\n📋 СОДЕРЖАНИЕ КУКУШКИНОЙ ХЕШ-ТАБЛИЦЫ:")
+        print("=" * 40)
+        print(f"Размер: {self.size}/{self.capacity}")
+        print(f"Коэф. заполнения: {self.get_load_factor():.2f}")
+        for bucket in range(self.buckets):
+            start = bucket * self.bucket_size
+            slots = [f"{self.keys[i]}: {self.values[i]}" if self.hashes[i] is not None
+                     else "пусто" for i in range(start, start + self.bucket_size)]
+            print(f"[{bucket}]: " + " | ".join(slots))
+        print(f"Тайник: {[(key, value) for _, key, value in self.stash]}")
+
+
+def benchmark_lookup_latency(sizes=(10 ** 6, 10 ** 7), lookups=10 ** 5):
+    """
+    Хвост задержек поиска (p50/p99/p99.9/max) при заполненных таблицах:
+    цепочки, открытая адресация, Robin Hood, компактная и кукушкина
+    Ключи - целые числа, хеш - мультипликативный; половина поисков -
+    отсутствующие ключи. Для 10^7 ключей нужно много ГБ памяти и времени
+    """
+    print("\n⏱️ ЗАДЕРЖКИ ПОИСКА")
+    print("=" * 70)
+
+    import gc
+    import time
+    from hash_functions import multiplicative_hash
+    from hash_table_chaining import HashTableChaining
+    from hash_table_compact import CompactHashTable
+    from hash_table_open_addressing import HashTableOpenAddressing
+    from hash_table_robin_hood import HashTableRobinHood
+
+    # Без защиты от атак: замеряется устройство таблицы, а не SipHash
+    tables = [
+        ("цепочки", lambda: HashTableChaining(capacity=16, hash_func=multiplicative_hash,
+                                              max_chain_length=None)),
+        ("открытая", lambda: HashTableOpenAddressing(
+            capacity=16, hash_func=multiplicative_hash, max_probe_length=None, verbose=False)),
+        ("Robin Hood", lambda: HashTableRobinHood(
+            capacity=16, hash_func=multiplicative_hash, max_probe_length=None, verbose=False)),
+        ("компактная", lambda: CompactHashTable(hash_func=multiplicative_hash)),
+        ("кукушкина 2x4", lambda: HashTableCuckoo(hash_func=multiplicative_hash)),
+        ("кукушкина 3x1", lambda: HashTableCuckoo(hash_func=multiplicative_hash,
+                                                  ways=3, bucket_size=1)),
+    ]
+
+    clock = time.perf_counter_ns
+    rng = random.Random(42)
+    for size in sizes:
+        print(f"\nn = {size}")
+        print(f"{'Таблица':<16}{'α':>6}{'p50':>9}{'p99':>9}{'p99.9':>9}{'max, мкс':>11}")
+        probe_keys = [rng.randrange(2 * size) for _ in range(lookups)]
+        for name, make in tables:
+            ht = make()
+            for key in range(0, 2 * size, 2):  # Четные есть, нечетных нет
+                ht.insert(key, key)
+            latencies = []
+            search = ht.search
+            gc.disable()
+            try:
+                for key in probe_keys:
+                    start = clock()
+                    search(key)
+                    latencies.append(clock() - start)
+            finally:
+                gc.enable()
+            latencies.sort()
+            p50, p99, p999 = (latencies[int(lookups * q)] for q in (0.5, 0.99, 0.999))
+            print(f"{name:<16}{ht.get_load_factor():>6.2f}{p50 / 1e3:>7.2f}мк"
+                  f"{p99 / 1e3:>7.2f}мк{p999 / 1e3:>7.2f}мк{latencies[-1] / 1e3:>11.1f}")
+            del ht
+
+
+def test_cuckoo():
+    """Тестирование кукушкиной хеш-таблицы"""
+    print("🧪 ТЕСТИРОВАНИЕ КУКУШКИНОЙ ХЕШ-ТАБЛИЦЫ")
+    print("=" * 40)
+
+    ht = HashTableCuckoo(capacity=4, bucket_size=2, seed=1)
+    test_data = [("apple", 10), ("banana", 20), ("orange", 30), ("grape", 40),
+                 ("kiwi", 50), ("melon", 60)]
+    for key, value in test_data:
+        ht.insert(key, value)
+    ht.display()
+    print(f"Увеличений: {ht.resizes}, перехеширований: {ht.rehashes}, "
+          f"вытеснений: {ht.kicks}")
+
+    print("\nУДАЛЕНИЕ orange:")
+    ht.delete("orange")
+    for key, value in test_data:
+        expected = None if key == "orange" else value
+        assert ht.search(key) == expected, key
+    print("Поиск после удаления работает правильно")
+
+
+if __name__ == "__main__":
+    test_cuckoo()
+    benchmark_lookup_latency((10 ** 5,))  # Полный замер: benchmark_lookup_latency()
@@ -1,12 +1,15 @@
-def simple_hash(key, table_size):
-    """
-    Простая хеш-функция для строк
-    (Дублируем здесь чтобы не было проблем с импортом)
-    """
-    hash_value = 0
-    for char in str(key):
-        hash_value += ord(char)
-    return hash_value % table_size
+from hash_functions import (FULL_HASH_SIZE, KEYED_HASH_FUNCTIONS, anagram_keys, fnv1a_hash,
+                            random_seed, simple_hash, siphash24)
+
+# Серия проб длиннее этой при α <= 0.7 считается признаком атаки
+MAX_PROBE_LENGTH = 64
+
+# Занятые ячейки (элементы + удаленные) - не больше этой доли таблицы
+MAX_LOAD_FACTOR = 0.7
+# Удаленных больше этой доли - очистка без изменения размера
+MAX_TOMBSTONE_FACTOR = 0.25
+# Элементов меньше этой доли - уменьшение таблицы вдвое
+MIN_LOAD_FACTOR = 0.1
 
 
 class HashTableOpenAddressing:
@@ -14,17 +17,74 @@ class HashTableOpenAddressing:
     Хеш-таблица с открытой адресацией (линейное пробирование)
     Сложность операций в среднем случае: O(1/(1-α))
     Сложность в худшем случае: O(n)
+    hash_func(key, table_size) - хеш-функция таблицы (см. hash_functions)
+    Хеш-функции с ключом (SipHash) получают случайный seed таблицы.
+    Защита от атаки коллизиями: если вставка потребовала больше
+    max_probe_length проб, таблица переходит на SipHash с новым случайным
+    seed и перехеширует элементы (max_probe_length=None - отключить)
+    
+    Удаленные ячейки (DELETED) удлиняют серии проб так же, как элементы,
+    поэтому учитываются отдельно (tombstones) и периодически вычищаются
+    перехешированием без изменения размера. При α < min_load_factor
+    таблица уменьшается вдвое (None - не уменьшать), при заполнении больше
+    max_load_factor - увеличивается в growth_factor раз (None - только когда
+    свободных ячеек нет). verbose=False отключает сообщения об изменении размера
+    
+    Полный (64-битный) хеш ключа вычисляется один раз и хранится рядом
+    с элементом (hashes): сравнение ключей начинается с хешей, а изменение
+    размера раскладывает элементы по сохраненным хешам без вызова insert
     """
     
-    def __init__(self, capacity=10):
+    def __init__(self, capacity=10, hash_func=fnv1a_hash, max_probe_length=MAX_PROBE_LENGTH,
+                 seed=None, min_load_factor=MIN_LOAD_FACTOR, verbose=True,
+                 max_load_factor=MAX_LOAD_FACTOR, growth_factor=2):
         self.capacity = capacity  # Размер таблицы
         self.size = 0  # Количество элементов
+        self.tombstones = 0  # Количество ячеек DELETED
         self.table = [None] * capacity  # Основная таблица
+        self.hashes = [None] * capacity  # Полные хеши элементов (None - нет элемента)
+        self.growth_factor = growth_factor
         self.DELETED = "DELETED"  # Маркер удаленного элемента
+        self.min_load_factor = min_load_factor
+        self.max_load_factor = max_load_factor
+        self.verbose = verbose
+        self.resizes = 0  # Сколько раз менялся размер
+        self.cleanups = 0  # Сколько раз таблица очищена от удаленных
+        self._min_capacity = capacity
+        self.hash_func = hash_func
+        self.seed = None
+        if hash_func in KEYED_HASH_FUNCTIONS:
+            self.seed = random_seed() if seed is None else seed
+        self.max_probe_length = max_probe_length
+        self.reseeds = 0  # Сколько раз таблица перехеширована из-за атаки
+        self._reseed_size = 0  # Размер при последнем перехешировании
+    
+    def _full_hash(self, key):
+        """Полный хеш ключа, не зависящий от емкости"""
+        if self.seed is None:
+            return self.hash_func(key, FULL_HASH_SIZE)
+        return self.hash_func(key, FULL_HASH_SIZE, self.seed)
     
     def _hash(self, key):
         """Вычисление хеша для ключа"""
-        return simple_hash(str(key), self.capacity)
+        return self._full_hash(key) % self.capacity
+    
+    def _is_pathological(self, probe_length):
+        """
+        Слишком длинная серия проб - вероятно, подобранные ключи.
+        Не чаще одного перехеширования на удвоение числа элементов
+        """
+        return (self.max_probe_length is not None
+                and probe_length > self.max_probe_length
+                and self.size >= 2 * self._reseed_size)
+    
+    def _reseed(self):
+        """Переход на SipHash с новым случайным seed и перехеширование"""
+        self.hash_func = siphash24  # Стойкая к подбору коллизий без знания seed
+        self.seed = random_seed()
+        self.reseeds += 1
+        self._reseed_size = self.size
+        self._rebuild(self.capacity, rehash=True)
     
     def _linear_probe(self, hash_val, i):
         """Линейное пробирование"""
@@ -35,37 +95,78 @@ class HashTableOpenAddressing:
         Вставка элемента в таблицу
         Средняя сложность: O(1/(1-α))
         """
-        # Проверяем нужно ли увеличивать таблицу
-        if self.size >= self.capacity * 0.7:  # При 70% заполнения
-            self._resize()
+        # Проверяем нужно ли увеличивать таблицу: удаленные ячейки
+        # занимают место в сериях проб наравне с элементами
+        if (self.max_load_factor is not None
+                and self.size + self.tombstones >= self.capacity * self.max_load_factor):
+            if self.size >= self.capacity * self.max_load_factor / 2:
+                self._resize()
+            else:
+                self._resize(self.capacity)  # В основном удаленные - просто очищаем
+        elif self.size == self.capacity:
+            self._resize()  # Без порога заполнения - только когда мест нет совсем
         
-        index = self._hash(key)
+        probes = self._insert_hashed(key, value, self._full_hash(key))
+        if self._is_pathological(probes):
+            self._reseed()
+        return True
+    
+    def _insert_hashed(self, key, value, full_hash):
+        """
+        Вставка по готовому полному хешу, без проверок размера
+        Возвращает длину серии проб для нового элемента, 0 - если ключ
+        уже был, None - если свободной ячейки нет
+        """
+        index = full_hash % self.capacity
+        first_deleted = None  # Первая ячейка DELETED на пути
         
-        # Линейное пробирование для поиска свободной ячейки
+        # Линейное пробирование: ключ может оказаться дальше удаленных
+        # ячеек, поэтому идем до пустой ячейки, запомнив первую DELETED
         for i in range(self.capacity):
             probe_index = self._linear_probe(index, i)
+            item = self.table[probe_index]
             
-            # Если ячейка пуста или содержит DELETED
-            if self.table[probe_index] is None or self.table[probe_index] == self.DELETED:
+            # Пустая ячейка - ключа в таблице нет
+            if item is None:
+                if first_deleted is not None:
+                    probe_index = first_deleted
+                    self.tombstones -= 1
                 self.table[probe_index] = (key, value)
+                self.hashes[probe_index] = full_hash
                 self.size += 1
-                return True
+                return i + 1
+            
+            if item == self.DELETED:
+                if first_deleted is None:
+                    first_deleted = probe_index
+                continue
             
             # Если ключ уже существует - обновляем значение
-            if self.table[probe_index][0] == key:
+            if self.hashes[probe_index] == full_hash and item[0] == key:
                 self.table[probe_index] = (key, value)
-                return True
+                return 0
+        
+        # Пустых ячеек нет, но есть удаленная - ключа точно нет в таблице,
+        # а серия проб прошла всю таблицу
+        if first_deleted is not None:
+            self.table[first_deleted] = (key, value)
+            self.hashes[first_deleted] = full_hash
+            self.tombstones -= 1
+            self.size += 1
+            return self.capacity
         
-        # Если не нашли свободную ячейку (должно быть редко)
-        self._resize()
-        return self.insert(key, value)  # Пробуем снова после ресайза
+        return None
     
     def search(self, key):
         """
         Поиск элемента по ключу
         Средняя сложность: O(1/(1-α))
         """
-        index = self._hash(key)
+        return self._search_hashed(key, self._full_hash(key))
+    
+    def _search_hashed(self, key, full_hash):
+        """Поиск по готовому полному хешу"""
+        index = full_hash % self.capacity
         
         # Линейное пробирование
         for i in range(self.capacity):
@@ -79,8 +180,8 @@ class HashTableOpenAddressing:
             if self.table[probe_index] == self.DELETED:
                 continue
             
-            # Если нашли ключ
-            if self.table[probe_index][0] == key:
+            # Если нашли ключ (сначала сравниваем сохраненные хеши)
+            if self.hashes[probe_index] == full_hash and self.table[probe_index][0] == key:
                 return self.table[probe_index][1]
         
         return None  # Ключ не найден
@@ -90,7 +191,14 @@ class HashTableOpenAddressing:
         Удаление элемента по ключу
         Средняя сложность: O(1/(1-α))
         """
-        index = self._hash(key)
+        if not self._delete_hashed(key, self._full_hash(key)):
+            return False
+        self._check_shrink()
+        return True
+    
+    def _delete_hashed(self, key, full_hash):
+        """Удаление по готовому полному хешу, без уменьшения таблицы"""
+        index = full_hash % self.capacity
         
         # Линейное пробирование
         for i in range(self.capacity):
@@ -105,29 +213,132 @@ class HashTableOpenAddressing:
                 continue
             
             # Если нашли ключ - помечаем как удаленный
-            if self.table[probe_index][0] == key:
+            if self.hashes[probe_index] == full_hash and self.table[probe_index][0] == key:
                 self.table[probe_index] = self.DELETED
+                self.hashes[probe_index] = None
                 self.size -= 1
+                self.tombstones += 1
                 return True
         
         return False  # Ключ не найден
     
-    def _resize(self):
-        """Увеличение размера таблицы при переполнении"""
-        print(f"  Ресайз таблицы: {self.capacity} -> {self.capacity * 2}")
-        
-        old_table = self.table
-        old_capacity = self.capacity
-        
-        self.capacity *= 2
-        self.table = [None] * self.capacity
-        self.size = 0
-        
-        # Перехеширование всех элементов
-        for item in old_table:
-            if item is not None and item != self.DELETED:
-                key, value = item
-                self.insert(key, value)
+    def _check_shrink(self):
+        """
+        После удаления: уменьшение таблицы (вдвое, пока α < min_load_factor -
+        после пакетного удаления сразу на нужный размер) или очистка удаленных
+        """
+        capacity = self.capacity
+        if self.min_load_factor is not None:
+            while capacity > self._min_capacity and self.size < capacity * self.min_load_factor:
+                capacity = max(capacity // 2, self._min_capacity)
+        if capacity != self.capacity:
+            self._resize(capacity)
+        elif self.tombstones > self.capacity * MAX_TOMBSTONE_FACTOR:
+            self._resize(self.capacity)
+    
+    def _reserve(self, count):
+        """
+        Подготовка к вставке до count элементов: одно увеличение (или очистка
+        удаленных) заранее, чтобы по ходу вставки размер не менялся
+        """
+        limit = self.max_load_factor if self.max_load_factor is not None else 1.0
+        if count + self.tombstones < self.capacity * limit:
+            return
+        capacity = self.capacity
+        while count >= capacity * limit:
+            capacity = max(int(capacity * self.growth_factor), capacity + 1)
+        self._resize(capacity)
+    
+    def insert_many(self, items):
+        """
+        Пакетная вставка пар (ключ, значение): таблица заранее увеличивается
+        под итоговый размер, хеши всего пакета вычисляются за один проход,
+        элементы раскладываются без проверок размера по ходу
+        Средняя сложность: O(k) для k пар
+        """
+        items = list(items)
+        self._reserve(self.size + len(items))
+        full_hashes = [self._full_hash(key) for key, _ in items]
+        longest = 0
+        for (key, value), full_hash in zip(items, full_hashes):
+            probes = self._insert_hashed(key, value, full_hash)
+            if probes > longest:
+                longest = probes
+        if self._is_pathological(longest):
+            self._reseed()
+    
+    def get_many(self, keys):
+        """Значения для списка ключей (None для отсутствующих)"""
+        keys = list(keys)
+        full_hashes = [self._full_hash(key) for key in keys]
+        return [self._search_hashed(key, full_hash)
+                for key, full_hash in zip(keys, full_hashes)]
+    
+    def delete_many(self, keys):
+        """
+        Пакетное удаление: уменьшение таблицы или очистка - один раз в конце
+        Возвращает число удаленных элементов
+        """
+        keys = list(keys)
+        full_hashes = [self._full_hash(key) for key in keys]
+        deleted = 0
+        for key, full_hash in zip(keys, full_hashes):
+            if self._delete_hashed(key, full_hash):
+                deleted += 1
+        if deleted:
+            self._check_shrink()
+        return deleted
+    
+    @classmethod
+    def from_items(cls, items, **kwargs):
+        """Таблица из пар (ключ, значение); kwargs - параметры конструктора"""
+        ht = cls(**kwargs)
+        ht.insert_many(items)
+        return ht
+    
+    def _resize(self, new_capacity=None):
+        """
+        Перестроение таблицы емкости new_capacity (по умолчанию больше
+        в growth_factor раз). Удаленные ячейки при этом исчезают
+        """
+        if new_capacity is None:
+            new_capacity = max(int(self.capacity * self.growth_factor), self.capacity + 1)
+        new_capacity = max(new_capacity, self.size + 1)
+        if new_capacity == self.capacity:
+            self.cleanups += 1
+            if self.verbose:
+                print(f"  Очистка удаленных: {self.tombstones} ячеек")
+        else:
+            self.resizes += 1
+            if self.verbose:
+                print(f"  Ресайз таблицы: {self.capacity} -> {new_capacity}")
+        self._rebuild(new_capacity)
+    
+    def _rebuild(self, capacity, rehash=False):
+        """
+        Раскладка элементов в новые массивы емкости capacity за один проход:
+        индекс - сохраненный хеш по модулю новой емкости, без вызова insert,
+        проверок порога и рекурсии. rehash=True - хеши вычисляются заново
+        (после смены seed). Сложность: O(n + capacity)
+        """
+        table = [None] * capacity
+        hashes = [None] * capacity
+        for item, full_hash in zip(self.table, self.hashes):
+            if full_hash is None:
+                continue  # Пусто или DELETED
+            if rehash:
+                full_hash = self._full_hash(item[0])
+            index = full_hash % capacity
+            while table[index] is not None:
+                index += 1
+                if index == capacity:
+                    index = 0
+            table[index] = item
+            hashes[index] = full_hash
+        self.table = table
+        self.hashes = hashes
+        self.capacity = capacity
+        self.tombstones = 0
     
     def get_load_factor(self):
         """Коэффициент заполнения таблицы"""
@@ -233,6 +444,173 @@ def compare_methods():
         print(f"   Поиск:   открытая адресация слишком быстрая (< 0.000001 сек)")
 
 
+def benchmark_anagram_attack(count=3000, blocks=6):
+    """
+    Атака коллизиями: вставка анаграмм (одинаковый simple_hash)
+    Время вставки по блокам без защиты, с защитой (переход на SipHash)
+    и с SipHash со случайным seed с самого начала
+    """
+    print("\nАТАКА АНАГРАММАМИ")
+    print("=" * 60)
+    
+    import time
+    from hash_table_chaining import MAX_CHAIN_LENGTH, HashTableChaining
+    
+    keys = anagram_keys(count)
+    block = count // blocks
+    configs = [
+        ("simple_hash, без защиты", simple_hash, False),
+        ("simple_hash + защита", simple_hash, True),
+        ("SipHash с seed", siphash24, True),
+    ]
+    tables = [
+        ("Метод цепочек", lambda hash_func, protect: HashTableChaining(
+            capacity=count, hash_func=hash_func,
+            max_chain_length=MAX_CHAIN_LENGTH if protect else None)),
+        ("Открытая адресация", lambda hash_func, protect: HashTableOpenAddressing(
+            capacity=16, hash_func=hash_func,
+            max_probe_length=MAX_PROBE_LENGTH if protect else None, verbose=False)),
+    ]
+    
+    for table_name, make_table in tables:
+        print(f"\n{table_name} ({count} ключей, мкс на вставку по блокам из {block}):")
+        for name, hash_func, protect in configs:
+            ht = make_table(hash_func, protect)
+            latencies = []
+            for start in range(0, block * blocks, block):
+                begin = time.perf_counter()
+                for key in keys[start:start + block]:
+                    ht.insert(key, key)
+                latencies.append((time.perf_counter() - begin) / block * 1e6)
+            
+            begin = time.perf_counter()
+            for key in keys:
+                ht.search(key)
+            search_time = (time.perf_counter() - begin) / count * 1e6
+            
+            row = " ".join(f"{latency:7.1f}" for latency in latencies)
+            print(f"  {name:<25}{row}  поиск: {search_time:6.1f} мкс"
+                  f"  перехеширований: {ht.reseeds}")
+
+
+def benchmark_churn(operations=10 ** 5, live=10 ** 4, windows=10):
+    """
+    Длительная нагрузка 50/50: вставка нового ключа или удаление случайного
+    существующего при постоянном числе элементов около live.
+    По окнам: скорость, емкость, доля удаленных ячеек и число очисток
+    Полный замер: benchmark_churn(10 ** 7, 10 ** 5) - несколько минут
+    """
+    print(f"\nНАГРУЗКА ВСТАВКА/УДАЛЕНИЕ 50/50 ({operations} операций, ~{live} элементов)")
+    print("=" * 60)
+    
+    import random
+    import time
+    from hash_functions import multiplicative_hash
+    
+    rng = random.Random(42)
+    ht = HashTableOpenAddressing(capacity=16, hash_func=multiplicative_hash, verbose=False)
+    keys = list(range(live))
+    for key in keys:
+        ht.insert(key, key)
+    next_key = live
+    
+    window = operations // windows
+    print(f"{'Операций':>12}{'тыс. оп/с':>12}{'Емкость':>10}{'Удаленных':>11}{'Очисток':>9}")
+    for done in range(window, window * windows + 1, window):
+        start = time.perf_counter()
+        for _ in range(window):
+            if rng.random() < 0.5:
+                ht.insert(next_key, next_key)
+                keys.append(next_key)
+                next_key += 1
+            elif keys:
+                # Удаляем случайный ключ: меняем с последним и убираем
+                i = rng.randrange(len(keys))
+                keys[i], keys[-1] = keys[-1], keys[i]
+                ht.delete(keys.pop())
+        elapsed = time.perf_counter() - start
+        print(f"{done:>12}{window / elapsed / 1e3:>12.1f}{ht.capacity:>10}"
+              f"{ht.tombstones / ht.capacity:>10.1%}{ht.cleanups:>9}")
+    assert ht.size == len(keys)
+
+
+def _legacy_resize(ht, new_capacity):
+    """
+    Прежняя схема увеличения (только для сравнения): новая таблица и
+    вставка каждого элемента как в прежнем insert - проверка порога,
+    повторное хеширование ключа hash_func для новой емкости и линейное
+    пробирование со сравнением ключей. Возвращает новую таблицу
+    """
+    table = [None] * new_capacity
+    size = 0
+    
+    def insert(key, value):
+        nonlocal size
+        if ht.max_load_factor is not None and size >= new_capacity * ht.max_load_factor:
+            raise RuntimeError("прежняя схема увеличила бы таблицу еще раз")
+        if ht.seed is None:
+            index = ht.hash_func(key, new_capacity)
+        else:
+            index = ht.hash_func(key, new_capacity, ht.seed)
+        for i in range(new_capacity):
+            probe_index = (index + i) % new_capacity
+            item = table[probe_index]
+            if item is None or item == ht.DELETED:
+                table[probe_index] = (key, value)
+                size += 1
+                return True
+            if item[0] == key:
+                table[probe_index] = (key, value)
+                return True
+        return False
+    
+    for item in ht.table:
+        if item is not None and item != ht.DELETED:
+            insert(item[0], item[1])
+    return table
+
+
+def benchmark_resize_pause(sizes=(10 ** 5, 10 ** 6, 10 ** 7), load=0.7):
+    """
+    Пауза одного удвоения таблицы, заполненной до load:
+    прежняя схема (_legacy_resize - insert каждого элемента с повторным
+    хешированием) против раскладки по сохраненным хешам (_resize)
+    Для 10^7 элементов нужно несколько ГБ памяти
+    """
+    print("\nПАУЗА ПРИ УДВОЕНИИ ТАБЛИЦЫ (мс)")
+    print("=" * 60)
+    
+    import gc
+    import time
+    
+    print(f"{'Элементов':>12}{'Емкость':>12}{'insert':>12}{'_resize':>12}{'Ускорение':>12}")
+    for size in sizes:
+        capacity = int(size / load) + 1
+        # Без защиты от атак: обе схемы на FNV-1a, без перехода на SipHash
+        ht = HashTableOpenAddressing(capacity=capacity, max_load_factor=None,
+                                     min_load_factor=None, max_probe_length=None,
+                                     verbose=False)
+        for i in range(size):
+            key = f"key_{i}"
+            ht.insert(key, i)
+        
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            legacy = _legacy_resize(ht, capacity * 2)
+            legacy_pause = time.perf_counter() - start
+            del legacy
+            
+            start = time.perf_counter()
+            ht._resize()
+            pause = time.perf_counter() - start
+        finally:
+            gc.enable()
+        assert ht.size == size and ht.search("key_0") == 0
+        print(f"{size:>12}{capacity:>12}{legacy_pause * 1e3:>12.1f}{pause * 1e3:>12.1f}"
+              f"{legacy_pause / pause:>11.1f}x")
+
+
 def test_open_addressing():
     """Тестирование открытой адресации"""
     print("🧪 ТЕСТИРОВАНИЕ ОТКРЫТОЙ АДРЕСАЦИИ")
@@ -327,4 +705,7 @@ if __name__ == "__main__":
     print("\n")
     test_automatic_resize()
     print("\n")
-    compare_methods()
\ No newline at end of file
+    compare_methods()
+    benchmark_anagram_attack()
+    benchmark_churn()
+    benchmark_resize_pause((10 ** 4, 10 ** 5))  # Полный замер: benchmark_resize_pause()
\ No newline at end of file
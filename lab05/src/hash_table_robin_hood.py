@@ -0,0 +1,281 @@
+"""
+Хеш-таблица с открытой адресацией по схеме Robin Hood.
+
+Линейное пробирование, но при вставке "богатый" элемент (стоящий близко
+к своей ячейке) уступает место "бедному" (ушедшему дальше от своей).
+Для каждой ячейки хранится расстояние элемента от его ячейки (probe
+distance), поэтому:
+  - дисперсия длины проб мала, максимальная длина растет медленно
+  - неудачный поиск останавливается, как только расстояние элемента
+    в ячейке меньше пройденного - дальше искомого ключа быть не может
+  - удаление сдвигает следующие элементы назад, маркеры DELETED не нужны
+"""
+
+import random
+import time
+
+from hash_functions import fnv1a_hash
+from hash_table_open_addressing import (MAX_PROBE_LENGTH, MIN_LOAD_FACTOR,
+                                        HashTableOpenAddressing)
+
+# Robin Hood держит короткие серии проб и при высоком заполнении
+MAX_LOAD_FACTOR = 0.9
+
+EMPTY = -1  # Расстояние в пустой ячейке
+
+
+class HashTableRobinHood(HashTableOpenAddressing):
+    """
+    Хеш-таблица с открытой адресацией (Robin Hood)
+    Сложность операций в среднем случае: O(1/(1-α)), но максимальная длина
+    проб - O(log n) с высокой вероятностью
+    Сложность в худшем случае: O(n)
+    distances[i] - расстояние элемента в ячейке i от его ячейки (EMPTY - пусто)
+    """
+
+    def __init__(self, capacity=10, hash_func=fnv1a_hash, max_probe_length=MAX_PROBE_LENGTH,
+                 seed=None, min_load_factor=MIN_LOAD_FACTOR, verbose=True,
+                 max_load_factor=MAX_LOAD_FACTOR, growth_factor=2):
+        super().__init__(capacity, hash_func, max_probe_length, seed, min_load_factor,
+                         verbose, max_load_factor, growth_factor)
+        self.distances = [EMPTY] * capacity
+
+    def _find(self, key, full_hash):
+        """Индекс ячейки с ключом или None (с ранней остановкой)"""
+        distances = self.distances
+        hashes = self.hashes
+        table = self.table
+        index = full_hash % self.capacity
+        dist = 0
+        while True:
+            slot_dist = distances[index]
+            # Пусто или элемент ближе к своей ячейке, чем искомый был бы
+            if slot_dist < dist:
+                return None
+            if hashes[index] == full_hash and table[index][0] == key:
+                return index
+            index = (index + 1) % self.capacity
+            dist += 1
+
+    def _place(self, index, entry, full_hash, dist):
+        """
+        Размещение нового элемента, начиная с ячейки index на расстоянии dist:
+        богатый уступает бедному, вытесненный элемент несется дальше
+        Возвращает число просмотренных ячеек
+        """
+        distances = self.distances
+        hashes = self.hashes
+        table = self.table
+        capacity = self.capacity
+        probes = 1
+        while distances[index] != EMPTY:
+            if distances[index] < dist:
+                table[index], entry = entry, table[index]
+                hashes[index], full_hash = full_hash, hashes[index]
+                distances[index], dist = dist, distances[index]
+            index += 1
+            if index == capacity:
+                index = 0
+            dist += 1
+            probes += 1
+        table[index] = entry
+        hashes[index] = full_hash
+        distances[index] = dist
+        return probes
+
+    def insert(self, key, value):
+        """
+        Вставка элемента в таблицу
+        Средняя сложность: O(1/(1-α))
+        """
+        if self.max_load_factor is not None and self.size >= self.capacity * self.max_load_factor:
+            self._resize()
+        elif self.size == self.capacity:
+            self._resize()
+
+        probes = self._insert_hashed(key, value, self._full_hash(key))
+        if self._is_pathological(probes):
+            self._reseed()
+        return True
+
+    def _insert_hashed(self, key, value, full_hash):
+        """
+        Вставка по готовому полному хешу, без проверок размера
+        Возвращает длину серии проб для нового элемента, 0 - если ключ уже был
+        """
+        distances = self.distances
+        hashes = self.hashes
+        table = self.table
+        index = full_hash % self.capacity
+        dist = 0
+        # Поиск ключа до первой ячейки, где элемент богаче нового:
+        # дальше своего ключа нет (инвариант Robin Hood)
+        while distances[index] >= dist:
+            if hashes[index] == full_hash and table[index][0] == key:
+                table[index] = (key, value)
+                return 0
+            index = (index + 1) % self.capacity
+            dist += 1
+
+        self.size += 1
+        return dist + self._place(index, (key, value), full_hash, dist)
+
+    def _search_hashed(self, key, full_hash):
+        """
+        Поиск по готовому полному хешу
+        Средняя сложность: O(1/(1-α)), неудачный поиск обычно короче
+        """
+        index = self._find(key, full_hash)
+        return None if index is None else self.table[index][1]
+
+    def _delete_hashed(self, key, full_hash):
+        """
+        Удаление со сдвигом назад: следующие элементы серии, стоящие
+        не в своей ячейке, сдвигаются на одну позицию ближе к ней
+        Средняя сложность: O(1/(1-α))
+        """
+        index = self._find(key, full_hash)
+        if index is None:
+            return False
+
+        distances = self.distances
+        hashes = self.hashes
+        table = self.table
+        next_index = (index + 1) % self.capacity
+        while distances[next_index] > 0:
+            table[index] = table[next_index]
+            hashes[index] = hashes[next_index]
+            distances[index] = distances[next_index] - 1
+            index = next_index
+            next_index = (index + 1) % self.capacity
+        table[index] = None
+        hashes[index] = None
+        distances[index] = EMPTY
+        self.size -= 1
+        return True
+
+    def _rebuild(self, capacity, rehash=False):
+        """
+        Раскладка элементов в новые массивы емкости capacity по сохраненным
+        хешам с вытеснением Robin Hood, без вызова insert
+        Сложность: O(n + capacity)
+        """
+        old_items = [(item, full_hash) for item, full_hash in zip(self.table, self.hashes)
+                     if full_hash is not None]
+        self.table = [None] * capacity
+        self.hashes = [None] * capacity
+        self.distances = [EMPTY] * capacity
+        self.capacity = capacity
+        self.tombstones = 0
+        for item, full_hash in old_items:
+            if rehash:
+                full_hash = self._full_hash(item[0])
+            self._place(full_hash % capacity, item, full_hash, 0)
+
+    def probe_lengths(self):
+        """Длина успешного поиска каждого элемента (расстояние + 1)"""
+        return [dist + 1 for dist in self.distances if dist != EMPTY]
+
+
+def _linear_probe_lengths(ht):
+    """Длины успешного поиска в HashTableOpenAddressing (без удалений)"""
+    lengths = []
+    for index, item in enumerate(ht.table):
+        if item is not None and item != ht.DELETED:
+            lengths.append((index - ht._hash(item[0])) % ht.capacity + 1)
+    return lengths
+
+
+def _miss_probe_length(ht, key):
+    """Сколько ячеек просматривает неудачный поиск key"""
+    index = ht._hash(key)
+    probes = 1
+    robin_hood = isinstance(ht, HashTableRobinHood)
+    while True:
+        if robin_hood:
+            if ht.distances[index] < probes - 1:
+                return probes
+        elif ht.table[index] is None:
+            return probes
+        index = (index + 1) % ht.capacity
+        probes += 1
+
+
+def compare_probe_lengths(capacity=2 ** 16, load_factors=(0.5, 0.6, 0.7, 0.8, 0.9, 0.95),
+                          misses=10_000):
+    """
+    Линейное пробирование против Robin Hood при фиксированной емкости
+    Средняя и максимальная длина успешного поиска, средняя длина
+    неудачного поиска и скорость операций
+    """
+    print(f"ЛИНЕЙНОЕ ПРОБИРОВАНИЕ vs ROBIN HOOD (емкость {capacity})")
+    print("=" * 78)
+    print(f"{'α':>5} {'Таблица':<14}{'Средн.':>8}{'Макс.':>7}{'Промах':>8}"
+          f"{'Вставка':>13}{'Поиск':>12}{'Промах':>12}")
+    print(f"{'':>5} {'':<14}{'пробы':>8}{'пробы':>7}{'пробы':>8}{'тыс. оп/с':>13}"
+          f"{'тыс. оп/с':>12}{'тыс. оп/с':>12}")
+
+    rng = random.Random(7)
+    for load in load_factors:
+        count = int(capacity * load)
+        keys = [f"user_{rng.getrandbits(48)}" for _ in range(count)]
+        absent = [f"absent_{i}" for i in range(misses)]
+
+        for name, table_class in (("линейное", HashTableOpenAddressing),
+                                  ("Robin Hood", HashTableRobinHood)):
+            # Без роста и уменьшения: заполнение ровно до α
+            ht = table_class(capacity=capacity, max_load_factor=None, min_load_factor=None,
+                             max_probe_length=None, verbose=False)
+
+            start = time.perf_counter()
+            for key in keys:
+                ht.insert(key, key)
+            insert_rate = count / (time.perf_counter() - start)
+
+            start = time.perf_counter()
+            for key in keys:
+                ht.search(key)
+            search_rate = count / (time.perf_counter() - start)
+
+            start = time.perf_counter()
+            for key in absent:
+                ht.search(key)
+            miss_rate = misses / (time.perf_counter() - start)
+
+            if table_class is HashTableRobinHood:
+                lengths = ht.probe_lengths()
+            else:
+                lengths = _linear_probe_lengths(ht)
+            miss_mean = sum(_miss_probe_length(ht, key) for key in absent) / misses
+
+            print(f"{load:>5.2f} {name:<14}{sum(lengths) / len(lengths):>8.2f}"
+                  f"{max(lengths):>7}{miss_mean:>8.2f}{insert_rate / 1e3:>13.1f}"
+                  f"{search_rate / 1e3:>12.1f}{miss_rate / 1e3:>12.1f}")
+
+
+def test_robin_hood():
+    """Тестирование Robin Hood"""
+    print("🧪 ТЕСТИРОВАНИЕ ROBIN HOOD")
+    print("=" * 50)
+
+    ht = HashTableRobinHood(capacity=8)
+    test_data = [("apple", 10), ("banana", 20), ("orange", 30), ("grape", 40),
+                 ("kiwi", 50), ("melon", 60)]
+    for key, value in test_data:
+        ht.insert(key, value)
+    ht.display()
+    print(f"Расстояния: {ht.distances}")
+
+    print("\nУДАЛЕНИЕ orange (сдвиг назад):")
+    ht.delete("orange")
+    print(f"Расстояния: {ht.distances}")
+    for key, value in test_data:
+        expected = None if key == "orange" else value
+        assert ht.search(key) == expected, key
+    print("Поиск после удаления работает правильно")
+
+
+if __name__ == "__main__":
+    test_robin_hood()
+    print()
+    compare_probe_lengths()
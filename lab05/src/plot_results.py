@@ -1,6 +1,7 @@
 import time
 import matplotlib.pyplot as plt
 from hash_table_chaining import HashTableChaining
+from hash_functions import HASH_FUNCTIONS, INT_HASH_FUNCTIONS, chain_length_stats
 
 def plot_load_factor_vs_time():
     """График зависимости времени от коэффициента заполнения"""
@@ -17,8 +18,9 @@ def plot_load_factor_vs_time():
     for load in load_factors:
         print(f"\nТестируем коэффициент: {load}")
         
-        # Создаем новую таблицу для каждого теста
-        ht = HashTableChaining(capacity=table_size)
+        # Создаем новую таблицу для каждого теста (без изменения размера,
+        # иначе коэффициент заполнения не дойдет до заданного)
+        ht = HashTableChaining(capacity=table_size, max_load_factor=None, min_load_factor=None)
         elements_count = int(table_size * load)
         
         # Вставка
@@ -90,57 +92,68 @@ def plot_load_factor_vs_time():
     print("\n✅ График сохранен как 'hash_table_performance.png'")
     plt.show()
 
-def plot_collision_distribution():
-    """Гистограмма распределения длины цепочек"""
+def realistic_keys(count):
+    """
+    Ключи, похожие на реальные: строковые (email, пути URL, key_N)
+    и целые (выровненные адреса/идентификаторы с шагом 1024)
+    """
+    patterns = ["user{}@example.com", "/api/v1/items/{}", "key_{}"]
+    string_keys = [patterns[i % 3].format(i) for i in range(count)]
+    int_keys = [i << 10 for i in range(count)]
+    return string_keys, int_keys
+
+def plot_collision_distribution(elements_count=10 ** 6, capacity=None):
+    """
+    Распределение длины цепочек для каждой хеш-функции
+    Гистограмма длин, максимальная цепочка и хи-квадрат равномерности
+    (capacity по умолчанию = elements_count, т.е. α = 1)
+    """
     print("\n📊 ГИСТОГРАММА РАСПРЕДЕЛЕНИЯ ЦЕПОЧЕК")
     print("=" * 60)
     
-    # Создаем таблицу
-    ht = HashTableChaining(capacity=20)
-    
-    # Вставляем элементы
-    elements_count = 100
-    for i in range(elements_count):
-        ht.insert(f"key_{i}", f"value_{i}")
-    
-    # Считаем длину цепочек
-    chain_lengths = []
-    for i in range(ht.capacity):
-        length = 0
-        current = ht.table[i]
-        while current:
-            length += 1
-            current = current.next
-        chain_lengths.append(length)
-    
-    # Строим гистограмму
-    plt.figure(figsize=(10, 6))
-    
-    plt.hist(chain_lengths, bins=range(0, max(chain_lengths) + 2), 
-             alpha=0.7, color='blue', edgecolor='black')
-    
-    plt.xlabel('Длина цепочки', fontsize=12)
-    plt.ylabel('Количество ячеек', fontsize=12)
-    plt.title(f'Распределение длины цепочек (n={elements_count}, m={ht.capacity})', fontsize=14)
-    plt.grid(True, alpha=0.3, axis='y')
-    
-    # Добавляем среднее значение
-    avg_length = sum(chain_lengths) / len(chain_lengths)
-    plt.axvline(avg_length, color='red', linestyle='--', 
-                label=f'Средняя: {avg_length:.2f}')
-    plt.legend()
+    capacity = capacity or elements_count
+    string_keys, int_keys = realistic_keys(elements_count)
     
+    results = {}
+    for name, hash_func in HASH_FUNCTIONS.items():
+        keys = int_keys if name in INT_HASH_FUNCTIONS else string_keys
+        start = time.time()
+        results[name] = chain_length_stats(keys, hash_func, capacity)
+        results[name]["time"] = time.time() - start
+    
+    # Строим гистограммы (по одной на хеш-функцию)
+    plt.figure(figsize=(4 * len(results), 5))
+    
+    for position, (name, stats) in enumerate(results.items(), 1):
+        plt.subplot(1, len(results), position)
+        lengths = list(stats["histogram"])
+        counts = list(stats["histogram"].values())
+        plt.bar(lengths, counts, alpha=0.7, color='blue', edgecolor='black')
+        plt.yscale('log')
+        plt.xlabel('Длина цепочки', fontsize=12)
+        plt.ylabel('Количество ячеек', fontsize=12)
+        plt.title(f'{name}\nmax={stats["max_chain"]}, '
+                  f'χ²/(m-1)={stats["chi_square_ratio"]:.2f}', fontsize=12)
+        plt.grid(True, alpha=0.3, axis='y')
+    
+    plt.suptitle(f'Распределение длины цепочек (n={elements_count}, m={capacity})', fontsize=14)
+    plt.tight_layout()
     plt.savefig('collision_distribution.png', dpi=300, bbox_inches='tight')
     print("✅ Гистограмма сохранена как 'collision_distribution.png'")
     
     # Выводим статистику
-    print(f"\nСтатистика цепочек:")
-    print(f"Всего ячеек: {ht.capacity}")
-    print(f"Всего элементов: {ht.size}")
-    print(f"Коэффициент заполнения: {ht.get_load_factor():.2f}")
-    print(f"Средняя длина цепочки: {avg_length:.2f}")
-    print(f"Максимальная длина: {max(chain_lengths)}")
-    print(f"Пустых ячеек: {chain_lengths.count(0)}")
+    print(f"\nСтатистика цепочек (n={elements_count}, m={capacity}):")
+    print(f"{'Хеш-функция':<16}{'Макс.':>8}{'Пустых':>10}{'χ²/(m-1)':>12}{'Время, сек':>12}")
+    for name, stats in results.items():
+        print(f"{name:<16}{stats['max_chain']:>8}{stats['empty']:>10}"
+              f"{stats['chi_square_ratio']:>12.2f}{stats['time']:>12.2f}")
+    print("χ²/(m-1) около 1 - распределение близко к равномерному")
+    
+    # Гистограммы длин текстом: длина цепочки -> число ячеек
+    for name, stats in results.items():
+        histogram = ", ".join(f"{length}: {count}" for length, count
+                              in list(stats["histogram"].items())[:8])
+        print(f"  {name}: {histogram}")
     
     plt.show()
 